@@ -0,0 +1 @@
+"""Performance scripts for tsdeque. Not part of the installed package."""
@@ -0,0 +1,75 @@
+"""
+Benchmark suite entry point.
+
+Usage:
+    python -m benchmarks run [-o results.json] [--items N] [--repeat R] [--filter TEXT]
+    python -m benchmarks compare baseline.json current.json [--throughput 0.10] [--latency 0.25]
+
+`compare` exits with status 1 when a regression is found, so it can gate upgrades in CI.
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.adapters import ADAPTERS
+from benchmarks.compare import compare
+from benchmarks.suite import run_suite
+
+
+def _run(args: argparse.Namespace) -> int:
+    document = run_suite(
+        items=args.items,
+        repeat=args.repeat,
+        name_filter=args.filter,
+        adapters=args.adapter or None,
+        progress=print,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=2, sort_keys=True)
+        print(f"Results written to {args.output}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+
+    regressions = compare(baseline, current, args.throughput, args.latency)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("No regressions found.")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmark suite")
+    run.add_argument("-o", "--output", help="write results to this JSON file")
+    run.add_argument("--items", type=int, default=50_000)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--filter", default="", help="only run workloads containing this text")
+    run.add_argument(
+        "--adapter", action="append", choices=sorted(ADAPTERS), help="repeatable"
+    )
+    run.set_defaults(handler=_run)
+
+    cmp = commands.add_parser("compare", help="compare two result files")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--throughput", type=float, default=0.10, help="allowed drop")
+    cmp.add_argument("--latency", type=float, default=0.25, help="allowed p99 growth")
+    cmp.set_defaults(handler=_compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
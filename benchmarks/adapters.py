@@ -0,0 +1,142 @@
+"""
+Uniform wrappers around the queues compared by the benchmark suite.
+
+Every adapter exposes `put(item, timeout, left)`, `get(timeout, left)`,
+`task_done()` and `join()`; `get` returns `EMPTY` instead of raising when
+the timeout expires. Capability flags tell the suite which workloads an
+adapter can run.
+"""
+
+import queue
+from collections import deque
+from threading import Condition, Lock
+from typing import Any, Callable, Deque, Dict, Optional
+
+from tsdeque import ThreadSafeDeque
+
+EMPTY = object()
+
+
+class Adapter:
+    """Base adapter. Subclasses set the capability flags they support."""
+
+    name = ""
+    bounded = True
+    left = True
+    tasks = True
+
+    def put(self, item: Any, timeout: Optional[float] = None, left: bool = False) -> None:
+        raise NotImplementedError
+
+    def get(self, timeout: Optional[float] = None, left: bool = True) -> Any:
+        raise NotImplementedError
+
+    def task_done(self) -> None:
+        raise NotImplementedError
+
+    def join(self) -> None:
+        raise NotImplementedError
+
+
+class ThreadSafeDequeAdapter(Adapter):
+    name = "ThreadSafeDeque"
+
+    def __init__(self, maxsize: int) -> None:
+        self._dq: ThreadSafeDeque[Any] = ThreadSafeDeque(maxsize)
+
+    def put(self, item: Any, timeout: Optional[float] = None, left: bool = False) -> None:
+        if left:
+            self._dq.putleft(item, timeout)
+        else:
+            self._dq.put(item, timeout)
+
+    def get(self, timeout: Optional[float] = None, left: bool = True) -> Any:
+        try:
+            return self._dq.getleft(timeout) if left else self._dq.get(timeout)
+        except TimeoutError:
+            return EMPTY
+
+    def task_done(self) -> None:
+        self._dq.task_done()
+
+    def join(self) -> None:
+        self._dq.join()
+
+
+class QueueAdapter(Adapter):
+    name = "queue.Queue"
+    left = False
+
+    def __init__(self, maxsize: int) -> None:
+        self._q: "queue.Queue[Any]" = queue.Queue(maxsize)
+
+    def put(self, item: Any, timeout: Optional[float] = None, left: bool = False) -> None:
+        self._q.put(item, timeout=timeout)
+
+    def get(self, timeout: Optional[float] = None, left: bool = True) -> Any:
+        try:
+            return self._q.get(timeout=timeout)
+        except queue.Empty:
+            return EMPTY
+
+    def task_done(self) -> None:
+        self._q.task_done()
+
+    def join(self) -> None:
+        self._q.join()
+
+
+class SimpleQueueAdapter(Adapter):
+    name = "queue.SimpleQueue"
+    bounded = False
+    left = False
+    tasks = False
+
+    def __init__(self, maxsize: int) -> None:
+        self._q: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+
+    def put(self, item: Any, timeout: Optional[float] = None, left: bool = False) -> None:
+        self._q.put(item)
+
+    def get(self, timeout: Optional[float] = None, left: bool = True) -> Any:
+        try:
+            return self._q.get(timeout=timeout)
+        except queue.Empty:
+            return EMPTY
+
+
+class LockedDequeAdapter(Adapter):
+    """`collections.deque` guarded by a single `Lock` with a `Condition` for blocking gets."""
+
+    name = "deque+Lock"
+    bounded = False
+    tasks = False
+
+    def __init__(self, maxsize: int) -> None:
+        self._items: Deque[Any] = deque()
+        self._not_empty = Condition(Lock())
+
+    def put(self, item: Any, timeout: Optional[float] = None, left: bool = False) -> None:
+        with self._not_empty:
+            if left:
+                self._items.appendleft(item)
+            else:
+                self._items.append(item)
+            self._not_empty.notify()
+
+    def get(self, timeout: Optional[float] = None, left: bool = True) -> Any:
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._items, timeout):
+                return EMPTY
+            return self._items.popleft() if left else self._items.pop()
+
+
+ADAPTERS: Dict[str, Callable[[int], Adapter]] = {
+    adapter.name: adapter
+    for adapter in (
+        ThreadSafeDequeAdapter,
+        QueueAdapter,
+        SimpleQueueAdapter,
+        LockedDequeAdapter,
+    )
+}
@@ -0,0 +1,103 @@
+"""
+Thread-to-asyncio bridging benchmark: throughput of thread producers feeding
+coroutine consumers, and wake-up latency of a parked coroutine. Compares
+AsyncThreadSafeDeque with `run_in_executor(None, deque.get)`.
+
+Run with:
+    python -m benchmarks.async_bridge [--items N] [--producers P] [--consumers C]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from threading import Thread
+from typing import Awaitable, Callable, List
+
+from tsdeque import AsyncThreadSafeDeque, ThreadSafeDeque
+
+_STOP = object()
+
+
+def _executor_get(deque: ThreadSafeDeque) -> Callable[[], Awaitable[object]]:
+    async def get() -> object:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, deque.getleft)
+
+    return get
+
+
+def _native_get(deque: ThreadSafeDeque) -> Callable[[], Awaitable[object]]:
+    return AsyncThreadSafeDeque(deque).agetleft
+
+
+async def _throughput(
+    make_get: Callable, items: int, producers: int, consumers: int
+) -> float:
+    deque: ThreadSafeDeque[object] = ThreadSafeDeque()
+    get = make_get(deque)
+    per_producer = items // producers
+
+    def producent() -> None:
+        for i in range(per_producer):
+            deque.put(i)
+
+    async def consument() -> None:
+        while await get() is not _STOP:
+            pass
+
+    start = time.perf_counter()
+    tasks = [asyncio.ensure_future(consument()) for _ in range(consumers)]
+    threads = [Thread(target=producent) for _ in range(producers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for _ in range(consumers):
+        deque.put(_STOP)
+    await asyncio.gather(*tasks)
+    return per_producer * producers / (time.perf_counter() - start)
+
+
+async def _latency(make_get: Callable, samples: int) -> List[float]:
+    deque: ThreadSafeDeque[float] = ThreadSafeDeque()
+    get = make_get(deque)
+    latencies = []
+
+    def producent() -> None:
+        for _ in range(samples):
+            time.sleep(0.001)
+            deque.put(time.perf_counter())
+
+    thread = Thread(target=producent)
+    thread.start()
+    for _ in range(samples):
+        sent = await get()
+        latencies.append(time.perf_counter() - sent)
+    thread.join()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--consumers", type=int, default=64)
+    parser.add_argument("--samples", type=int, default=500)
+    args = parser.parse_args()
+
+    for name, make_get in (("native", _native_get), ("run_in_executor", _executor_get)):
+        rate = asyncio.run(
+            _throughput(make_get, args.items, args.producers, args.consumers)
+        )
+        latencies = sorted(asyncio.run(_latency(make_get, args.samples)))
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(
+            f"{name:<16} {rate:10.0f} items/s"
+            f"  wake-up median {statistics.median(latencies) * 1e6:7.1f} us"
+            f"  p99 {p99 * 1e6:7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
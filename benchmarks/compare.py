@@ -0,0 +1,76 @@
+"""
+Comparison of two benchmark result files produced by ``python -m benchmarks run``.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+
+@dataclass
+class Regression:
+    """
+    A measurement that got worse than the allowed threshold.
+
+    Attributes:
+        key (str): Result key, ``"<workload>/<adapter>"``.
+        metric (str): Name of the regressed metric.
+        baseline (float): Value in the baseline run.
+        current (float): Value in the current run.
+        change (float): Relative change; negative for throughput drops.
+    """
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key}: {self.metric} {self.baseline:.0f} -> {self.current:.0f}"
+            f" ({self.change * 100:+.1f}%)"
+        )
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    throughput_threshold: float = 0.10,
+    latency_threshold: float = 0.25,
+) -> List[Regression]:
+    """
+    Flags results whose throughput dropped or p99 latency grew beyond the thresholds.
+
+    Only keys present in both documents are compared.
+
+    Args:
+        baseline (Dict[str, Any]): Result document of the reference run.
+        current (Dict[str, Any]): Result document of the run being checked.
+        throughput_threshold (float): Allowed relative throughput drop.
+        latency_threshold (float): Allowed relative p99 latency increase.
+
+    Returns:
+        List[Regression]: Detected regressions, in key order.
+    """
+    regressions = []
+    base_results = baseline["results"]
+    current_results = current["results"]
+
+    for key in sorted(base_results.keys() & current_results.keys()):
+        base, cur = base_results[key], current_results[key]
+
+        if base["ops_per_sec"] > 0:
+            change = cur["ops_per_sec"] / base["ops_per_sec"] - 1
+            if change < -throughput_threshold:
+                regressions.append(
+                    Regression(key, "ops_per_sec", base["ops_per_sec"], cur["ops_per_sec"], change)
+                )
+
+        if base["p99_ns"] > 0:
+            change = cur["p99_ns"] / base["p99_ns"] - 1
+            if change > latency_threshold:
+                regressions.append(
+                    Regression(key, "p99_ns", base["p99_ns"], cur["p99_ns"], change)
+                )
+
+    return regressions
@@ -0,0 +1,63 @@
+"""
+Measures CPU burned by consumers that are blocked on an empty deque while
+tasks are still outstanding (items were taken but `task_done` was not called).
+
+Run with:
+    python -m benchmarks.idle_consumers [--consumers N] [--duration SECONDS]
+"""
+
+import argparse
+import time
+from threading import Thread
+
+from tsdeque import ThreadSafeDeque
+
+
+def measure(consumers: int, duration: float) -> float:
+    """Returns process CPU seconds spent while `consumers` threads sit idle.
+
+    Args:
+        consumers (int): Number of idle consumer threads.
+        duration (float): How long the consumers stay blocked, in seconds.
+
+    Returns:
+        float: CPU time consumed by the whole process during the idle window.
+    """
+    deque: ThreadSafeDeque[object] = ThreadSafeDeque()
+
+    # Leave a task outstanding so that the task counter never reaches zero.
+    deque.put(object())
+    deque.get()
+
+    def consumer() -> None:
+        try:
+            deque.get(timeout=duration)
+        except TimeoutError:
+            pass
+
+    threads = [Thread(target=consumer) for _ in range(consumers)]
+
+    cpu_start = time.process_time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.process_time() - cpu_start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--consumers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=1.0)
+    args = parser.parse_args()
+
+    cpu = measure(args.consumers, args.duration)
+    wall = args.duration
+    print(
+        f"{args.consumers} idle consumers for {wall:.2f}s: "
+        f"{cpu:.4f}s CPU ({cpu / wall * 100:.1f}% of one core)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Contention benchmark for consumer-side prefetching: 16 consumer threads drain
+a deque fed by one batching producer, either with plain `getleft` calls or
+through `consumer(prefetch=N)` handles.
+
+    python -m benchmarks.prefetch_contention [--items N] [--consumers C]
+"""
+
+import argparse
+import sys
+import time
+from threading import Thread
+
+from tsdeque import ThreadSafeDeque
+from tsdeque.exceptions import DequeShutDown
+
+PREFETCH = (8, 32, 128)
+
+
+def measure(consumers: int, items: int, prefetch: int) -> float:
+    """Moves `items` items from one producer to `consumers` consumer threads.
+
+    Args:
+        consumers (int): Number of consumer threads.
+        items (int): Total number of items.
+        prefetch (int): Batch size of the consumer handles; 0 uses plain gets.
+
+    Returns:
+        float: Throughput in items per second.
+    """
+    deque: ThreadSafeDeque[int] = ThreadSafeDeque()
+
+    def producent() -> None:
+        for start in range(0, items, 1000):
+            deque.put_many(range(start, min(start + 1000, items)))
+        deque.close()
+
+    def consument() -> None:
+        while True:
+            try:
+                deque.getleft()
+            except DequeShutDown:
+                return
+            deque.task_done()
+
+    def prefetching_consument() -> None:
+        with deque.consumer(prefetch=prefetch, left=True) as consumer:
+            while True:
+                try:
+                    consumer.get()
+                except DequeShutDown:
+                    return
+                consumer.task_done()
+
+    target = prefetching_consument if prefetch else consument
+    threads = [Thread(target=target) for _ in range(consumers)]
+    threads.append(Thread(target=producent))
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return items / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=500_000)
+    parser.add_argument("--consumers", type=int, default=16)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{args.consumers} consumers, {args.items} items")
+    baseline = measure(args.consumers, args.items, 0)
+    print(f"{'getleft':>14}  {baseline:>12.0f} ops/s")
+    for prefetch in PREFETCH:
+        rate = measure(args.consumers, args.items, prefetch)
+        print(f"{f'prefetch={prefetch}':>14}  {rate:>12.0f} ops/s  x{rate / baseline:.1f}")
+
+
+if __name__ == "__main__":
+    main()
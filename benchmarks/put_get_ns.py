@@ -0,0 +1,101 @@
+"""
+Single-threaded put/get micro-benchmark reporting nanoseconds per operation
+for ThreadSafeDeque, the original Devent/Counter implementation and
+`queue.Queue`.
+
+Run with:
+    python -m benchmarks.put_get_ns [--ops N] [--repeat R]
+"""
+
+import argparse
+import queue
+import time
+from typing import Callable, Dict, Tuple
+
+from tsdeque import ThreadSafeDeque
+from benchmarks.legacy import LegacyThreadSafeDeque
+
+
+def _tsdeque_ops(maxsize: int) -> Tuple[Callable, Callable, Callable]:
+    deque: ThreadSafeDeque[int] = ThreadSafeDeque(maxsize)
+    return deque.put, deque.getleft, deque.task_done
+
+
+def _legacy_ops(maxsize: int) -> Tuple[Callable, Callable, Callable]:
+    deque: LegacyThreadSafeDeque[int] = LegacyThreadSafeDeque(maxsize)
+    return deque.put, deque.getleft, deque.task_done
+
+
+def _queue_ops(maxsize: int) -> Tuple[Callable, Callable, Callable]:
+    q: "queue.Queue[int]" = queue.Queue(maxsize)
+    return q.put, q.get, q.task_done
+
+
+IMPLEMENTATIONS: Dict[str, Callable[[int], Tuple[Callable, Callable, Callable]]] = {
+    "ThreadSafeDeque": _tsdeque_ops,
+    "legacy ThreadSafeDeque": _legacy_ops,
+    "queue.Queue": _queue_ops,
+}
+
+
+def measure(factory: Callable, maxsize: int, ops: int, repeat: int) -> Dict[str, float]:
+    """Measures the best-of-`repeat` cost of put, get and task_done.
+
+    Args:
+        factory (Callable): Returns bound (put, get, task_done) callables.
+        maxsize (int): Capacity passed to the queue constructor.
+        ops (int): Number of items pushed through per repetition.
+        repeat (int): Number of repetitions; the fastest one is reported.
+
+    Returns:
+        Dict[str, float]: Nanoseconds per call for each operation.
+    """
+    best = {"put": float("inf"), "get": float("inf"), "task_done": float("inf")}
+    batch = min(ops, maxsize) if maxsize > 0 else ops
+
+    for _ in range(repeat):
+        put, get, task_done = factory(maxsize)
+        spent = {"put": 0, "get": 0, "task_done": 0}
+        done = 0
+        while done < ops:
+            start = time.perf_counter_ns()
+            for i in range(batch):
+                put(i)
+            spent["put"] += time.perf_counter_ns() - start
+
+            start = time.perf_counter_ns()
+            for _ in range(batch):
+                get()
+            spent["get"] += time.perf_counter_ns() - start
+
+            start = time.perf_counter_ns()
+            for _ in range(batch):
+                task_done()
+            spent["task_done"] += time.perf_counter_ns() - start
+            done += batch
+
+        for name, total in spent.items():
+            best[name] = min(best[name], total / done)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for maxsize in (0, 1024):
+        kind = "unbounded" if maxsize == 0 else f"maxsize={maxsize}"
+        print(f"{kind}:")
+        for name, factory in IMPLEMENTATIONS.items():
+            result = measure(factory, maxsize, args.ops, args.repeat)
+            print(
+                f"  {name:<24} put {result['put']:7.0f} ns"
+                f"  get {result['get']:7.0f} ns"
+                f"  task_done {result['task_done']:7.0f} ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
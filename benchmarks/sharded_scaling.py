@@ -0,0 +1,76 @@
+"""
+Multi-producer/multi-consumer scaling benchmark comparing ThreadSafeDeque with
+ShardedThreadSafeDeque for 1 to 32 producer/consumer pairs.
+
+Run it with both a regular and a free-threaded interpreter to compare them:
+    python -m benchmarks.sharded_scaling
+    python3.13t -X gil=0 -m benchmarks.sharded_scaling
+"""
+
+import argparse
+import sys
+import time
+from threading import Thread
+from typing import Callable, Dict
+
+from tsdeque import ThreadSafeDeque
+from tsdeque.sharded import ShardedThreadSafeDeque
+
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32)
+
+IMPLEMENTATIONS: Dict[str, Callable[[], object]] = {
+    "ThreadSafeDeque": ThreadSafeDeque,
+    "Sharded (relaxed)": ShardedThreadSafeDeque,
+    "Sharded (strict)": lambda: ShardedThreadSafeDeque(relaxed=False),
+}
+
+
+def measure(factory: Callable[[], object], pairs: int, items: int) -> float:
+    """Moves `items` items through the deque with `pairs` producers and consumers.
+
+    Args:
+        factory (Callable[[], object]): Creates an empty deque.
+        pairs (int): Number of producer threads and of consumer threads.
+        items (int): Total number of items.
+
+    Returns:
+        float: Throughput in items per second.
+    """
+    deque = factory()
+    per_thread = items // pairs
+
+    def producent() -> None:
+        for i in range(per_thread):
+            deque.put(i)  # type: ignore[attr-defined]
+
+    def consument() -> None:
+        for _ in range(per_thread):
+            deque.getleft()  # type: ignore[attr-defined]
+            deque.task_done()  # type: ignore[attr-defined]
+
+    threads = [Thread(target=producent) for _ in range(pairs)]
+    threads += [Thread(target=consument) for _ in range(pairs)]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return per_thread * pairs / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'pairs':>5}  " + "  ".join(f"{name:>18}" for name in IMPLEMENTATIONS))
+    for pairs in THREAD_COUNTS:
+        rates = [measure(factory, pairs, args.items) for factory in IMPLEMENTATIONS.values()]
+        print(f"{pairs:>5}  " + "  ".join(f"{rate:>12.0f} ops/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Cross-process throughput benchmark: a producer process sends fixed-size
+payloads to the parent. Compares SharedMemoryDeque (copying `get` and
+zero-copy `get_view`) with `multiprocessing.Queue`.
+
+Run with:
+    python -m benchmarks.shm_vs_mpqueue [--items N] [--size BYTES]
+"""
+
+import argparse
+import multiprocessing
+import time
+from typing import Any, Callable
+
+from tsdeque import SharedMemoryDeque
+
+
+def _produce(queue: Any, items: int, size: int) -> None:
+    payload = b"x" * size
+    for _ in range(items):
+        queue.put(payload)
+
+
+def _measure(queue: Any, items: int, size: int, consume: Callable[[], None]) -> float:
+    producer = multiprocessing.Process(target=_produce, args=(queue, items, size))
+    start = time.perf_counter()
+    producer.start()
+    for _ in range(items):
+        consume()
+    elapsed = time.perf_counter() - start
+    producer.join()
+    return items / elapsed
+
+
+def _shm_copy(items: int, size: int) -> float:
+    with SharedMemoryDeque(capacity=256, slot_size=size) as dq:
+        return _measure(dq, items, size, dq.getleft)
+
+
+def _shm_view(items: int, size: int) -> float:
+    with SharedMemoryDeque(capacity=256, slot_size=size) as dq:
+
+        def consume() -> None:
+            with dq.getleft_view() as view:
+                view[0]
+
+        return _measure(dq, items, size, consume)
+
+
+def _mp_queue(items: int, size: int) -> float:
+    queue: Any = multiprocessing.Queue(256)
+    return _measure(queue, items, size, queue.get)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--size", type=int, action="append")
+    args = parser.parse_args()
+
+    for size in args.size or [64, 4096, 65536]:
+        print(f"payload {size} bytes:")
+        for name, run in (
+            ("SharedMemoryDeque.get", _shm_copy),
+            ("SharedMemoryDeque.get_view", _shm_view),
+            ("multiprocessing.Queue", _mp_queue),
+        ):
+            rate = run(args.items, size)
+            print(f"  {name:<28} {rate:10.0f} items/s  {rate * size / 2**20:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Workload definitions and runner of the benchmark suite.
+
+Every workload pushes timestamped items from producer threads to consumer
+threads and reports throughput and end-to-end latency percentiles.
+"""
+
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from threading import Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from benchmarks.adapters import ADAPTERS, EMPTY, Adapter
+from tsdeque.stats import Histogram
+
+
+@dataclass(frozen=True)
+class Workload:
+    """
+    A producer/consumer scenario.
+
+    Attributes:
+        name (str): Unique workload name, used as part of the result key.
+        producers (int): Number of producer threads.
+        consumers (int): Number of consumer threads.
+        maxsize (int): Queue capacity; 0 for unbounded.
+        left (bool): If True, producers use the left end and consumers the right
+            end; otherwise producers put right and consumers take left.
+        timeout (Optional[float]): Timeout passed to every put/get call.
+        join_every (int): If positive, consumers call `task_done` for every item
+            and producers call `join` after every `join_every` items.
+    """
+
+    name: str
+    producers: int
+    consumers: int
+    maxsize: int = 0
+    left: bool = False
+    timeout: Optional[float] = None
+    join_every: int = 0
+
+    def supported_by(self, adapter: Adapter) -> bool:
+        """Checks whether an adapter offers every feature the workload needs."""
+        if self.maxsize and not adapter.bounded:
+            return False
+        if self.left and not adapter.left:
+            return False
+        if self.join_every and not adapter.tasks:
+            return False
+        return True
+
+
+def _build_workloads() -> List[Workload]:
+    topologies = {"spsc": (1, 1), "mpsc": (4, 1), "spmc": (1, 4), "mpmc": (4, 4)}
+    workloads = []
+    for topology, (producers, consumers) in topologies.items():
+        for maxsize in (0, 64):
+            for left in (False, True):
+                name = "-".join(
+                    (
+                        topology,
+                        "bounded" if maxsize else "unbounded",
+                        "left" if left else "right",
+                    )
+                )
+                workloads.append(Workload(name, producers, consumers, maxsize, left))
+    workloads += [
+        Workload("spsc-timeout", 1, 1, maxsize=64, timeout=1.0),
+        Workload("mpmc-timeout", 4, 4, maxsize=64, timeout=1.0),
+        Workload("spmc-join-churn", 1, 4, join_every=64),
+        Workload("mpmc-join-churn", 4, 4, maxsize=64, join_every=64),
+    ]
+    return workloads
+
+
+WORKLOADS: List[Workload] = _build_workloads()
+
+
+def run_once(workload: Workload, adapter: Adapter, items: int) -> Dict[str, float]:
+    """
+    Runs a workload once.
+
+    Args:
+        workload (Workload): The scenario to run.
+        adapter (Adapter): A fresh queue adapter created for this run.
+        items (int): Approximate total number of items; rounded down to a
+            multiple of the number of producers.
+
+    Returns:
+        Dict[str, float]: Throughput and latency figures of the run.
+    """
+    per_producer = items // workload.producers
+    total = per_producer * workload.producers
+    shares = [total // workload.consumers] * workload.consumers
+    shares[0] += total % workload.consumers
+
+    histograms = [Histogram() for _ in range(workload.consumers)]
+    timeout, put_left, join_every = workload.timeout, workload.left, workload.join_every
+
+    def producent() -> None:
+        for i in range(1, per_producer + 1):
+            adapter.put(time.perf_counter_ns(), timeout, put_left)
+            if join_every and i % join_every == 0:
+                adapter.join()
+
+    def consument(share: int, histogram: Histogram) -> None:
+        received = 0
+        while received < share:
+            item = adapter.get(timeout, not put_left)
+            if item is EMPTY:
+                continue
+            histogram.record(time.perf_counter_ns() - item)
+            if join_every:
+                adapter.task_done()
+            received += 1
+
+    threads = [Thread(target=consument, args=args) for args in zip(shares, histograms)]
+    threads += [Thread(target=producent) for _ in range(workload.producers)]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latency = Histogram()
+    for histogram in histograms:
+        latency.merge(histogram)
+    return {
+        "ops_per_sec": total / elapsed,
+        "p50_ns": latency.percentile(50),
+        "p99_ns": latency.percentile(99),
+        "max_ns": latency.max or 0,
+    }
+
+
+def run_suite(
+    items: int,
+    repeat: int,
+    name_filter: str = "",
+    adapters: Optional[Iterable[str]] = None,
+    progress: Callable[[str], Any] = lambda line: None,
+) -> Dict[str, Any]:
+    """
+    Runs every matching workload against every adapter that supports it.
+
+    Args:
+        items (int): Approximate number of items per run.
+        repeat (int): Runs per workload and adapter; the run with the median
+            throughput is reported.
+        name_filter (str): Only workloads whose name contains this string are run.
+        adapters (Optional[Iterable[str]]): Adapter names to run; all by default.
+        progress (Callable[[str], Any]): Receives a line per finished measurement.
+
+    Returns:
+        Dict[str, Any]: JSON-serialisable document with run metadata and results
+            keyed by ``"<workload>/<adapter>"``.
+    """
+    selected = list(adapters) if adapters is not None else list(ADAPTERS)
+    results: Dict[str, Dict[str, float]] = {}
+
+    for workload in WORKLOADS:
+        if name_filter not in workload.name:
+            continue
+        for adapter_name in selected:
+            factory = ADAPTERS[adapter_name]
+            if not workload.supported_by(factory(workload.maxsize)):
+                continue
+            runs = sorted(
+                (run_once(workload, factory(workload.maxsize), items) for _ in range(repeat)),
+                key=lambda run: run["ops_per_sec"],
+            )
+            key = f"{workload.name}/{adapter_name}"
+            results[key] = runs[len(runs) // 2]
+            progress(format_result(key, results[key]))
+
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "gil": getattr(sys, "_is_gil_enabled", lambda: True)(),
+            "items": items,
+            "repeat": repeat,
+            "created": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+
+
+def format_result(key: str, result: Dict[str, float]) -> str:
+    """Formats a single result as a table row."""
+    return (
+        f"{key:<50} {result['ops_per_sec']:>12.0f} ops/s"
+        f"  p50 {result['p50_ns'] / 1000:>9.1f} us"
+        f"  p99 {result['p99_ns'] / 1000:>9.1f} us"
+    )
@@ -0,0 +1,65 @@
+"""
+Bulk transfer and memory benchmark for numeric payloads: ThreadSafeDeque with
+boxed floats (`put_many`/`get_many`) versus TypedThreadSafeDeque
+(`put_array`/`get_array`).
+
+Run with:
+    python -m benchmarks.typed_bulk [--items N] [--batch B]
+"""
+
+import argparse
+import time
+import tracemalloc
+from array import array
+from typing import Any, Callable
+
+from tsdeque import ThreadSafeDeque, TypedThreadSafeDeque
+
+
+def _bytes_per_item(
+    make: Callable[[], Any], fill: Callable[[Any, array], None], items: int
+) -> float:
+    values = array("d", range(items))
+    tracemalloc.start()
+    dq = make()
+    fill(dq, values)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used / items
+
+
+def _transfer_rate(
+    put: Callable[[array], None], get: Callable[[int], Any], items: int, batch: int
+) -> float:
+    values = array("d", range(batch))
+    start = time.perf_counter()
+    for _ in range(items // batch):
+        put(values)
+        get(batch)
+    return items / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=4096)
+    args = parser.parse_args()
+
+    boxed: ThreadSafeDeque[float] = ThreadSafeDeque()
+    typed = TypedThreadSafeDeque("float64")
+
+    print("memory per stored item:")
+    size = _bytes_per_item(ThreadSafeDeque, lambda dq, v: dq.put_many(v), args.items)
+    print(f"  ThreadSafeDeque       {size:6.1f} bytes")
+    size = _bytes_per_item(TypedThreadSafeDeque, lambda dq, v: dq.put_array(v), args.items)
+    print(f"  TypedThreadSafeDeque  {size:6.1f} bytes")
+
+    print(f"bulk transfer, batches of {args.batch}:")
+    rate = _transfer_rate(boxed.put_many, boxed.getleft_many, args.items, args.batch)
+    print(f"  put_many/get_many     {rate / 1e6:8.1f} M items/s")
+    rate = _transfer_rate(typed.put_array, typed.getleft_array, args.items, args.batch)
+    print(f"  put_array/get_array   {rate / 1e6:8.1f} M items/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+import pytest
+from threading import Thread
+
+from tsdeque.aio import AsyncThreadSafeDeque
+from tsdeque.core import ThreadSafeDeque
+from tsdeque.exceptions import DequeShutDown
+
+
+@pytest.fixture(params=[lambda: ThreadSafeDeque(), lambda: ThreadSafeDeque(3)])
+def unlim_and_lim_deq(request) -> ThreadSafeDeque:
+    return request.param()
+
+
+def test_aput_and_aget(unlim_and_lim_deq: ThreadSafeDeque):
+    adeque = AsyncThreadSafeDeque(unlim_and_lim_deq)
+
+    async def scenario():
+        await adeque.aput(1)
+        await adeque.aputleft(0)
+        return [await adeque.agetleft(), await adeque.aget()]
+
+    assert asyncio.run(scenario()) == [0, 1]
+    assert adeque.tasks_count() == 2
+
+
+def test_aget_timeout(unlim_and_lim_deq: ThreadSafeDeque):
+    adeque = AsyncThreadSafeDeque(unlim_and_lim_deq)
+    timeout = 0.2
+
+    start_time = time.monotonic()
+    with pytest.raises(TimeoutError):
+        asyncio.run(adeque.aget(timeout=timeout))
+    elapsed_time = time.monotonic() - start_time
+
+    assert elapsed_time == pytest.approx(timeout, rel=0.2)
+
+
+def test_aput_timeout():
+    adeque = AsyncThreadSafeDeque(ThreadSafeDeque(1))
+    adeque.deque.put(object())
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(adeque.aput(object(), timeout=0.1))
+
+
+def test_aget_woken_by_thread_put(unlim_and_lim_deq: ThreadSafeDeque):
+    adeque = AsyncThreadSafeDeque(unlim_and_lim_deq)
+    item = object()
+
+    def producent():
+        for _ in range(3):
+            unlim_and_lim_deq.put(item)
+
+    async def scenario():
+        threads_before = threading.active_count()
+        getters = [asyncio.ensure_future(adeque.agetleft(timeout=1)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        # waiting coroutines must not occupy any threads
+        assert threading.active_count() == threads_before
+        assert not any(getter.done() for getter in getters)
+
+        producent_thread = Thread(target=producent)
+        producent_thread.start()
+        results = await asyncio.gather(*getters)
+        producent_thread.join()
+        return results
+
+    assert asyncio.run(scenario()) == [item, item, item]
+
+
+def test_aput_woken_by_thread_get():
+    deque = ThreadSafeDeque(1)
+    adeque = AsyncThreadSafeDeque(deque)
+    deque.put(0)
+
+    consumer = Thread(target=lambda: (time.sleep(0.05), deque.getleft()))
+    consumer.start()
+    asyncio.run(adeque.aput(1, timeout=1))
+    consumer.join()
+
+    assert deque.getleft() == 1
+
+
+def test_cancelled_getter_passes_wakeup_on():
+    adeque = AsyncThreadSafeDeque(ThreadSafeDeque())
+
+    async def scenario():
+        first = asyncio.ensure_future(adeque.aget())
+        second = asyncio.ensure_future(adeque.aget(timeout=1))
+        await asyncio.sleep(0)
+
+        adeque.deque.put(1)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_thread_getter_sees_async_put():
+    deque = ThreadSafeDeque()
+    adeque = AsyncThreadSafeDeque(deque)
+    results = []
+
+    consumer = Thread(target=lambda: results.append(deque.get(timeout=1)))
+    consumer.start()
+    time.sleep(0.02)
+    asyncio.run(adeque.aput(1))
+    consumer.join()
+
+    assert results == [1]
+
+
+def test_ajoin():
+    adeque = AsyncThreadSafeDeque(ThreadSafeDeque())
+
+    async def scenario():
+        await adeque.aput(1)
+        await adeque.aget()
+
+        start_time = time.monotonic()
+        await adeque.ajoin(timeout=0.1)
+        assert time.monotonic() - start_time == pytest.approx(0.1, rel=0.2)
+
+        joiner = asyncio.ensure_future(adeque.ajoin(timeout=1))
+        await asyncio.sleep(0.02)
+        assert not joiner.done()
+
+        Thread(target=adeque.task_done).start()
+        await asyncio.wait_for(joiner, 0.5)
+
+    asyncio.run(scenario())
+
+
+def test_aput_applies_overflow_policy():
+    adeque = AsyncThreadSafeDeque(ThreadSafeDeque(2, overflow="drop_oldest"))
+
+    async def scenario():
+        for i in range(5):
+            await adeque.aput(i, timeout=0.1)
+        return [await adeque.agetleft(), await adeque.agetleft()]
+
+    assert asyncio.run(scenario()) == [3, 4]
+    assert adeque.deque.dropped_count() == 3
+
+
+def test_aget_woken_by_scheduled_item():
+    dq: ThreadSafeDeque[str] = ThreadSafeDeque()
+    adeque = AsyncThreadSafeDeque(dq)
+    dq.put_after("due", 0.1)
+
+    async def scenario():
+        start = time.monotonic()
+        item = await adeque.aget(timeout=1)
+        return item, time.monotonic() - start
+
+    item, elapsed = asyncio.run(scenario())
+    assert item == "due"
+    assert elapsed == pytest.approx(0.1, abs=0.05)
+
+
+def test_shutdown_wakes_async_waiters():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    adeque = AsyncThreadSafeDeque(dq)
+
+    async def scenario():
+        getter = asyncio.ensure_future(adeque.aget())
+        await asyncio.sleep(0.05)
+        threading.Timer(0.05, dq.shutdown).start()
+        with pytest.raises(DequeShutDown):
+            await asyncio.wait_for(getter, 1)
+        with pytest.raises(DequeShutDown):
+            await adeque.aput(1)
+
+    asyncio.run(scenario())
+
+
+def test_ajoin_flushes_idle_producers():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    adeque = AsyncThreadSafeDeque(dq)
+    producer = dq.producer(flush_interval=None)
+    producer.put(1)
+
+    async def scenario():
+        consumer = asyncio.ensure_future(adeque.aget())
+        await adeque.ajoin(timeout=0.05)
+        assert await consumer == 1
+        adeque.task_done()
+        await adeque.ajoin(timeout=1)
+
+    asyncio.run(scenario())
+    assert dq.tasks_count() == 0
+    producer.close()
+
+
+def test_timed_out_waiters_are_unregistered():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(1)
+    adeque = AsyncThreadSafeDeque(dq)
+    dq.put(0)
+
+    async def scenario():
+        for _ in range(50):
+            with pytest.raises(TimeoutError):
+                await adeque.aput(1, timeout=0)
+            await adeque.ajoin(timeout=0)
+        dq.get()
+        for _ in range(50):
+            with pytest.raises(TimeoutError):
+                await adeque.aget(timeout=0)
+
+    asyncio.run(scenario())
+    assert not dq._get_waiters
+    assert not dq._put_waiters
+    assert not dq._join_waiters
@@ -0,0 +1,126 @@
+import time
+from threading import Thread
+
+import pytest
+
+from tsdeque.coalescing import CoalescingThreadSafeDeque
+from tsdeque.exceptions import DequeShutDown
+
+
+@pytest.fixture
+def coalescing() -> CoalescingThreadSafeDeque:
+    return CoalescingThreadSafeDeque(key=lambda item: item[0])
+
+
+def test_duplicates_are_dropped(coalescing: CoalescingThreadSafeDeque):
+    coalescing.put(("a", 1))
+    coalescing.put(("b", 1))
+    coalescing.put(("a", 2))
+    coalescing.put_many([("c", 1), ("b", 2), ("c", 2)])
+
+    assert len(coalescing) == 3
+    assert coalescing.tasks_count() == 3
+    assert coalescing.coalesced_count() == 3
+    assert coalescing.getleft_many(10) == [("a", 1), ("b", 1), ("c", 1)]
+
+
+def test_replace_updates_payload_in_place():
+    dq = CoalescingThreadSafeDeque(key=lambda item: item[0], replace=True)
+    dq.put_many([("a", 1), ("b", 1)])
+    dq.put(("a", 2))
+
+    assert dq.getleft_many(10) == [("a", 2), ("b", 1)]
+    assert dq.tasks_count() == 2
+
+
+def test_putleft_moves_queued_item_to_the_left(coalescing: CoalescingThreadSafeDeque):
+    coalescing.put_many([("a", 1), ("b", 1), ("c", 1)])
+    coalescing.putleft(("c", 2))
+
+    assert len(coalescing) == 3
+    assert list(coalescing._deque) == [("c", 1), ("a", 1), ("b", 1)]
+    assert coalescing.get() == ("b", 1)
+    assert coalescing.get() == ("a", 1)
+    assert coalescing.get() == ("c", 1)
+    with pytest.raises(TimeoutError):
+        coalescing.get(timeout=0.01)
+
+
+def test_key_can_be_requeued_after_it_was_taken(coalescing: CoalescingThreadSafeDeque):
+    coalescing.put(("a", 1))
+    assert coalescing.get() == ("a", 1)
+    coalescing.put(("a", 2))
+
+    assert coalescing.get() == ("a", 2)
+    assert coalescing.coalesced_count() == 0
+    assert coalescing.tasks_count() == 2
+
+
+def test_tombstones_are_purged(coalescing: CoalescingThreadSafeDeque):
+    coalescing.put_many([("a", 0), ("b", 0)])
+    for i in range(1000):
+        coalescing.putleft(("a", i))
+        coalescing.putleft(("b", i))
+
+    assert len(coalescing._deque._cells) <= 6  # type: ignore[attr-defined]
+    assert coalescing.getleft_many(10) == [("b", 0), ("a", 0)]
+
+
+def test_duplicate_put_into_full_queue_does_not_block():
+    dq = CoalescingThreadSafeDeque(maxsize=2)
+    dq.put_many(["x", "y"])
+
+    start = time.monotonic()
+    dq.put("x", timeout=1)
+    dq.putleft("y", timeout=1)
+    assert time.monotonic() - start < 0.5
+    assert dq.getleft_many(10) == ["y", "x"]
+
+    dq.put_many(["x", "y"])
+    with pytest.raises(TimeoutError):
+        dq.put("z", timeout=0.01)
+
+
+def test_duplicate_put_into_full_shut_down_queue_raises():
+    dq = CoalescingThreadSafeDeque(key=lambda item: item[0], replace=True, maxsize=1)
+    dq.put((1, "a"))
+    dq.shutdown()
+
+    with pytest.raises(DequeShutDown):
+        dq.put((1, "b"))
+    assert dq.get() == (1, "a")
+
+
+def test_join_counts_only_delivered_items(coalescing: CoalescingThreadSafeDeque):
+    for i in range(100):
+        coalescing.put((f"key-{i % 10}", i))
+
+    def consume() -> None:
+        while True:
+            try:
+                coalescing.get(timeout=0.1)
+            except TimeoutError:
+                return
+            coalescing.task_done()
+
+    thread = Thread(target=consume)
+    thread.start()
+    coalescing.join(timeout=1)
+    assert coalescing.tasks_count() == 0
+    thread.join()
+
+
+def test_nack_of_requeued_key_keeps_task_accounting(coalescing: CoalescingThreadSafeDeque):
+    coalescing.put(("a", 1))
+    _, handle = coalescing.get_with_ack()
+    coalescing.put(("a", 2))
+    assert coalescing.tasks_count() == 2
+
+    coalescing.nack(handle)
+    assert len(coalescing) == 1
+    assert coalescing.tasks_count() == 1
+
+
+def test_spill_to_disk_is_rejected():
+    with pytest.raises(ValueError):
+        CoalescingThreadSafeDeque(maxsize=2, overflow="spill_to_disk")
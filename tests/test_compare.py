@@ -0,0 +1,89 @@
+import json
+import sys
+from typing import Any, Dict, List
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.compare import Regression, compare
+
+
+def document(**results: Dict[str, float]) -> Dict[str, Any]:
+    return {"results": {key.replace("__", "/"): value for key, value in results.items()}}
+
+
+def result(ops_per_sec: float = 1000, p99_ns: float = 1000) -> Dict[str, float]:
+    return {"ops_per_sec": ops_per_sec, "p99_ns": p99_ns}
+
+
+def run_compare(tmp_path, monkeypatch, baseline, current) -> int:
+    baseline_path = tmp_path / "baseline.json"
+    current_path = tmp_path / "current.json"
+    baseline_path.write_text(json.dumps(baseline))
+    current_path.write_text(json.dumps(current))
+    monkeypatch.setattr(
+        sys, "argv", ["benchmarks", "compare", str(baseline_path), str(current_path)]
+    )
+    return main()
+
+
+def reported_rows(capsys) -> List[str]:
+    return capsys.readouterr().out.splitlines()
+
+
+def test_throughput_drop_within_threshold_passes(tmp_path, monkeypatch, capsys):
+    baseline = document(spsc__tsdeque=result(ops_per_sec=1000))
+    current = document(spsc__tsdeque=result(ops_per_sec=910))
+
+    assert compare(baseline, current) == []
+    assert run_compare(tmp_path, monkeypatch, baseline, current) == 0
+    assert reported_rows(capsys) == ["No regressions found."]
+
+
+def test_throughput_drop_beyond_threshold_fails(tmp_path, monkeypatch, capsys):
+    baseline = document(spsc__tsdeque=result(ops_per_sec=1000))
+    current = document(spsc__tsdeque=result(ops_per_sec=890))
+
+    assert compare(baseline, current) == [
+        Regression("spsc/tsdeque", "ops_per_sec", 1000, 890, pytest.approx(-0.11))
+    ]
+    assert run_compare(tmp_path, monkeypatch, baseline, current) == 1
+    assert reported_rows(capsys) == ["REGRESSION spsc/tsdeque: ops_per_sec 1000 -> 890 (-11.0%)"]
+
+
+@pytest.mark.parametrize("p99_ns, status", [(1200, 0), (1300, 1)])
+def test_p99_growth(tmp_path, monkeypatch, capsys, p99_ns: float, status: int):
+    baseline = document(mpmc__tsdeque=result(p99_ns=1000))
+    current = document(mpmc__tsdeque=result(p99_ns=p99_ns))
+
+    assert run_compare(tmp_path, monkeypatch, baseline, current) == status
+    rows = reported_rows(capsys)
+    if status:
+        assert rows == ["REGRESSION mpmc/tsdeque: p99_ns 1000 -> 1300 (+30.0%)"]
+    else:
+        assert rows == ["No regressions found."]
+
+
+def test_throughput_and_latency_regressions_are_reported_per_key(
+    tmp_path, monkeypatch, capsys
+):
+    baseline = document(b__tsdeque=result(), a__tsdeque=result())
+    current = document(
+        b__tsdeque=result(ops_per_sec=500, p99_ns=2000), a__tsdeque=result(ops_per_sec=800)
+    )
+
+    assert run_compare(tmp_path, monkeypatch, baseline, current) == 1
+    assert reported_rows(capsys) == [
+        "REGRESSION a/tsdeque: ops_per_sec 1000 -> 800 (-20.0%)",
+        "REGRESSION b/tsdeque: ops_per_sec 1000 -> 500 (-50.0%)",
+        "REGRESSION b/tsdeque: p99_ns 1000 -> 2000 (+100.0%)",
+    ]
+
+
+def test_keys_missing_from_either_run_are_skipped(tmp_path, monkeypatch, capsys):
+    baseline = document(spsc__tsdeque=result(), removed__tsdeque=result())
+    current = document(spsc__tsdeque=result(), added__tsdeque=result(ops_per_sec=1))
+
+    assert compare(baseline, current) == []
+    assert run_compare(tmp_path, monkeypatch, baseline, current) == 0
+    assert reported_rows(capsys) == ["No regressions found."]
@@ -3,7 +3,9 @@ import pytest
 from threading import Thread
 
 from tsdeque.core import ThreadSafeDeque
-from tsdeque.exceptions import NoActiveTaskError
+from tsdeque.exceptions import (
+    DequeFullError, DequeShutDown, LeaseError, NoActiveTaskError, PartialPutError,
+)
 
 
 @pytest.fixture
@@ -175,3 +177,729 @@ def test_task_done_with_empty_deque(three_elemet_deque: ThreadSafeDeque):
 
     with pytest.raises(NoActiveTaskError):
         three_elemet_deque.task_done()
+
+
+def test_blocked_get_wakes_on_put(unlim_and_lim_deq: ThreadSafeDeque):
+    item = object()
+    results = []
+
+    consumer = Thread(target=lambda: results.append(unlim_and_lim_deq.get(timeout=1)))
+    consumer.start()
+
+    time.sleep(0.05)
+    unlim_and_lim_deq.put(item)
+
+    consumer.join(timeout=1)
+    assert not consumer.is_alive()
+    assert results == [item]
+
+
+def test_blocked_put_wakes_on_get(three_elemet_deque: ThreadSafeDeque):
+    for _ in range(3):
+        three_elemet_deque.put(object())
+
+    producer = Thread(target=lambda: three_elemet_deque.put(object(), timeout=1))
+    producer.start()
+
+    time.sleep(0.05)
+    three_elemet_deque.getleft()
+
+    producer.join(timeout=1)
+    assert not producer.is_alive()
+    assert len(three_elemet_deque) == 3
+
+
+def test_idle_get_with_unfinished_task_does_not_spin(
+    unlim_and_lim_deq: ThreadSafeDeque,
+):
+    unlim_and_lim_deq.put(object())
+    unlim_and_lim_deq.get()
+
+    cpu_start = time.process_time()
+    with pytest.raises(TimeoutError):
+        unlim_and_lim_deq.get(timeout=0.3)
+    cpu_spent = time.process_time() - cpu_start
+
+    assert cpu_spent < 0.1
+
+
+def test_many_producers_and_consumers(three_elemet_deque: ThreadSafeDeque):
+    items_per_producer = 200
+    producers_count = 4
+    received = []
+
+    def producent(offset: int):
+        for i in range(items_per_producer):
+            three_elemet_deque.put(offset + i)
+
+    def consument():
+        for _ in range(items_per_producer):
+            received.append(three_elemet_deque.get(timeout=5))
+            three_elemet_deque.task_done()
+
+    threads = [
+        Thread(target=producent, args=(n * items_per_producer,))
+        for n in range(producers_count)
+    ] + [Thread(target=consument) for _ in range(producers_count)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert sorted(received) == list(range(items_per_producer * producers_count))
+    assert three_elemet_deque.tasks_count() == 0
+    assert len(three_elemet_deque) == 0
+
+
+def test_put_many_and_get_many(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put_many([1, 2, 3])
+
+    assert unlim_and_lim_deq.tasks_count() == 3
+    assert unlim_and_lim_deq.getleft_many(2) == [1, 2]
+    assert unlim_and_lim_deq.get_many(5) == [3]
+    assert len(unlim_and_lim_deq) == 0
+
+
+def test_putleft_many_order(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put(0)
+    unlim_and_lim_deq.putleft_many([1, 2])
+
+    assert unlim_and_lim_deq.getleft_many(3) == [2, 1, 0]
+
+
+def test_get_many_timeout(unlim_and_lim_deq: ThreadSafeDeque):
+    timeout = 0.2
+
+    start_time = time.monotonic()
+    with pytest.raises(TimeoutError):
+        unlim_and_lim_deq.get_many(3, timeout=timeout)
+    elapsed_time = time.monotonic() - start_time
+
+    assert elapsed_time == pytest.approx(timeout, rel=0.1)
+
+
+def test_get_many_returns_on_first_item(unlim_and_lim_deq: ThreadSafeDeque):
+    results = []
+
+    consumer = Thread(
+        target=lambda: results.append(unlim_and_lim_deq.getleft_many(10, timeout=1))
+    )
+    consumer.start()
+
+    time.sleep(0.05)
+    unlim_and_lim_deq.put(1)
+
+    consumer.join(timeout=1)
+    assert results == [[1]]
+
+
+def test_get_many_invalid_max_items(unlim_and_lim_deq: ThreadSafeDeque):
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.get_many(0)
+
+
+def test_put_many_partial_fill_timeout(three_elemet_deque: ThreadSafeDeque):
+    with pytest.raises(PartialPutError) as exc_info:
+        three_elemet_deque.put_many(range(5), timeout=0.1)
+
+    assert exc_info.value.inserted == 3
+    assert three_elemet_deque.tasks_count() == 3
+    assert three_elemet_deque.getleft_many(3) == [0, 1, 2]
+
+
+def test_put_many_larger_than_maxsize(three_elemet_deque: ThreadSafeDeque):
+    received = []
+
+    def consument():
+        while len(received) < 7:
+            received.extend(three_elemet_deque.getleft_many(7, timeout=1))
+
+    consument_thread = Thread(target=consument)
+    consument_thread.start()
+
+    three_elemet_deque.put_many(range(7), timeout=1)
+
+    consument_thread.join(timeout=1)
+    assert received == list(range(7))
+
+
+def test_task_done_with_count(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put_many([1, 2, 3])
+    unlim_and_lim_deq.get_many(3)
+
+    with pytest.raises(NoActiveTaskError):
+        unlim_and_lim_deq.task_done(4)
+    assert unlim_and_lim_deq.tasks_count() == 3
+
+    unlim_and_lim_deq.task_done(3)
+    assert unlim_and_lim_deq.tasks_count() == 0
+
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.task_done(0)
+
+
+def test_get_with_deadline(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put(1)
+    assert unlim_and_lim_deq.get(deadline=time.monotonic() + 0.1) == 1
+
+    deadline = time.monotonic() + 0.2
+    with pytest.raises(TimeoutError):
+        unlim_and_lim_deq.getleft(deadline=deadline)
+    assert time.monotonic() >= deadline
+
+    with pytest.raises(TimeoutError):
+        unlim_and_lim_deq.get_many(2, deadline=time.monotonic() - 1)
+
+
+def test_put_with_deadline(three_elemet_deque: ThreadSafeDeque):
+    three_elemet_deque.put_many([1, 2, 3])
+
+    deadline = time.monotonic() + 0.2
+    with pytest.raises(TimeoutError):
+        three_elemet_deque.put(4, deadline=deadline)
+    assert time.monotonic() >= deadline
+
+    with pytest.raises(PartialPutError):
+        three_elemet_deque.putleft_many([4], deadline=time.monotonic())
+
+
+def test_timeout_and_deadline_are_exclusive(unlim_and_lim_deq: ThreadSafeDeque):
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.put(1, timeout=1, deadline=time.monotonic() + 1)
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.get(timeout=1, deadline=time.monotonic() + 1)
+    assert len(unlim_and_lim_deq) == 0
+
+
+def test_overflow_policy_validation():
+    with pytest.raises(ValueError):
+        ThreadSafeDeque(3, overflow="drop_everything")
+    with pytest.raises(ValueError):
+        ThreadSafeDeque(overflow="drop_oldest")
+
+
+def test_overflow_drop_oldest():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(3, overflow="drop_oldest")
+    dq.put_many([1, 2, 3])
+
+    dq.put(4)
+    assert list(dq._deque) == [2, 3, 4]
+    dq.putleft(0)
+    assert list(dq._deque) == [0, 2, 3]
+    dq.put_many([5, 6, 7, 8])
+    assert list(dq._deque) == [6, 7, 8]
+
+    assert dq.dropped_count() == 6
+    assert dq.tasks_count() == 3
+
+
+def test_overflow_drop_newest():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(3, overflow="drop_newest")
+    dq.put_many([1, 2])
+
+    dq.put_many([3, 4, 5])
+    dq.putleft(0, timeout=None)
+    assert list(dq._deque) == [1, 2, 3]
+    assert dq.dropped_count() == 3
+    assert dq.tasks_count() == 3
+
+
+def test_overflow_drop_oldest_completes_join():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(1, overflow="drop_oldest")
+    dq.put(1)
+    dq.get()
+    dq.task_done()
+    dq.put(2)
+    dq.put(3)
+
+    assert dq.tasks_count() == 1
+    assert dq.get() == 3
+    dq.task_done()
+    dq.join(timeout=0)
+    assert dq.tasks_count() == 0
+
+
+def test_overflow_raise_immediately():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(2, overflow="raise_immediately")
+    dq.put(1)
+
+    with pytest.raises(DequeFullError) as error:
+        dq.put_many([2, 3, 4])
+    assert error.value.inserted == 1
+
+    start = time.perf_counter()
+    with pytest.raises(DequeFullError):
+        dq.putleft(0, timeout=10)
+    assert time.perf_counter() - start < 1
+    assert dq.tasks_count() == 2
+    assert dq.dropped_count() == 0
+
+
+def test_overflow_spill_to_disk(tmp_path):
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(
+        3, overflow="spill_to_disk", spill_directory=str(tmp_path)
+    )
+    dq.put_many(range(10))
+    dq.putleft(-1)
+
+    assert len(dq) == 11
+    assert dq._deque.spilled == 8  # type: ignore[attr-defined]
+    assert dq.get() == 9
+    assert dq.getleft_many(4) == [-1, 0, 1, 2]
+    assert list(dq._deque) == [3, 4, 5, 6, 7, 8]
+    assert dq.tasks_count() == 11
+    assert dq.dropped_count() == 0
+
+    dq.clear()
+    assert len(dq) == 0
+    assert dq.tasks_count() == 5
+
+
+def test_ack_finishes_leased_task(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put_many([1, 2])
+    item, handle = unlim_and_lim_deq.getleft_with_ack()
+
+    assert item == 1
+    assert unlim_and_lim_deq.leased_count() == 1
+    assert unlim_and_lim_deq.tasks_count() == 2
+
+    unlim_and_lim_deq.ack(handle)
+    assert unlim_and_lim_deq.leased_count() == 0
+    assert unlim_and_lim_deq.tasks_count() == 1
+    with pytest.raises(LeaseError):
+        unlim_and_lim_deq.ack(handle)
+
+
+def test_nack_requeues_item(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put_many([1, 2, 3])
+
+    _, handle = unlim_and_lim_deq.get_with_ack()
+    unlim_and_lim_deq.nack(handle)
+    assert unlim_and_lim_deq.getleft() == 3
+
+    _, handle = unlim_and_lim_deq.getleft_with_ack()
+    unlim_and_lim_deq.nack(handle, requeue_left=False)
+    assert unlim_and_lim_deq.get() == 1
+    assert unlim_and_lim_deq.tasks_count() == 3
+    with pytest.raises(LeaseError):
+        unlim_and_lim_deq.nack(handle)
+
+
+def test_expired_lease_is_redelivered(three_elemet_deque: ThreadSafeDeque):
+    three_elemet_deque.put_many([1, 2, 3])
+    _, lost = three_elemet_deque.getleft_with_ack(lease=0.05)
+    three_elemet_deque.put(4)
+
+    start = time.monotonic()
+    item, handle = three_elemet_deque.getleft_with_ack(timeout=1)
+    assert item == 2
+    three_elemet_deque.ack(handle)
+
+    # The expired item is requeued at the front even though the deque is full.
+    time.sleep(0.1)
+    assert len(three_elemet_deque) == 3
+    assert three_elemet_deque.getleft() == 1
+    assert time.monotonic() - start < 1
+    with pytest.raises(LeaseError):
+        three_elemet_deque.ack(lost)
+    assert three_elemet_deque.leased_count() == 0
+
+
+def test_expired_lease_wakes_waiting_getter():
+    dq: ThreadSafeDeque[str] = ThreadSafeDeque()
+    dq.put("job")
+    dq.get_with_ack(lease=0.05)
+
+    start = time.monotonic()
+    item, handle = dq.get_with_ack(timeout=1)
+    assert item == "job"
+    assert time.monotonic() - start < 0.5
+    dq.ack(handle)
+    dq.join(timeout=0)
+
+
+def test_invalid_lease(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put(1)
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.get_with_ack(lease=0)
+    assert len(unlim_and_lim_deq) == 1
+
+
+def test_put_after_orders_by_due_time(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put_after("late", 0.2)
+    unlim_and_lim_deq.put_after("early", 0.1)
+    unlim_and_lim_deq.put_at("now", time.monotonic() - 1)
+
+    assert unlim_and_lim_deq.tasks_count() == 3
+    assert unlim_and_lim_deq.scheduled_count() == 2
+    assert unlim_and_lim_deq.getleft(timeout=0) == "now"
+
+    start = time.monotonic()
+    assert unlim_and_lim_deq.getleft(timeout=1) == "early"
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+    assert unlim_and_lim_deq.getleft(timeout=1) == "late"
+    assert time.monotonic() - start == pytest.approx(0.2, abs=0.05)
+    assert unlim_and_lim_deq.scheduled_count() == 0
+
+
+def test_put_after_counts_for_join():
+    dq: ThreadSafeDeque[str] = ThreadSafeDeque()
+    dq.put_after("retry", 0.05)
+
+    dq.join(timeout=0.01)
+    assert dq.tasks_count() == 1
+
+    def consume() -> None:
+        dq.get()
+        dq.task_done()
+
+    thread = Thread(target=consume)
+    thread.start()
+    dq.join(timeout=1)
+    assert dq.tasks_count() == 0
+    thread.join()
+
+
+def test_put_after_invalid_delay(unlim_and_lim_deq: ThreadSafeDeque):
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.put_after(1, -1)
+    assert unlim_and_lim_deq.tasks_count() == 0
+
+
+def test_iter_yields_items_and_marks_them_done(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put_many([1, 2, 3])
+    received = []
+
+    for item in unlim_and_lim_deq.iter(timeout=0.05, left=True):
+        received.append(item)
+        assert unlim_and_lim_deq.tasks_count() == 4 - len(received)
+
+    assert received == [1, 2, 3]
+    assert unlim_and_lim_deq.tasks_count() == 0
+
+
+def test_iter_chunks_and_bulk_task_done():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    dq.put_many(range(10))
+    chunks = []
+
+    for batch in dq.iter(timeout=0.05, chunk=4, left=True):
+        chunks.append(batch)
+        assert dq.tasks_count() == 10 - sum(map(len, chunks[:-1]))
+
+    assert chunks == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert dq.tasks_count() == 0
+
+
+def test_iter_linger_fills_chunk():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+
+    def produce() -> None:
+        for i in range(5):
+            dq.put(i)
+            time.sleep(0.01)
+
+    thread = Thread(target=produce)
+    thread.start()
+    batches = dq.iter(timeout=1, chunk=5, linger=0.5, left=True)
+    start = time.monotonic()
+    assert next(batches) == [0, 1, 2, 3, 4]
+    assert time.monotonic() - start < 0.3
+    batches.close()
+    thread.join()
+    assert dq.tasks_count() == 0
+
+
+def test_iter_linger_returns_partial_chunk():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    dq.put_many([1, 2])
+
+    start = time.monotonic()
+    assert next(dq.iter(chunk=5, linger=0.1)) == [2, 1]
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+
+
+def test_iter_break_marks_last_item_done():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    dq.put_many([1, 2, 3])
+
+    items = dq.iter()
+    for item in items:
+        if item == 2:
+            break
+    items.close()
+    assert dq.tasks_count() == 1
+
+
+def test_iter_validation(unlim_and_lim_deq: ThreadSafeDeque):
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.iter(chunk=0)
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.iter(linger=-1)
+
+
+def test_close_rejects_puts_and_lets_consumers_drain(unlim_and_lim_deq: ThreadSafeDeque):
+    unlim_and_lim_deq.put_many([1, 2])
+    unlim_and_lim_deq.close()
+
+    assert unlim_and_lim_deq.is_shutdown
+    with pytest.raises(DequeShutDown):
+        unlim_and_lim_deq.put(3)
+    with pytest.raises(DequeShutDown):
+        unlim_and_lim_deq.put_many([3])
+    with pytest.raises(DequeShutDown):
+        unlim_and_lim_deq.put_after(3, 0.01)
+    assert unlim_and_lim_deq.getleft_many(10) == [1, 2]
+    with pytest.raises(DequeShutDown):
+        unlim_and_lim_deq.get(timeout=1)
+
+
+def test_shutdown_wakes_blocked_getters_and_putters():
+    empty: ThreadSafeDeque[int] = ThreadSafeDeque()
+    full: ThreadSafeDeque[int] = ThreadSafeDeque(1)
+    full.put(0)
+    errors = []
+
+    def wait(call) -> None:
+        try:
+            call()
+        except DequeShutDown as error:
+            errors.append(error)
+
+    threads = [Thread(target=wait, args=(empty.get,)) for _ in range(5)]
+    threads += [Thread(target=wait, args=(lambda: full.put(1),)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    empty.shutdown()
+    full.shutdown()
+    for thread in threads:
+        thread.join(timeout=1)
+    assert time.monotonic() - start < 0.5
+    assert len(errors) == 10
+    assert full.get() == 0
+
+
+def test_immediate_shutdown_discards_items_and_tasks():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    dq.put_many([1, 2, 3])
+    dq.put_after(4, 60)
+    assert dq.get() == 3
+
+    dq.shutdown(immediate=True)
+    assert len(dq) == 0
+    assert dq.scheduled_count() == 0
+    assert dq.tasks_count() == 1
+    with pytest.raises(DequeShutDown):
+        dq.get(timeout=1)
+    dq.task_done()
+    dq.join()
+
+
+def test_iter_ends_on_close():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    dq.put_many(range(3))
+
+    def close() -> None:
+        time.sleep(0.05)
+        dq.close()
+
+    thread = Thread(target=close)
+    thread.start()
+    start = time.monotonic()
+    assert list(dq.iter(chunk=10, linger=1, left=True)) == [[0, 1, 2]]
+    assert time.monotonic() - start < 0.5
+    assert dq.tasks_count() == 0
+    thread.join()
+
+
+def test_consumer_prefetches_and_keeps_tasks():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    dq.put_many(range(10))
+
+    with dq.consumer(prefetch=4, left=True) as consumer:
+        assert consumer.get() == 0
+        assert len(consumer) == 3
+        assert len(dq) == 6
+        assert dq.tasks_count() == 10
+        consumer.task_done()
+        assert [consumer.get() for _ in range(4)] == [1, 2, 3, 4]
+        assert len(dq) == 2
+
+    assert dq.getleft_many(10) == [5, 6, 7, 8, 9]
+    assert dq.tasks_count() == 9
+
+
+@pytest.mark.parametrize("left", [True, False])
+def test_consumer_close_returns_items_in_order(left: bool):
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(3)
+    dq.put_many([1, 2, 3])
+
+    consumer = dq.consumer(prefetch=10, left=left)
+    consumer.get()
+    dq.put_many([4, 5, 6])
+    consumer.close()
+    consumer.close()
+
+    # Returned items bypass the capacity limit.
+    assert len(dq) == 5
+    assert list(dq._deque) == ([2, 3, 4, 5, 6] if left else [4, 5, 6, 1, 2])
+    with pytest.raises(RuntimeError):
+        consumer.get()
+
+
+def test_consumers_drain_queue_for_join():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    received = []
+
+    def consume() -> None:
+        with dq.consumer(prefetch=8) as consumer:
+            while True:
+                try:
+                    received.append(consumer.get())
+                except DequeShutDown:
+                    return
+                consumer.task_done()
+
+    threads = [Thread(target=consume) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for i in range(0, 1000, 10):
+        dq.put_many(range(i, i + 10))
+    dq.close()
+    dq.join()
+    for thread in threads:
+        thread.join()
+    assert sorted(received) == list(range(1000))
+
+
+def test_consumer_validation(unlim_and_lim_deq: ThreadSafeDeque):
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.consumer(prefetch=0)
+
+
+def test_producer_stores_full_batches_in_order():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+
+    with dq.producer(flush_size=4, flush_interval=None) as producer:
+        for i in range(6):
+            producer.put(i)
+        assert len(dq) == 4
+        assert len(producer) == 2
+        assert dq.tasks_count() == 4
+
+    assert dq.getleft_many(10) == [0, 1, 2, 3, 4, 5]
+    assert dq.tasks_count() == 6
+    with pytest.raises(RuntimeError):
+        producer.put(6)
+
+
+def test_producer_flushes_after_interval():
+    dq: ThreadSafeDeque[str] = ThreadSafeDeque()
+    producer = dq.producer(flush_size=100, flush_interval=0.05)
+    producer.put("item")
+    assert len(dq) == 0
+
+    start = time.monotonic()
+    assert dq.get(timeout=1) == "item"
+    assert time.monotonic() - start == pytest.approx(0.05, abs=0.04)
+    producer.close()
+
+
+def test_join_flushes_producers():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    producer = dq.producer(flush_size=100, flush_interval=None)
+    for i in range(3):
+        producer.put(i)
+
+    def consume() -> None:
+        for _ in range(3):
+            dq.get(timeout=1)
+            dq.task_done()
+
+    thread = Thread(target=consume)
+    thread.start()
+    dq.join(timeout=1)
+    assert dq.tasks_count() == 0
+    assert len(producer) == 0
+    thread.join()
+
+
+def test_producer_keeps_unstored_items_when_full():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(3)
+    producer = dq.producer(flush_size=10, flush_interval=0.02)
+    for i in range(5):
+        producer.put(i)
+
+    with pytest.raises(PartialPutError):
+        producer.flush(timeout=0.01)
+    assert list(dq._deque) == [0, 1, 2]
+    assert len(producer) == 2
+
+    # The timed flush stores the rest once there is room again.
+    assert dq.getleft_many(3) == [0, 1, 2]
+    assert dq.getleft_many(3, timeout=1) == [3, 4]
+    producer.close()
+
+
+def test_producers_keep_their_order():
+    dq: ThreadSafeDeque[tuple] = ThreadSafeDeque(50)
+
+    def produce(name: str) -> None:
+        with dq.producer(flush_size=7) as producer:
+            for i in range(500):
+                producer.put((name, i))
+
+    threads = [Thread(target=produce, args=(name,)) for name in "abcd"]
+    for thread in threads:
+        thread.start()
+    received = []
+    while len(received) < 2000:
+        received.extend(dq.getleft_many(100, timeout=1))
+    for thread in threads:
+        thread.join()
+    for name in "abcd":
+        assert [i for n, i in received if n == name] == list(range(500))
+
+
+def test_producer_validation(unlim_and_lim_deq: ThreadSafeDeque):
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.producer(flush_size=0)
+    with pytest.raises(ValueError):
+        unlim_and_lim_deq.producer(flush_interval=0)
+
+
+def test_join_timeout_with_producer_waiting_for_space():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(1)
+    producer = dq.producer(flush_size=2, flush_interval=None)
+
+    def produce() -> None:
+        producer.put(1)
+        producer.put(2)
+
+    thread = Thread(target=produce)
+    thread.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    dq.join(timeout=0.1)
+    assert time.monotonic() - start < 0.5
+    dq.getleft_many(2)
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+    producer.close()
+
+
+def test_join_flushes_dropped_producer():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    producer = dq.producer(flush_interval=None)
+    producer.put(1)
+    producer.put(2)
+    del producer
+
+    dq.join(timeout=0.05)
+    assert len(dq) == 2
+    assert dq.tasks_count() == 2
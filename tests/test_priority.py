@@ -0,0 +1,158 @@
+import time
+import pytest
+from threading import Thread
+
+from tsdeque.priority import PriorityThreadSafeDeque
+
+
+def test_strict_priority():
+    deque = PriorityThreadSafeDeque(lanes=3)
+
+    deque.put("bulk-1")
+    deque.put("bulk-2")
+    deque.put("urgent-1", lane=0)
+    deque.put("urgent-2", lane=0)
+    deque.put("normal", lane=1)
+
+    assert [deque.getleft() for _ in range(5)] == [
+        "urgent-1",
+        "urgent-2",
+        "normal",
+        "bulk-1",
+        "bulk-2",
+    ]
+
+
+def test_get_takes_newest_item_of_selected_lane():
+    deque = PriorityThreadSafeDeque(lanes=2)
+
+    deque.put(1, lane=1)
+    deque.put(2, lane=0)
+    deque.put(3, lane=0)
+
+    assert [deque.get() for _ in range(3)] == [3, 2, 1]
+
+
+def test_weighted_round_robin():
+    deque = PriorityThreadSafeDeque(lanes=2, weights=[3, 1])
+
+    deque.put_many(["a"] * 6, lane=0)
+    deque.put_many(["b"] * 6, lane=1)
+
+    result = "".join(deque.getleft() for _ in range(12))
+    assert result == "aaabaaabbbbb"
+
+
+def test_weighted_round_robin_skips_empty_lanes():
+    deque = PriorityThreadSafeDeque(lanes=3, weights=[1, 1, 1])
+
+    deque.put_many([0, 0], lane=0)
+    deque.put_many([2, 2], lane=2)
+
+    assert [deque.getleft() for _ in range(4)] == [0, 2, 0, 2]
+
+
+def test_shared_maxsize_and_tasks():
+    deque = PriorityThreadSafeDeque(lanes=2, maxsize=2)
+
+    deque.put(1, lane=0)
+    deque.put(2, lane=1)
+    with pytest.raises(TimeoutError):
+        deque.put(3, lane=0, timeout=0.1)
+
+    assert deque.lane_depths() == [1, 1]
+    assert deque.tasks_count() == 2
+
+    deque.getleft()
+    deque.getleft()
+    deque.task_done(2)
+    deque.join(timeout=1)
+    assert deque.tasks_count() == 0
+
+
+def test_blocked_get_wakes_on_lane_put():
+    deque = PriorityThreadSafeDeque(lanes=2)
+    results = []
+
+    consumer = Thread(target=lambda: results.append(deque.getleft(timeout=1)))
+    consumer.start()
+    time.sleep(0.05)
+    deque.put("x", lane=0)
+    consumer.join(timeout=1)
+
+    assert results == ["x"]
+
+
+def test_putleft_many_and_clear():
+    deque = PriorityThreadSafeDeque(lanes=2)
+
+    deque.putleft_many([1, 2], lane=0)
+    assert deque.getleft_many(2) == [2, 1]
+
+    deque.put(1)
+    deque.clear()
+    assert len(deque) == 0
+    assert deque.lane_depths() == [0, 0]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"lanes": 0},
+        {"lanes": 2, "weights": [1]},
+        {"lanes": 2, "weights": [1, 0]},
+        {"lanes": 2, "default_lane": 2},
+        {"storage": "ring", "maxsize": 2},
+        {"maxsize": 2, "overflow": "spill_to_disk"},
+    ],
+)
+def test_invalid_configuration(kwargs):
+    with pytest.raises(ValueError):
+        PriorityThreadSafeDeque(**kwargs)
+
+
+def test_invalid_lane():
+    deque = PriorityThreadSafeDeque(lanes=2)
+
+    with pytest.raises(ValueError):
+        deque.put(1, lane=2)
+
+
+def test_positional_arguments_match_base_class():
+    deque = PriorityThreadSafeDeque(lanes=2, maxsize=1)
+    deque.put(1, None, time.monotonic() + 1)
+
+    with pytest.raises(TimeoutError):
+        deque.put(2, None, time.monotonic() + 0.05)
+    with pytest.raises(TypeError):
+        deque.put(2, None, None, 1)  # type: ignore[misc]
+
+
+def test_requeued_items_keep_their_lane():
+    dq: PriorityThreadSafeDeque[int] = PriorityThreadSafeDeque(lanes=2)
+    dq.put(0, lane=0)
+    dq.put_many([1, 2], lane=1)
+
+    item, handle = dq.getleft_with_ack()
+    assert item == 0
+    dq.nack(handle)
+    assert dq.lane_depths() == [1, 2]
+
+    with dq.consumer(prefetch=3, left=True) as consumer:
+        assert consumer.get() == 0
+        consumer.task_done()
+        dq.put(3, lane=0)
+    assert dq.lane_depths() == [1, 2]
+    assert dq.getleft_many(10) == [3, 1, 2]
+
+
+def test_drop_oldest_evicts_lowest_priority_lane():
+    dq: PriorityThreadSafeDeque[str] = PriorityThreadSafeDeque(
+        lanes=2, maxsize=2, weights=[2, 1], overflow="drop_oldest"
+    )
+    dq.put("urgent", lane=0)
+    dq.put("bulk1", lane=1)
+    dq.put("bulk2", lane=1)
+
+    assert dq.lane_depths() == [1, 1]
+    assert dq.getleft_many(10) == ["urgent", "bulk2"]
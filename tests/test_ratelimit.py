@@ -0,0 +1,137 @@
+import asyncio
+import time
+from threading import Thread
+
+import pytest
+
+from tsdeque.aio import AsyncThreadSafeDeque
+from tsdeque.core import ThreadSafeDeque
+from tsdeque.exceptions import PartialPutError
+from tsdeque.ratelimit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_refills_up_to_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=5, clock=clock)
+
+    assert bucket.take(10) == 5
+    assert bucket.take() == 0
+    assert bucket.delay() == pytest.approx(0.1)
+    assert bucket.delay(3) == pytest.approx(0.3)
+
+    clock.now += 0.25
+    assert bucket.take(10) == 2
+    clock.now += 60
+    assert bucket.take(10) == 5
+
+
+def test_bucket_stats():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, burst=10, window=1.0, clock=clock)
+
+    bucket.take(10)
+    clock.now += 1.0
+    bucket.take(5)
+    bucket._record_wait(0.5)
+    clock.now += 0.5
+
+    stats = bucket.stats()
+    assert stats.granted == 15
+    assert stats.throttled == 1
+    assert stats.throttled_seconds == pytest.approx(0.5)
+    assert stats.tokens == pytest.approx(10)
+    # Half of the previous window plus the current one.
+    assert stats.observed_rate == pytest.approx(10 * 0.5 + 5)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"rate": 0}, {"rate": 1, "burst": 0.5}, {"rate": 1, "window": 0}]
+)
+def test_bucket_validation(kwargs):
+    with pytest.raises(ValueError):
+        TokenBucket(**kwargs)
+
+
+def test_get_limiter_paces_getters():
+    limiter = TokenBucket(rate=20, burst=1)
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(get_limiter=limiter)
+    dq.put_many(range(5))
+
+    start = time.monotonic()
+    assert [dq.getleft() for _ in range(5)] == [0, 1, 2, 3, 4]
+    assert time.monotonic() - start == pytest.approx(4 / 20, abs=0.05)
+    assert limiter.stats().throttled >= 4
+
+
+def test_get_many_takes_available_tokens():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(get_limiter=TokenBucket(rate=10, burst=3))
+    dq.put_many(range(10))
+
+    assert dq.getleft_many(10) == [0, 1, 2]
+    start = time.monotonic()
+    assert dq.getleft_many(10) == [3]
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+
+
+def test_throttled_getter_times_out():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(get_limiter=TokenBucket(rate=1, burst=1))
+    dq.put_many([1, 2])
+    dq.get()
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        dq.get(timeout=0.1)
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+    assert len(dq) == 1
+
+
+def test_throttled_getter_waits_for_item_and_token():
+    dq: ThreadSafeDeque[str] = ThreadSafeDeque(get_limiter=TokenBucket(rate=5, burst=1))
+    dq.put("first")
+    dq.get()
+
+    def produce() -> None:
+        time.sleep(0.05)
+        dq.put("second")
+
+    thread = Thread(target=produce)
+    start = time.monotonic()
+    thread.start()
+    # The item arrives after 50 ms, the next token after 200 ms.
+    assert dq.get(timeout=1) == "second"
+    assert time.monotonic() - start == pytest.approx(0.2, abs=0.05)
+    thread.join()
+
+
+def test_put_limiter_paces_batches():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(put_limiter=TokenBucket(rate=50, burst=5))
+
+    start = time.monotonic()
+    dq.put_many(range(10))
+    assert time.monotonic() - start == pytest.approx(5 / 50, abs=0.05)
+    assert list(dq._deque) == list(range(10))
+
+    with pytest.raises(PartialPutError) as error:
+        dq.put_many(range(10), timeout=0.05)
+    assert 0 < error.value.inserted < 10
+
+
+def test_async_getter_respects_limiter():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(get_limiter=TokenBucket(rate=20, burst=1))
+    adeque = AsyncThreadSafeDeque(dq)
+    dq.put_many(range(3))
+
+    async def scenario():
+        return [await adeque.agetleft() for _ in range(3)]
+
+    start = time.monotonic()
+    assert asyncio.run(scenario()) == [0, 1, 2]
+    assert time.monotonic() - start == pytest.approx(2 / 20, abs=0.05)
@@ -0,0 +1,135 @@
+import asyncio
+import selectors
+import time
+from threading import Thread
+
+import pytest
+
+from tsdeque.core import ThreadSafeDeque
+from tsdeque.selector import DequeSelector
+
+
+@pytest.fixture
+def selector():
+    with DequeSelector() as selector:
+        yield selector
+
+
+def test_select_returns_ready_deques(selector: DequeSelector):
+    deques = [ThreadSafeDeque() for _ in range(5)]
+    for index, dq in enumerate(deques):
+        selector.register(dq, data=index)
+
+    assert selector.select(timeout=0) == []
+    deques[1].put("a")
+    deques[3].put_many(["b", "c"])
+
+    ready = selector.select(timeout=0)
+    assert sorted(data for _, data in ready) == [1, 3]
+    assert all(dq is deques[data] for dq, data in ready)
+
+
+def test_select_blocks_until_put(selector: DequeSelector):
+    dq: ThreadSafeDeque[str] = ThreadSafeDeque()
+    selector.register(dq)
+
+    def produce() -> None:
+        time.sleep(0.1)
+        dq.put("item")
+
+    thread = Thread(target=produce)
+    start = time.monotonic()
+    thread.start()
+    assert selector.select(timeout=1) == [(dq, None)]
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+    thread.join()
+
+
+def test_select_timeout(selector: DequeSelector):
+    selector.register(ThreadSafeDeque())
+
+    start = time.monotonic()
+    assert selector.select(timeout=0.1) == []
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.05)
+
+
+def test_deque_stays_ready_until_drained(selector: DequeSelector):
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    dq.put_many([1, 2])
+    selector.register(dq)
+
+    assert selector.select(timeout=0) == [(dq, None)]
+    dq.get()
+    assert selector.select(timeout=0) == [(dq, None)]
+    dq.get()
+    assert selector.select(timeout=0) == []
+    dq.put(3)
+    assert selector.select(timeout=0) == [(dq, None)]
+
+
+def test_unregister(selector: DequeSelector):
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    selector.register(dq)
+    with pytest.raises(KeyError):
+        selector.register(dq)
+
+    selector.unregister(dq)
+    dq.put(1)
+    assert selector.select(timeout=0) == []
+    assert dq._listeners == []
+    with pytest.raises(KeyError):
+        selector.unregister(dq)
+
+
+def test_requeued_and_scheduled_items_wake_selector(selector: DequeSelector):
+    dq: ThreadSafeDeque[str] = ThreadSafeDeque()
+    selector.register(dq)
+    dq.put_after("later", 0.05)
+
+    assert selector.select(timeout=1) == [(dq, None)]
+    _, handle = dq.get_with_ack()
+    assert selector.select(timeout=0) == []
+    dq.nack(handle)
+    assert selector.select(timeout=0) == [(dq, None)]
+
+
+def test_fileno_works_with_selectors(selector: DequeSelector):
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque()
+    selector.register(dq)
+    selector.select(timeout=0)
+
+    with selectors.DefaultSelector() as watcher:
+        watcher.register(selector, selectors.EVENT_READ)
+        assert watcher.select(timeout=0) == []
+
+        dq.put(1)
+        assert len(watcher.select(timeout=1)) == 1
+        assert selector.select(timeout=0) == [(dq, None)]
+
+        dq.get()
+        assert selector.select(timeout=0) == []
+        assert watcher.select(timeout=0) == []
+
+
+def test_fileno_with_asyncio(selector: DequeSelector):
+    dq: ThreadSafeDeque[str] = ThreadSafeDeque()
+    selector.register(dq)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        received = loop.create_future()
+
+        def on_readable() -> None:
+            for ready, _ in selector.select(timeout=0):
+                item = ready.get(timeout=0)
+                if not received.done():
+                    received.set_result(item)
+
+        loop.add_reader(selector.fileno(), on_readable)
+        try:
+            loop.call_later(0.05, dq.put, "routed")
+            return await asyncio.wait_for(received, 1)
+        finally:
+            loop.remove_reader(selector.fileno())
+
+    assert asyncio.run(scenario()) == "routed"
@@ -0,0 +1,167 @@
+import time
+import pytest
+from threading import Thread
+
+from tsdeque.sharded import ShardedThreadSafeDeque
+from tsdeque.exceptions import NoActiveTaskError
+
+
+@pytest.fixture(
+    params=[
+        lambda: ShardedThreadSafeDeque(shards=4),
+        lambda: ShardedThreadSafeDeque(shards=4, relaxed=False),
+    ]
+)
+def sharded_deque(request) -> ShardedThreadSafeDeque:
+    return request.param()
+
+
+def test_put_and_get(sharded_deque: ShardedThreadSafeDeque):
+    item = object()
+
+    sharded_deque.put(item)
+
+    assert len(sharded_deque) == 1
+    assert sharded_deque.get() is item
+
+
+def test_invalid_shards():
+    with pytest.raises(ValueError):
+        ShardedThreadSafeDeque(shards=0)
+
+
+def test_get_timeout(sharded_deque: ShardedThreadSafeDeque):
+    timeout = 0.2
+
+    start_time = time.monotonic()
+    with pytest.raises(TimeoutError):
+        sharded_deque.get(timeout=timeout)
+    elapsed_time = time.monotonic() - start_time
+
+    assert elapsed_time == pytest.approx(timeout, rel=0.1)
+
+
+def test_steals_from_other_shards(sharded_deque: ShardedThreadSafeDeque):
+    producer = Thread(target=lambda: [sharded_deque.put(i) for i in range(3)])
+    producer.start()
+    producer.join()
+
+    # the main thread has a different home shard than the producer
+    assert sorted(sharded_deque.getleft() for _ in range(3)) == [0, 1, 2]
+
+
+def test_strict_order_across_threads():
+    deque = ShardedThreadSafeDeque(shards=4, relaxed=False)
+
+    for i in range(8):
+        thread = Thread(target=deque.put, args=(i,))
+        thread.start()
+        thread.join()
+    deque.putleft(-1)
+
+    assert [deque.getleft() for _ in range(5)] == [-1, 0, 1, 2, 3]
+    assert [deque.get() for _ in range(4)] == [7, 6, 5, 4]
+
+
+def test_blocked_get_wakes_on_put(sharded_deque: ShardedThreadSafeDeque):
+    results = []
+
+    consumer = Thread(target=lambda: results.append(sharded_deque.get(timeout=1)))
+    consumer.start()
+
+    time.sleep(0.05)
+    sharded_deque.put(1)
+
+    consumer.join(timeout=1)
+    assert results == [1]
+
+
+def test_task_tracking(sharded_deque: ShardedThreadSafeDeque):
+    producer = Thread(target=lambda: [sharded_deque.put(i) for i in range(3)])
+    producer.start()
+    producer.join()
+
+    assert sharded_deque.tasks_count() == 3
+    for _ in range(3):
+        sharded_deque.get()
+
+    start_time = time.monotonic()
+    sharded_deque.join(timeout=0.1)
+    assert time.monotonic() - start_time == pytest.approx(0.1, rel=0.2)
+
+    # task_done from a thread whose home shard holds no tasks
+    sharded_deque.task_done(2)
+    sharded_deque.task_done()
+    assert sharded_deque.tasks_count() == 0
+
+    start_time = time.monotonic()
+    sharded_deque.join(timeout=1)
+    assert time.monotonic() - start_time < 0.1
+
+    with pytest.raises(NoActiveTaskError):
+        sharded_deque.task_done()
+
+
+def test_clear(sharded_deque: ShardedThreadSafeDeque):
+    sharded_deque.put(1)
+    sharded_deque.put(2)
+    sharded_deque.get()
+
+    sharded_deque.clear()
+
+    assert len(sharded_deque) == 0
+    assert sharded_deque.tasks_count() == 1
+
+
+def test_many_producers_and_consumers(sharded_deque: ShardedThreadSafeDeque):
+    items_per_producer = 200
+    producers_count = 4
+    received = []
+
+    def producent(offset: int):
+        for i in range(items_per_producer):
+            sharded_deque.put(offset + i)
+
+    def consument():
+        for _ in range(items_per_producer):
+            received.append(sharded_deque.getleft(timeout=5))
+            sharded_deque.task_done()
+
+    threads = [
+        Thread(target=producent, args=(n * items_per_producer,))
+        for n in range(producers_count)
+    ] + [Thread(target=consument) for _ in range(producers_count)]
+
+    for thread in threads:
+        thread.start()
+    sharded_deque.join(timeout=5)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert sorted(received) == list(range(items_per_producer * producers_count))
+    assert sharded_deque.tasks_count() == 0
+
+
+def test_task_done_of_stolen_items_locks_one_shard():
+    dq: ShardedThreadSafeDeque[int] = ShardedThreadSafeDeque(shards=4)
+    producer = Thread(target=lambda: [dq.put(i) for i in range(1000)])
+    producer.start()
+    producer.join()
+
+    locked_all = 0
+    lock_all = dq._lock_all
+
+    def counting_lock_all() -> None:
+        nonlocal locked_all
+        locked_all += 1
+        lock_all()
+
+    dq._lock_all = counting_lock_all  # type: ignore[method-assign]
+    for _ in range(1000):
+        dq.getleft()
+        dq.task_done()
+
+    # Only the final task_done confirms that every task is done.
+    assert locked_all == 1
+    dq.join(timeout=1)
+    assert dq.tasks_count() == 0
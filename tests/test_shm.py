@@ -0,0 +1,147 @@
+import pickle
+import time
+from multiprocessing import get_context
+from threading import Thread
+from typing import Iterator
+
+import pytest
+
+from tsdeque.exceptions import NoActiveTaskError
+from tsdeque.shm import SharedMemoryDeque
+
+
+@pytest.fixture
+def shm_deque() -> Iterator[SharedMemoryDeque]:
+    with SharedMemoryDeque(capacity=3, slot_size=16) as dq:
+        yield dq
+
+
+def _produce(dq: SharedMemoryDeque, count: int) -> None:
+    for i in range(count):
+        dq.put(str(i).encode())
+    dq.join()
+
+
+def _consume(dq: SharedMemoryDeque, count: int) -> None:
+    for _ in range(count):
+        dq.getleft()
+        dq.task_done()
+
+
+def test_put_and_get_from_both_ends(shm_deque: SharedMemoryDeque):
+    shm_deque.put(b"b")
+    shm_deque.put(bytearray(b"c"))
+    shm_deque.putleft(memoryview(b"a"))
+
+    assert len(shm_deque) == 3
+    assert shm_deque.getleft() == b"a"
+    assert shm_deque.get() == b"c"
+    assert shm_deque.get() == b"b"
+    assert len(shm_deque) == 0
+
+
+def test_ring_wraps_around(shm_deque: SharedMemoryDeque):
+    for i in range(20):
+        shm_deque.put(bytes([i]))
+        shm_deque.putleft(bytes([i + 100]))
+        assert shm_deque.getleft() == bytes([i + 100])
+        assert shm_deque.getleft() == bytes([i])
+
+
+def test_timeouts(shm_deque: SharedMemoryDeque):
+    with pytest.raises(TimeoutError):
+        shm_deque.get(timeout=0.1)
+
+    for i in range(3):
+        shm_deque.put(bytes([i]))
+    with pytest.raises(TimeoutError):
+        shm_deque.putleft(b"x", timeout=0.1)
+
+
+def test_item_too_large(shm_deque: SharedMemoryDeque):
+    with pytest.raises(ValueError):
+        shm_deque.put(b"x" * 17)
+    shm_deque.put(b"x" * 16)
+    assert shm_deque.get() == b"x" * 16
+
+
+def test_view_leases_slot_until_released(shm_deque: SharedMemoryDeque):
+    for i in range(3):
+        shm_deque.put(bytes([i]) * 4)
+
+    with shm_deque.getleft_view() as view:
+        assert view.readonly
+        assert view.tobytes() == b"\x00" * 4
+        # The leased slot is still taken, so the deque stays full.
+        with pytest.raises(TimeoutError):
+            shm_deque.put(b"x", timeout=0.05)
+
+    shm_deque.put(b"x", timeout=0)
+    with shm_deque.get_view() as view:
+        assert bytes(view) == b"x"
+
+
+def test_task_tracking(shm_deque: SharedMemoryDeque):
+    shm_deque.put(b"a")
+    shm_deque.put(b"b")
+    assert shm_deque.tasks_count() == 2
+
+    shm_deque.get()
+    shm_deque.get()
+    shm_deque.task_done(2)
+    assert shm_deque.tasks_count() == 0
+    shm_deque.join(timeout=0)
+
+    with pytest.raises(NoActiveTaskError):
+        shm_deque.task_done()
+
+
+def test_join_waits_for_tasks(shm_deque: SharedMemoryDeque):
+    shm_deque.put(b"a")
+
+    def finish():
+        time.sleep(0.1)
+        shm_deque.get()
+        shm_deque.task_done()
+
+    worker = Thread(target=finish)
+    worker.start()
+    shm_deque.join(timeout=2)
+    worker.join()
+    assert shm_deque.tasks_count() == 0
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_cross_process_producer(method: str):
+    ctx = get_context(method)
+    with SharedMemoryDeque(capacity=4, slot_size=8, ctx=ctx) as dq:
+        producer = ctx.Process(target=_produce, args=(dq, 50))
+        producer.start()
+
+        received = []
+        for _ in range(50):
+            received.append(dq.getleft(timeout=10))
+            dq.task_done()
+        producer.join(10)
+
+        assert producer.exitcode == 0
+        assert received == [str(i).encode() for i in range(50)]
+
+
+def test_cross_process_consumer():
+    ctx = get_context("spawn")
+    with SharedMemoryDeque(capacity=4, slot_size=8, ctx=ctx) as dq:
+        consumer = ctx.Process(target=_consume, args=(dq, 20))
+        consumer.start()
+        for i in range(20):
+            dq.put(bytes([i]), timeout=10)
+        dq.join(timeout=10)
+        consumer.join(10)
+
+        assert consumer.exitcode == 0
+        assert dq.tasks_count() == 0
+
+
+def test_pickling_outside_spawning_is_rejected(shm_deque: SharedMemoryDeque):
+    with pytest.raises(RuntimeError):
+        pickle.dumps(shm_deque)
@@ -0,0 +1,126 @@
+import os
+import random
+from collections import deque
+from threading import Thread
+
+import pytest
+
+from tsdeque.spill import RawBytes, SegmentStore
+from tsdeque.spillable import SpillableThreadSafeDeque
+
+
+@pytest.fixture
+def store(tmp_path) -> SegmentStore:
+    return SegmentStore(str(tmp_path), segment_size=64)
+
+
+@pytest.fixture
+def spillable(tmp_path) -> SpillableThreadSafeDeque:
+    return SpillableThreadSafeDeque(memory_limit=4, directory=str(tmp_path), segment_size=128)
+
+
+def test_segment_store_matches_deque(store: SegmentStore):
+    rng = random.Random(7)
+    reference: deque = deque()
+
+    for i in range(2000):
+        operation = rng.choice(["append", "appendleft", "pop", "popleft"])
+        if operation.startswith("pop"):
+            if reference:
+                assert getattr(store, operation)() == getattr(reference, operation)()
+        else:
+            getattr(store, operation)(("item", i))
+            getattr(reference, operation)(("item", i))
+        assert len(store) == len(reference)
+
+    assert list(store) == list(reference)
+
+
+def test_segment_files_are_reclaimed(store: SegmentStore, tmp_path):
+    for i in range(50):
+        store.append(i)
+    assert store.segments > 1
+    assert len(os.listdir(tmp_path)) == store.segments
+
+    for i in range(50):
+        assert store.popleft() == i
+    assert store.segments == 0
+    assert os.listdir(tmp_path) == []
+
+    store.appendleft(1)
+    store.clear()
+    assert os.listdir(tmp_path) == []
+
+
+def test_raw_bytes_serializer(tmp_path):
+    store = SegmentStore(str(tmp_path), serializer=RawBytes, segment_size=16)
+    store.append(b"abc")
+    store.appendleft(b"x" * 100)
+
+    assert store.pop() == b"abc"
+    assert store.pop() == b"x" * 100
+
+
+def test_spillable_keeps_order(spillable: SpillableThreadSafeDeque):
+    spillable.put_many(range(100))
+    spillable.putleft(-1)
+
+    assert len(spillable) == 101
+    assert spillable.spilled_count() == 101 - 4
+    assert spillable.segment_count() > 1
+
+    assert spillable.getleft() == -1
+    assert spillable.get() == 99
+    assert spillable.getleft_many(1000) == list(range(99))
+    assert spillable.spilled_count() == 0
+    assert spillable.segment_count() == 0
+    assert spillable.tasks_count() == 101
+
+
+def test_spillable_matches_deque(spillable: SpillableThreadSafeDeque):
+    rng = random.Random(3)
+    reference: deque = deque()
+
+    for i in range(3000):
+        operation = rng.choice(["put", "putleft", "put", "get", "getleft"])
+        if operation.startswith("get"):
+            if reference:
+                expected = reference.pop() if operation == "get" else reference.popleft()
+                assert getattr(spillable, operation)() == expected
+        else:
+            getattr(spillable, operation)(i)
+            (reference.appendleft if operation == "putleft" else reference.append)(i)
+
+    assert list(spillable._deque) == list(reference)
+    assert len(reference) - spillable.spilled_count() <= 4
+
+
+def test_spillable_join(spillable: SpillableThreadSafeDeque):
+    def consument():
+        for _ in range(200):
+            spillable.getleft()
+            spillable.task_done()
+
+    thread = Thread(target=consument)
+    spillable.put_many(range(200))
+    thread.start()
+    spillable.join(timeout=5)
+    thread.join()
+
+    assert spillable.tasks_count() == 0
+
+
+def test_spillable_maxsize_blocks(tmp_path):
+    dq: SpillableThreadSafeDeque[int] = SpillableThreadSafeDeque(
+        memory_limit=2, directory=str(tmp_path), maxsize=5
+    )
+    dq.put_many(range(5))
+    assert dq.spilled_count() == 3
+
+    with pytest.raises(TimeoutError):
+        dq.put(5, timeout=0.05)
+
+
+def test_spillable_memory_limit_validation():
+    with pytest.raises(ValueError):
+        SpillableThreadSafeDeque(memory_limit=1)
@@ -0,0 +1,114 @@
+import time
+import pytest
+from threading import Thread
+
+from tsdeque.core import ThreadSafeDeque
+from tsdeque.stats import Histogram, StatsCollector
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for value in range(1, 1001):
+        histogram.record(value)
+
+    assert histogram.count == 1000
+    assert histogram.min == 1
+    assert histogram.max == 1000
+    assert histogram.mean() == pytest.approx(500.5)
+    assert histogram.percentile(50) == pytest.approx(500, rel=0.07)
+    assert histogram.percentile(99) == pytest.approx(990, rel=0.07)
+    assert histogram.percentile(0) == 1
+
+
+def test_histogram_small_values_are_exact():
+    histogram = Histogram()
+    for value in (0, 3, 3, 7):
+        histogram.record(value)
+
+    assert histogram.percentile(50) == 3
+    assert histogram.percentile(100) == 7
+
+
+def test_histogram_merge():
+    first, second = Histogram(), Histogram()
+    first.record(10)
+    second.record(1_000_000)
+
+    first.merge(second)
+
+    assert first.count == 2
+    assert first.min == 10
+    assert first.max == 1_000_000
+
+
+def test_histogram_invalid_percentile():
+    with pytest.raises(ValueError):
+        Histogram().percentile(101)
+
+
+def test_collector_merges_threads():
+    collector = StatsCollector()
+
+    def worker():
+        collector.counters().puts_left += 2
+
+    threads = [Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert collector.snapshot().puts_left == 6
+
+
+def test_stats_disabled_by_default():
+    assert ThreadSafeDeque().stats() is None
+
+
+def test_operation_counters():
+    deque = ThreadSafeDeque(maxsize=3, instrument=True)
+
+    deque.put(1)
+    deque.putleft(2)
+    deque.put_many([3])
+    deque.get()
+    deque.getleft_many(2)
+
+    stats = deque.stats()
+    assert (stats.puts_left, stats.puts_right) == (1, 2)
+    assert (stats.gets_left, stats.gets_right) == (2, 1)
+    assert stats.high_water_mark == 3
+    assert stats.lock_hold.count >= 5
+
+
+def test_timeout_counters():
+    deque = ThreadSafeDeque(maxsize=1, instrument=True)
+
+    with pytest.raises(TimeoutError):
+        deque.get(timeout=0.05)
+    deque.put(1)
+    with pytest.raises(TimeoutError):
+        deque.put(2, timeout=0.05)
+    deque.join(timeout=0.01)
+
+    stats = deque.stats()
+    assert stats.timeout_errors == 2
+    assert stats.timeouts == 3
+    assert stats.get_wait.count == 1
+    assert stats.get_wait.min >= 40_000_000
+    assert stats.put_wait.count == 1
+
+
+def test_blocked_getter_wait_time():
+    deque = ThreadSafeDeque(instrument=True)
+
+    consumer = Thread(target=lambda: deque.get(timeout=1))
+    consumer.start()
+    time.sleep(0.1)
+    deque.put(1)
+    consumer.join()
+
+    stats = deque.stats()
+    assert stats.get_wait.count == 1
+    assert stats.get_wait.max == pytest.approx(100_000_000, rel=0.5)
+    assert stats.timeouts == 0
@@ -0,0 +1,130 @@
+from collections import deque
+
+import pytest
+
+from tsdeque.core import ThreadSafeDeque
+from tsdeque.storage import RingBuffer, make_storage
+
+
+@pytest.fixture
+def ring() -> RingBuffer:
+    return RingBuffer(4)
+
+
+def test_ring_matches_deque(ring: RingBuffer):
+    reference: deque = deque()
+    operations = [
+        ("append", 1), ("appendleft", 2), ("append", 3), ("popleft", None),
+        ("appendleft", 4), ("append", 5), ("pop", None), ("pop", None),
+        ("append", 6), ("appendleft", 7), ("popleft", None), ("popleft", None),
+        ("pop", None), ("popleft", None),
+    ] * 5
+
+    for name, arg in operations:
+        if arg is None:
+            assert getattr(ring, name)() == getattr(reference, name)()
+        else:
+            getattr(ring, name)(arg)
+            getattr(reference, name)(arg)
+        assert list(ring) == list(reference)
+        assert len(ring) == len(reference)
+
+
+def test_ring_capacity(ring: RingBuffer):
+    ring.extend([1, 2])
+    ring.extendleft([3, 4])
+    assert list(ring) == [4, 3, 1, 2]
+
+    with pytest.raises(IndexError):
+        ring.append(5)
+    with pytest.raises(IndexError):
+        ring.appendleft(5)
+
+
+def test_ring_reserve_grows_past_capacity(ring: RingBuffer):
+    ring.extend([1, 2, 3])
+    ring.popleft()
+    ring.extend([4, 5])
+    ring.reserve(2)
+    ring.appendleft(0)
+    ring.append(6)
+
+    assert list(ring) == [0, 2, 3, 4, 5, 6]
+    assert ring.capacity == 8
+
+
+def test_requeue_into_full_ring_deque():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(2, storage="ring")
+    dq.put_many([1, 2])
+    _, handle = dq.get_with_ack()
+    dq.put(3)
+    dq.nack(handle)
+
+    assert len(dq) == 3
+    assert dq.tasks_count() == 3
+    assert dq.getleft_many(10) == [2, 1, 3]
+
+
+def test_ring_releases_items(ring: RingBuffer):
+    ring.extend([1, 2, 3])
+    ring.pop()
+    ring.popleft()
+    assert ring._slots.count(None) == 3
+
+    ring.clear()
+    assert len(ring) == 0
+    assert ring._slots == [None] * 4
+    with pytest.raises(IndexError):
+        ring.pop()
+
+
+def test_make_storage():
+    assert isinstance(make_storage("deque", 0), deque)
+    assert isinstance(make_storage("ring", 3), RingBuffer)
+    assert isinstance(make_storage(lambda maxsize: RingBuffer(maxsize + 1), 0), RingBuffer)
+
+    with pytest.raises(ValueError):
+        make_storage("ring", 0)
+    with pytest.raises(ValueError):
+        make_storage("list", 3)
+
+
+def test_deque_with_ring_storage():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(3, storage="ring")
+    dq.put_many([1, 2, 3])
+
+    with pytest.raises(TimeoutError):
+        dq.putleft(0, timeout=0.05)
+    assert dq.getleft() == 1
+    dq.putleft(0)
+    assert dq.get_many(5) == [3, 2, 0]
+    assert dq.tasks_count() == 4
+
+    dq.put(4)
+    dq.clear()
+    assert len(dq) == 0
+    assert dq.tasks_count() == 4
+
+
+def test_due_item_into_full_ring_deque():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(1, storage="ring")
+    dq.put(1)
+    dq.put_after(2, 0)
+
+    assert len(dq) == 2
+    assert dq.tasks_count() == 2
+    assert dq.scheduled_count() == 0
+    assert dq.getleft_many(10) == [1, 2]
+
+
+def test_consumer_close_into_full_ring_deque():
+    dq: ThreadSafeDeque[int] = ThreadSafeDeque(3, storage="ring")
+    dq.put_many([1, 2, 3])
+    consumer = dq.consumer(prefetch=3, left=True)
+    assert consumer.get() == 1
+    dq.put_many([4, 5])
+    consumer.close()
+
+    assert len(consumer) == 0
+    assert dq.getleft_many(10) == [2, 3, 4, 5]
+    assert dq.tasks_count() == 5
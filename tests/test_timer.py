@@ -1,6 +1,11 @@
+import time
+from threading import Lock, Thread
+
 import pytest
 
-from tsdeque.timer import Timer, NullTimer, get_timer
+from tsdeque.timer import (
+    Timer, NullTimer, TimerWheel, WheelCondition, WheelThread, get_timer, shared_wheel_thread,
+)
 from tests.utils import accurate_sleep
 
 
@@ -44,3 +49,159 @@ def test_getting_timer():
     assert isinstance(standart_timer, Timer), (
         f"Expected {Timer.__name__}(), but got {standart_timer}"
     )
+
+
+def test_getting_timer_with_deadline():
+    deadline = time.monotonic() + 2
+    timer = get_timer(None, deadline)
+
+    assert isinstance(timer, Timer)
+    assert timer.deadline == deadline
+    assert timer.get_spend() == pytest.approx(2, abs=0.1)
+
+    with pytest.raises(ValueError):
+        get_timer(1, deadline)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def wheel(clock: FakeClock) -> TimerWheel:
+    return TimerWheel(tick=0.01, slots=4, levels=2, clock=clock)
+
+
+def test_wheel_fires_due_callbacks_in_one_sweep(wheel: TimerWheel, clock: FakeClock):
+    fired = []
+    for i in range(10):
+        wheel.schedule(0.05, lambda i=i: fired.append(i))
+    wheel.schedule(0.5, lambda: fired.append("late"))
+
+    clock.now = 0.04
+    assert wheel.expire() == 0
+    clock.now = 0.05
+    assert wheel.expire() == 10
+    assert sorted(fired) == list(range(10))
+    assert len(wheel) == 1
+
+
+def test_wheel_never_fires_early(wheel: TimerWheel, clock: FakeClock):
+    fired = {}
+    # Deadlines spread over both levels and beyond the wheel's horizon.
+    deadlines = [0.013 * i for i in range(1, 60)]
+    for deadline in deadlines:
+        wheel.schedule(deadline, lambda d=deadline: fired.setdefault(d, clock.now))
+
+    while len(wheel):
+        clock.now += 0.007
+        wheel.expire()
+
+    assert sorted(fired) == deadlines
+    for deadline, at in fired.items():
+        assert deadline <= at < deadline + 0.01 + 0.007
+
+
+def test_wheel_cancel(wheel: TimerWheel, clock: FakeClock):
+    fired = []
+    timer_id = wheel.schedule(0.05, lambda: fired.append(1))
+
+    assert wheel.cancel(timer_id)
+    assert not wheel.cancel(timer_id)
+    clock.now = 1
+    assert wheel.expire() == 0
+    assert fired == []
+    assert wheel.next_expiry() is None
+
+
+def test_wheel_next_expiry(wheel: TimerWheel, clock: FakeClock):
+    wheel.schedule(0.025, lambda: None)
+    assert wheel.next_expiry() == pytest.approx(0.03)
+
+    wheel.schedule(0.015, lambda: None)
+    assert wheel.next_expiry() == pytest.approx(0.02)
+
+
+def test_wheel_thread_runs_callbacks():
+    driver = WheelThread()
+    fired = []
+    start = time.monotonic()
+
+    driver.schedule(start + 0.2, lambda: fired.append("late"))
+    driver.schedule(start + 0.05, lambda: fired.append("early"))
+    cancelled = driver.schedule(start + 0.1, lambda: fired.append("cancelled"))
+    assert driver.cancel(cancelled)
+
+    time.sleep(0.1)
+    assert fired == ["early"]
+    time.sleep(0.2)
+    assert fired == ["early", "late"]
+
+
+def test_failing_callback_does_not_stop_others(wheel: TimerWheel, clock: FakeClock):
+    fired = []
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    wheel.schedule(0.05, fail)
+    wheel.schedule(0.05, lambda: fired.append("after"))
+    clock.now = 0.05
+    assert wheel.expire() == 2
+    assert fired == ["after"]
+
+
+def test_wheel_condition_expires_timed_waiters():
+    lock = Lock()
+    condition = WheelCondition(lock)
+    wheel = shared_wheel_thread()._wheel  # type: ignore[attr-defined]
+    waited = []
+
+    def wait() -> None:
+        with condition:
+            start = time.monotonic()
+            condition.wait(Timer(0.1))
+            waited.append(time.monotonic() - start)
+
+    threads = [Thread(target=wait) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    assert len(wheel) >= 20
+    for thread in threads:
+        thread.join()
+
+    assert len(waited) == 20
+    assert min(waited) >= 0.1 - 1e-3
+    assert not condition._waiters  # type: ignore[attr-defined]
+
+
+def test_wheel_condition_notify_cancels_timer():
+    condition = WheelCondition(Lock())
+    wheel = shared_wheel_thread()._wheel  # type: ignore[attr-defined]
+    woken = []
+
+    def wait() -> None:
+        with condition:
+            condition.wait(Timer(10))
+            woken.append(True)
+
+    thread = Thread(target=wait)
+    thread.start()
+    time.sleep(0.05)
+    pending = len(wheel)
+    with condition:
+        condition.notify()
+    thread.join(1)
+
+    assert woken == [True]
+    assert len(wheel) <= pending - 1
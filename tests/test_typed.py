@@ -0,0 +1,129 @@
+import sys
+import time
+from array import array
+
+import pytest
+
+from tsdeque.exceptions import PartialPutError
+from tsdeque.typed import TypedThreadSafeDeque, _as_view
+
+
+@pytest.fixture(params=[0, 4])
+def typed_deque(request) -> TypedThreadSafeDeque:
+    return TypedThreadSafeDeque("float64", maxsize=request.param)
+
+
+def test_scalar_operations(typed_deque: TypedThreadSafeDeque):
+    typed_deque.put(1.5)
+    typed_deque.putleft(0.5)
+    typed_deque.put(2)
+
+    assert len(typed_deque) == 3
+    assert typed_deque.getleft() == 0.5
+    assert typed_deque.get() == 2.0
+    assert typed_deque.tasks_count() == 3
+
+    with pytest.raises(TypeError):
+        typed_deque.put("x")
+    assert len(typed_deque) == 1
+    assert typed_deque.tasks_count() == 3
+
+
+def test_array_round_trip(typed_deque: TypedThreadSafeDeque):
+    typed_deque.put_array(array("d", [1, 2, 3]))
+    assert typed_deque.getleft_array(10) == array("d", [1, 2, 3])
+
+    typed_deque.put_array([1, 2])
+    typed_deque.putleft_array((3.0, 4.0))
+    assert typed_deque.get_array(3) == array("d", [2, 1, 3])
+    assert typed_deque.getleft() == 4.0
+    assert typed_deque.tasks_count() == 7
+
+
+def test_array_ops_wrap_around(typed_deque: TypedThreadSafeDeque):
+    for i in range(30):
+        values = [i, i + 0.25, i + 0.5]
+        typed_deque.put_array(values)
+        assert list(typed_deque._deque) == values
+
+        if i % 2:
+            assert list(typed_deque.getleft_array(2)) == values[:2]
+            assert list(typed_deque.getleft_array(2)) == values[2:]
+        else:
+            assert list(typed_deque.get_array(2)) == values[:0:-1]
+            assert list(typed_deque.get_array(2)) == values[:1]
+
+
+def test_unbounded_storage_grows():
+    dq = TypedThreadSafeDeque("int64")
+    dq.put_array(range(1000))
+    dq.putleft_array(range(-1, -101, -1))
+
+    assert len(dq) == 1100
+    assert dq.getleft_array(2000) == array("q", range(-100, 1000))
+
+
+def test_bounded_put_array_times_out():
+    dq = TypedThreadSafeDeque("int32", maxsize=3)
+
+    with pytest.raises(PartialPutError) as error:
+        dq.put_array(array("i", range(5)), timeout=0.05)
+
+    assert error.value.inserted == 3
+    assert dq.get_array(5) == array("i", [2, 1, 0])
+
+
+def test_buffer_formats():
+    dq = TypedThreadSafeDeque("d")
+    ints = array("i", [1, 2])
+    dq.put_array(ints)
+    dq.put_array(memoryview(array("d", [3.0, 4.0, 5.0, 6.0])).cast("B").cast("d", (2, 2)))
+
+    assert dq.getleft_array(10) == array("d", [1, 2, 3, 4, 5, 6])
+    with pytest.raises(TypeError):
+        dq.put_array(memoryview(bytes(8)).cast("i", (1, 2)))
+
+
+@pytest.mark.skipif(array("l").itemsize != 8, reason="long is not 64-bit here")
+def test_same_size_formats_are_viewed_without_copy():
+    longs = array("l", [-1, 2, 3])
+    dq = TypedThreadSafeDeque("int64")
+
+    assert _as_view(longs, "q").obj is longs
+    dq.put_array(longs)
+    assert dq.getleft_array(10) == array("q", [-1, 2, 3])
+
+
+def test_dtype_resolution():
+    assert TypedThreadSafeDeque("float32").typecode == "f"
+    assert TypedThreadSafeDeque("q").typecode == "q"
+
+    with pytest.raises(ValueError):
+        TypedThreadSafeDeque("complex128")
+
+
+def test_memory_per_item():
+    dq = TypedThreadSafeDeque("float64", maxsize=1000)
+    size = sys.getsizeof(dq._deque._items)  # type: ignore[attr-defined]
+
+    assert size < 1000 * 8 + 100
+
+
+def test_lease_expiry_into_full_bounded_ring():
+    dq = TypedThreadSafeDeque("int64", maxsize=2)
+    dq.put_many([1, 2])
+    dq.get_with_ack(lease=0.02)
+    dq.put(3)
+    dq.put_after(4, 0.02)
+
+    deadline = time.monotonic() + 1
+    while len(dq) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(dq) == 4
+    assert dq.tasks_count() == 4
+    assert sorted(dq.get_many(10)) == [1, 2, 3, 4]
+
+
+def test_spill_to_disk_is_rejected():
+    with pytest.raises(ValueError):
+        TypedThreadSafeDeque("int64", maxsize=2, overflow="spill_to_disk")
@@ -0,0 +1,252 @@
+import asyncio
+import os
+from threading import Thread
+
+import pytest
+
+from tsdeque.aio import AsyncThreadSafeDeque
+from tsdeque.exceptions import DequeShutDown
+from tsdeque.wal import DurableThreadSafeDeque
+
+
+@pytest.fixture
+def path(tmp_path) -> str:
+    return str(tmp_path / "queue.wal")
+
+
+def test_items_survive_reopen(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="always")
+    for i in range(5):
+        dq.put(i)
+    dq.putleft(-1)
+    dq.put_many([5, 6])
+    assert dq.getleft() == -1
+    assert dq.get() == 6
+    dq.task_done(2)
+    # No close: the process "crashes" here.
+
+    recovered = DurableThreadSafeDeque(path)
+    assert recovered.get_many(10) == [0, 1, 2, 3, 4, 5][::-1]
+    assert recovered.tasks_count() == 6
+    recovered.shutdown(immediate=True)
+
+
+def test_in_flight_items_are_redelivered_first(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="never")
+    dq.put_many(range(6))
+    assert dq.getleft() == 0
+    assert dq.getleft() == 1
+    assert dq.getleft() == 2
+    dq.task_done()
+    assert dq.in_flight_count() == 2
+
+    recovered = DurableThreadSafeDeque(path)
+    assert recovered.in_flight_count() == 0
+    assert recovered.tasks_count() == 5
+    assert recovered.getleft_many(10) == [1, 2, 3, 4, 5]
+    recovered.shutdown(immediate=True)
+
+
+def test_task_done_retires_items_of_calling_thread(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="never")
+    dq.put_many(["main", "worker"])
+    assert dq.getleft() == "main"
+
+    def work() -> None:
+        assert dq.getleft() == "worker"
+        dq.task_done()
+
+    thread = Thread(target=work)
+    thread.start()
+    thread.join()
+
+    recovered = DurableThreadSafeDeque(path)
+    assert recovered.getleft_many(10) == ["main"]
+    recovered.shutdown(immediate=True)
+
+
+def test_task_done_falls_back_to_oldest_in_flight(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="never")
+    dq.put_many(["a", "b"])
+
+    def work() -> None:
+        dq.getleft()
+        dq.getleft()
+
+    thread = Thread(target=work)
+    thread.start()
+    thread.join()
+    dq.task_done()
+
+    recovered = DurableThreadSafeDeque(path)
+    assert recovered.getleft_many(10) == ["b"]
+    recovered.shutdown(immediate=True)
+
+
+def test_torn_tail_is_discarded(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="always")
+    dq.put_many(["a", "b", "c"])
+    dq.shutdown(immediate=True)
+    size = os.path.getsize(path)
+
+    with open(path, "ab") as file:
+        file.write(b"\x01\x02\x03torn")
+    recovered = DurableThreadSafeDeque(path, fsync="always")
+    assert os.path.getsize(path) <= size
+    assert list(recovered.get_many(10)) == ["c", "b", "a"]
+    recovered.shutdown(immediate=True)
+
+
+def test_corrupted_record_stops_replay(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="always")
+    dq.put("kept")
+    size = os.path.getsize(path)
+    dq.put("lost")
+    dq.shutdown(immediate=True)
+
+    with open(path, "r+b") as file:
+        file.seek(size + 20)
+        file.write(b"\xff")
+    recovered = DurableThreadSafeDeque(path)
+    assert recovered.get_many(10) == ["kept"]
+    recovered.shutdown(immediate=True)
+
+
+def test_interval_policy_defers_writes(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="interval", fsync_interval=3600)
+    dq.put("buffered")
+    assert os.path.getsize(path) == 0
+
+    dq.flush()
+    assert os.path.getsize(path) > 0
+    recovered = DurableThreadSafeDeque(path)
+    assert recovered.get() == "buffered"
+    recovered.shutdown(immediate=True)
+
+
+def test_close_flushes_buffered_operations(path: str):
+    with DurableThreadSafeDeque(path, fsync_interval=3600) as dq:
+        dq.put_many(range(100))
+
+    with DurableThreadSafeDeque(path) as recovered:
+        assert len(recovered) == 100
+
+
+def test_compaction_bounds_log_size(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="never", compact_threshold=4096)
+    for i in range(2000):
+        dq.put(i)
+        dq.get()
+        dq.task_done()
+    dq.put("last")
+    assert os.path.getsize(path) < 3 * 4096
+    dq.shutdown(immediate=True)
+
+    with DurableThreadSafeDeque(path) as recovered:
+        assert recovered.get_many(10) == ["last"]
+
+
+def test_clear_is_logged(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="always")
+    dq.put_many([1, 2, 3])
+    dq.clear()
+    dq.put(4)
+
+    with DurableThreadSafeDeque(path) as recovered:
+        assert recovered.get_many(10) == [4]
+        assert recovered.tasks_count() == 1
+
+
+def test_concurrent_producers_share_commits(path: str):
+    dq = DurableThreadSafeDeque(path, fsync="always")
+
+    def produce(base: int) -> None:
+        for i in range(200):
+            dq.put(base + i)
+
+    threads = [Thread(target=produce, args=(k * 1000,)) for k in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with DurableThreadSafeDeque(path) as recovered:
+        items = recovered.getleft_many(1000)
+    assert sorted(items) == sorted(k * 1000 + i for k in range(4) for i in range(200))
+    for k in range(4):
+        own = [item for item in items if k * 1000 <= item < (k + 1) * 1000]
+        assert own == sorted(own)
+
+
+def test_iteration_and_async_paths_commit(path: str, monkeypatch):
+    dq = DurableThreadSafeDeque(path, fsync="always")
+    synced = []
+    fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or fsync(fd))
+
+    dq.put_many(range(4))
+    assert len(synced) == 1
+    chunks = dq.iter(timeout=0, chunk=2, left=True)
+    assert next(chunks) == [0, 1]
+    assert len(synced) == 2
+    lingering = dq.iter(timeout=0, chunk=2, linger=0.01, left=True)
+    assert next(lingering) == [2, 3]
+    assert len(synced) == 3
+
+    async def scenario() -> int:
+        adeque = AsyncThreadSafeDeque(dq)
+        await adeque.aput(4)
+        assert len(synced) == 4
+        return await adeque.aget()
+
+    assert asyncio.run(scenario()) == 4
+    assert len(synced) == 5
+
+    # The iterators were not resumed, so their items are still in flight.
+    with DurableThreadSafeDeque(path) as recovered:
+        # Nothing was marked done, so every item is redelivered.
+        assert recovered.getleft_many(10) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("kwargs", [{"fsync": "sometimes"}, {"fsync_interval": 0}])
+def test_invalid_policy(path: str, kwargs):
+    with pytest.raises(ValueError):
+        DurableThreadSafeDeque(path, **kwargs)
+
+
+def test_dropping_overflow_policy_is_rejected(path: str):
+    with pytest.raises(ValueError):
+        DurableThreadSafeDeque(path, maxsize=2, overflow="drop_oldest")
+
+
+def test_immediate_shutdown_keeps_items_in_log(path: str):
+    dq = DurableThreadSafeDeque(path, fsync_interval=3600)
+    dq.put_many(["a", "b"])
+    dq.shutdown(immediate=True)
+
+    assert len(dq) == 0
+    with pytest.raises(DequeShutDown):
+        dq.get()
+    with DurableThreadSafeDeque(path) as recovered:
+        assert recovered.getleft_many(10) == ["a", "b"]
+
+
+def test_consumer_is_not_supported(path: str):
+    with DurableThreadSafeDeque(path) as dq:
+        with pytest.raises(TypeError):
+            dq.consumer()
+
+
+def test_scheduled_puts_are_not_supported(path: str):
+    with DurableThreadSafeDeque(path) as dq:
+        with pytest.raises(TypeError):
+            dq.put_after("later", 60)
+        assert dq.tasks_count() == 0
+
+
+def test_leases_are_not_supported(path: str):
+    with DurableThreadSafeDeque(path) as dq:
+        dq.put("item")
+        with pytest.raises(TypeError):
+            dq.get_with_ack()
+        assert len(dq) == 1
@@ -0,0 +1,116 @@
+import threading
+import time
+import pytest
+
+from tsdeque.workstealing import WorkStealingPool
+
+
+@pytest.fixture
+def pool():
+    pool = WorkStealingPool(workers=4, seed=0)
+    yield pool
+    pool.shutdown()
+
+
+def test_submit_returns_result(pool: WorkStealingPool):
+    future = pool.submit(lambda a, b: a + b, 1, b=2)
+
+    assert future.result(timeout=1) == 3
+
+
+def test_exception_is_stored_in_future(pool: WorkStealingPool):
+    def fail():
+        raise ValueError("boom")
+
+    future = pool.submit(fail)
+
+    with pytest.raises(ValueError):
+        future.result(timeout=1)
+    # the worker survives the exception
+    assert pool.submit(lambda: 1).result(timeout=1) == 1
+
+
+def test_join_waits_for_recursive_fan_out(pool: WorkStealingPool):
+    visited = []
+    lock = threading.Lock()
+
+    def crawl(depth: int):
+        with lock:
+            visited.append(depth)
+        if depth < 6:
+            pool.submit(crawl, depth + 1)
+            pool.submit(crawl, depth + 1)
+
+    pool.submit(crawl, 0)
+    pool.join(timeout=5)
+
+    assert len(visited) == 2**7 - 1
+
+
+def test_subtasks_stay_on_spawning_worker():
+    pool = WorkStealingPool(workers=1)
+    order = []
+
+    def parent():
+        for i in range(3):
+            pool.submit(order.append, i)
+
+    pool.submit(parent)
+    pool.join(timeout=1)
+    pool.shutdown()
+
+    # a single worker pops its own subtasks LIFO
+    assert order == [2, 1, 0]
+
+
+def test_idle_workers_steal(pool: WorkStealingPool):
+    threads = set()
+    barrier = threading.Barrier(4)
+
+    def blocker():
+        threads.add(threading.get_ident())
+        barrier.wait(timeout=2)
+
+    # all four tasks are spawned by one task onto a single worker's deque
+    def spawner():
+        for _ in range(4):
+            pool.submit(blocker)
+
+    pool.submit(spawner)
+    pool.join(timeout=3)
+
+    assert len(threads) == 4
+
+
+def test_join_timeout(pool: WorkStealingPool):
+    event = threading.Event()
+    pool.submit(event.wait, 1)
+
+    start_time = time.monotonic()
+    pool.join(timeout=0.2)
+    elapsed_time = time.monotonic() - start_time
+    event.set()
+
+    assert elapsed_time == pytest.approx(0.2, rel=0.2)
+
+
+def test_submit_after_shutdown():
+    pool = WorkStealingPool(workers=2)
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
+
+
+def test_shutdown_drains_queued_work():
+    results = []
+    with WorkStealingPool(workers=2) as pool:
+        for i in range(20):
+            pool.submit(results.append, i)
+
+    assert sorted(results) == list(range(20))
+
+
+def test_invalid_workers():
+    with pytest.raises(ValueError):
+        WorkStealingPool(workers=0)
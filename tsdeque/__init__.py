@@ -1,7 +1,29 @@
 from tsdeque.core import ThreadSafeDeque
+from tsdeque.aio import AsyncThreadSafeDeque
+from tsdeque.sharded import ShardedThreadSafeDeque
+from tsdeque.priority import PriorityThreadSafeDeque
+from tsdeque.workstealing import WorkStealingPool
+from tsdeque.shm import SharedMemoryDeque
+from tsdeque.typed import TypedThreadSafeDeque
+from tsdeque.spillable import SpillableThreadSafeDeque
+from tsdeque.wal import DurableThreadSafeDeque
+from tsdeque.coalescing import CoalescingThreadSafeDeque
+from tsdeque.selector import DequeSelector
 from tsdeque.logger import init_logger
 
-__all__ = ["ThreadSafeDeque"]
+__all__ = [
+    "ThreadSafeDeque",
+    "AsyncThreadSafeDeque",
+    "ShardedThreadSafeDeque",
+    "PriorityThreadSafeDeque",
+    "WorkStealingPool",
+    "SharedMemoryDeque",
+    "TypedThreadSafeDeque",
+    "SpillableThreadSafeDeque",
+    "DurableThreadSafeDeque",
+    "CoalescingThreadSafeDeque",
+    "DequeSelector",
+]
 __version__ = "1.0.1"
 
 # init_logger()
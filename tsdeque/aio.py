@@ -0,0 +1,395 @@
+import asyncio
+import time
+from typing import Generic, Optional, TypeVar
+
+import tsdeque.timer as tmr
+from tsdeque.core import ThreadSafeDeque, Waiters
+from tsdeque.exceptions import DequeShutDown
+from tsdeque.ratelimit import TokenBucket
+
+T = TypeVar("T")
+
+
+class _AsyncWaiter:
+    """
+    One-shot waiter that parks a coroutine on a future and is woken from any
+    thread through `loop.call_soon_threadsafe`.
+    """
+
+    __slots__ = ("_loop", "_future", "notified", "abandoned")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initializes the waiter bound to the given event loop.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Loop the waiting coroutine runs on.
+        """
+        self._loop = loop
+        self._future: "asyncio.Future[None]" = loop.create_future()
+        self.notified = False
+        self.abandoned = False
+
+    def notify(self) -> bool:
+        """Schedules the wake-up of the waiting coroutine.
+
+        Called with the deque mutex held, possibly from a foreign thread.
+
+        Returns:
+            bool: False if the waiter was abandoned or its loop is closed.
+        """
+        if self.abandoned:
+            return False
+        try:
+            self._loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            return False
+        self.notified = True
+        return True
+
+    def _wake(self) -> None:
+        """Resolves the future on the loop thread."""
+        if not self._future.done():
+            self._future.set_result(None)
+
+    async def wait(self, timeout: Optional[float]) -> bool:
+        """Waits for a wake-up.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. If None, waits indefinitely.
+
+        Returns:
+            bool: True if woken, False if the timeout elapsed.
+        """
+        if timeout is None:
+            await self._future
+            return True
+        try:
+            await asyncio.wait_for(self._future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+class AsyncThreadSafeDeque(Generic[T]):
+    """
+    Awaitable view over a `ThreadSafeDeque`.
+
+    Shares storage, capacity and task tracking with the wrapped deque, so
+    threads and coroutines can produce and consume through the same queue.
+    Waiting coroutines are parked on futures and woken through
+    `loop.call_soon_threadsafe`; no executor threads are used.
+    """
+
+    def __init__(self, deque: Optional[ThreadSafeDeque[T]] = None) -> None:
+        """
+        Initializes the view.
+
+        Args:
+            deque (Optional[ThreadSafeDeque[T]]): The deque to wrap. If None, a new
+                unbounded deque is created.
+        """
+        self._dq: ThreadSafeDeque[T] = deque if deque is not None else ThreadSafeDeque()
+
+    @property
+    def deque(self) -> ThreadSafeDeque[T]:
+        """Returns the wrapped thread-side deque."""
+        return self._dq
+
+    async def _wait(
+        self,
+        waiter: _AsyncWaiter,
+        deadline: Optional[float],
+        waiters: Waiters,
+        handoff: bool = True,
+    ) -> bool:
+        """
+        Waits on a registered waiter, handing its wake-up over to the next waiter
+        if the coroutine gives up after being notified.
+
+        Args:
+            waiter (_AsyncWaiter): Waiter previously registered in `waiters`.
+            deadline (Optional[float]): Loop time at which waiting stops, or None.
+            waiters (Waiters): The waiters `waiter` was registered in.
+            handoff (bool): Whether to pass a consumed wake-up on to the next
+                waiter when giving up; False if wake-ups are broadcast.
+
+        Returns:
+            bool: True if woken, False if the deadline passed.
+        """
+        loop = asyncio.get_running_loop()
+        timeout = None if deadline is None else max(0.0, deadline - loop.time())
+        try:
+            woken = await waiter.wait(timeout)
+        except BaseException:
+            self._abandon(waiter, waiters, handoff)
+            raise
+        if not woken:
+            self._abandon(waiter, waiters, handoff)
+        return woken
+
+    def _abandon(self, waiter: _AsyncWaiter, waiters: Waiters, handoff: bool) -> None:
+        """
+        Unregisters a waiter that gives up. A wake-up it already received is
+        passed on to the next waiter so that it is not lost.
+
+        Args:
+            waiter (_AsyncWaiter): The waiter to abandon.
+            waiters (Waiters): The waiters it was registered in.
+            handoff (bool): Whether to pass a consumed wake-up on.
+        """
+        dq = self._dq
+        with dq._mutex:
+            waiter.abandoned = True
+            waiters.pop(waiter, None)
+            if handoff and waiter.notified:
+                dq._wake_waiters(waiters, 1)
+
+    async def _throttle(self, limiter: TokenBucket, deadline: Optional[float]) -> None:
+        """
+        Sleeps until `limiter` has a token.
+
+        Args:
+            limiter (TokenBucket): The exhausted bucket.
+            deadline (Optional[float]): Loop time at which waiting stops, or None.
+
+        Raises:
+            TimeoutError: If the deadline passes before a token is available.
+        """
+        loop = asyncio.get_running_loop()
+        delay = limiter.delay()
+        if deadline is not None:
+            if loop.time() >= deadline:
+                self._dq._record_timeout(error=True)
+                raise TimeoutError("The timeout has expired while waiting for the rate limit.")
+            delay = min(delay, deadline - loop.time())
+        started = time.monotonic()
+        await asyncio.sleep(delay)
+        limiter._record_wait(time.monotonic() - started)
+
+    async def _base_aput(self, item: T, timeout: Optional[float], left: bool) -> None:
+        """
+        Internal coroutine inserting an item at either end, waiting for free space.
+
+        Args:
+            item (T): The item to insert.
+            timeout (Optional[float]): Maximum time to wait if the queue is full.
+                If None, waits indefinitely.
+            left (bool): If True, inserts the item at the left end; otherwise, at the right.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for space to become available.
+            DequeFullError: If the queue is full and the overflow policy is "raise_immediately".
+            DequeShutDown: If the deque is shut down.
+        """
+        dq = self._dq
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        limiter = dq._put_limiter
+        while limiter is not None and not dq._shutdown and not limiter.take():
+            await self._throttle(limiter, deadline)
+
+        try:
+            while True:
+                with dq._mutex:
+                    if dq._shutdown:
+                        raise DequeShutDown("The deque was shut down.")
+                    if not dq._is_full():
+                        dq._store(item, left)
+                        return
+                    if dq._overflow != "block":
+                        if dq._make_room(1, left):
+                            dq._store(item, left)
+                        return
+                    waiter = _AsyncWaiter(loop)
+                    dq._put_waiters[waiter] = None
+
+                if not await self._wait(waiter, deadline, dq._put_waiters):
+                    with dq._mutex:
+                        if not dq._is_full():
+                            dq._store(item, left)
+                            return
+                    dq._record_timeout(error=True)
+                    raise TimeoutError(
+                        "The timeout has expired while waiting for available space."
+                    )
+        finally:
+            dq._commit()
+
+    async def _base_aget(self, timeout: Optional[float], left: bool) -> T:
+        """
+        Internal coroutine removing an item from either end, waiting for one to arrive.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait if the queue is empty.
+                If None, waits indefinitely.
+            left (bool): If True, removes the item from the left end; otherwise, from the right.
+
+        Returns:
+            T: The retrieved item.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for an item to become available.
+            DequeShutDown: If the deque is shut down and empty.
+        """
+        dq = self._dq
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        limiter = dq._get_limiter
+        try:
+            while True:
+                with dq._mutex:
+                    if dq._deque:
+                        if limiter is None or limiter.take():
+                            return dq._take(left)
+                        waiter = None
+                    elif dq._shutdown and not dq._scheduled:
+                        raise DequeShutDown("The deque was shut down and is empty.")
+                    else:
+                        waiter = _AsyncWaiter(loop)
+                        dq._get_waiters[waiter] = None
+
+                if waiter is None:
+                    await self._throttle(limiter, deadline)  # type: ignore[arg-type]
+                    continue
+                if not await self._wait(waiter, deadline, dq._get_waiters):
+                    with dq._mutex:
+                        if dq._deque and (limiter is None or limiter.take()):
+                            return dq._take(left)
+                    dq._record_timeout(error=True)
+                    raise TimeoutError("The timeout has expired while waiting for an item.")
+        finally:
+            dq._commit()
+
+    async def aput(self, item: T, timeout: Optional[float] = None) -> None:
+        """
+        Inserts an item at the right end of the queue.
+
+        Args:
+            item (T): The item to insert.
+            timeout (Optional[float]): Maximum time to wait for free space.
+                If None, waits indefinitely.
+
+        Raises:
+            TimeoutError: If the operation times out.
+            DequeFullError: If the queue is full and the overflow policy is
+                "raise_immediately".
+        """
+        await self._base_aput(item=item, timeout=timeout, left=False)
+
+    async def aputleft(self, item: T, timeout: Optional[float] = None) -> None:
+        """
+        Inserts an item at the left end of the queue.
+
+        Args:
+            item (T): The item to insert.
+            timeout (Optional[float]): Maximum time to wait for free space.
+                If None, waits indefinitely.
+
+        Raises:
+            TimeoutError: If the operation times out.
+            DequeFullError: If the queue is full and the overflow policy is
+                "raise_immediately".
+        """
+        await self._base_aput(item=item, timeout=timeout, left=True)
+
+    async def aget(self, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns an item from the right end of the queue.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+
+        Returns:
+            T: The retrieved item.
+
+        Raises:
+            TimeoutError: If the operation times out.
+        """
+        return await self._base_aget(timeout=timeout, left=False)
+
+    async def agetleft(self, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns an item from the left end of the queue.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+
+        Returns:
+            T: The retrieved item.
+
+        Raises:
+            TimeoutError: If the operation times out.
+        """
+        return await self._base_aget(timeout=timeout, left=True)
+
+    async def ajoin(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits until all items in the queue have been marked as done via `task_done`.
+        Like `ThreadSafeDeque.join`, returns silently when the timeout elapses.
+        Items buffered by producer handles are flushed if that needs no waiting;
+        otherwise their timed flush delivers them.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait. If None, waits indefinitely.
+        """
+        dq = self._dq
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        if dq._producers:
+            dq._flush_producers(tmr.Timer(0), False)
+
+        while True:
+            with dq._mutex:
+                if dq._unfinished_tasks == 0:
+                    return
+                waiter = _AsyncWaiter(loop)
+                dq._join_waiters[waiter] = None
+
+            if not await self._wait(waiter, deadline, dq._join_waiters, handoff=False):
+                dq._record_timeout(error=False)
+                return
+
+    def close(self) -> None:
+        """Stops accepting new items. See `ThreadSafeDeque.close`."""
+        self._dq.close()
+
+    def shutdown(self, immediate: bool = False) -> None:
+        """
+        Shuts the deque down. See `ThreadSafeDeque.shutdown`.
+
+        Args:
+            immediate (bool): If True, also discards all queued items.
+        """
+        self._dq.shutdown(immediate)
+
+    def task_done(self, count: int = 1) -> None:
+        """
+        Marks previously retrieved tasks as complete. See `ThreadSafeDeque.task_done`.
+
+        Args:
+            count (int): Number of completed tasks. Defaults to 1.
+        """
+        self._dq.task_done(count)
+
+    def tasks_count(self) -> int:
+        """
+        Returns the current number of active tasks.
+
+        Returns:
+            int: The number of unfinished tasks.
+        """
+        return self._dq.tasks_count()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items currently stored in the queue.
+
+        Returns:
+            int: The number of items in the queue.
+        """
+        return len(self._dq)
@@ -0,0 +1,226 @@
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, List, Optional, TypeVar
+
+from tsdeque.core import ThreadSafeDeque
+from tsdeque.exceptions import DequeShutDown
+
+T = TypeVar("T")
+
+# Key of a cell whose item was moved to the left end.
+_TOMBSTONE = object()
+
+
+class _CoalescingStorage:
+    """
+    Deque storage holding at most one item per key.
+
+    Items live in mutable ``[key, item]`` cells indexed by key, so finding and
+    updating a queued item is O(1). Moving an item to the left end leaves a
+    tombstone in its old cell, which is skipped when it reaches either end;
+    tombstones are purged once they outnumber live items.
+    """
+
+    def __init__(self, key: Callable[[Any], Hashable], replace: bool) -> None:
+        self._key = key
+        self._replace = replace
+        self._cells: Deque[List[Any]] = deque()
+        self._index: Dict[Hashable, List[Any]] = {}
+        self._tombstones = 0
+        # Total number of coalesced puts, and those not yet seen by the deque.
+        self.coalesced = 0
+        self.pending = 0
+
+    def coalesce(self, item: Any, left: bool) -> bool:
+        """
+        Merges an item into the queued item with the same key, if any.
+
+        A duplicate put at the right end keeps the queued item's position; one
+        at the left end moves it to the left end. The payload is replaced only
+        if the storage was created with ``replace=True``.
+
+        Args:
+            item (Any): The item being put.
+            left (bool): Whether it is being put at the left end.
+
+        Returns:
+            bool: True if the item was merged; False if its key is not queued.
+        """
+        key = self._key(item)
+        cell = self._index.get(key)
+        if cell is None:
+            return False
+        payload = item if self._replace else cell[1]
+        if left:
+            cell[0] = _TOMBSTONE
+            cell[1] = None
+            cell = [key, payload]
+            self._cells.appendleft(cell)
+            self._index[key] = cell
+            self._tombstones += 1
+            if self._tombstones > len(self._index):
+                self._purge()
+        else:
+            cell[1] = payload
+        self.coalesced += 1
+        return True
+
+    def _purge(self) -> None:
+        """Drops all tombstones."""
+        self._cells = deque(cell for cell in self._cells if cell[0] is not _TOMBSTONE)
+        self._tombstones = 0
+
+    def _add(self, item: Any, left: bool) -> None:
+        if self.coalesce(item, left):
+            self.pending += 1
+            return
+        key = self._key(item)
+        cell = [key, item]
+        self._index[key] = cell
+        if left:
+            self._cells.appendleft(cell)
+        else:
+            self._cells.append(cell)
+
+    def _remove(self, left: bool) -> Any:
+        pop = self._cells.popleft if left else self._cells.pop
+        while True:
+            key, item = pop()
+            if key is not _TOMBSTONE:
+                del self._index[key]
+                return item
+            self._tombstones -= 1
+
+    def append(self, item: Any) -> None:
+        self._add(item, left=False)
+
+    def appendleft(self, item: Any) -> None:
+        self._add(item, left=True)
+
+    def extend(self, items: Any) -> None:
+        for item in items:
+            self._add(item, left=False)
+
+    def extendleft(self, items: Any) -> None:
+        for item in items:
+            self._add(item, left=True)
+
+    def pop(self) -> Any:
+        if not self._index:
+            raise IndexError("pop from an empty deque")
+        return self._remove(left=False)
+
+    def popleft(self) -> Any:
+        if not self._index:
+            raise IndexError("pop from an empty deque")
+        return self._remove(left=True)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._index.clear()
+        self._tombstones = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for key, item in self._cells:
+            if key is not _TOMBSTONE:
+                yield item
+
+
+class CoalescingThreadSafeDeque(ThreadSafeDeque[T]):
+    """
+    A `ThreadSafeDeque` that holds at most one queued item per key.
+
+    Putting an item whose key is already queued does not add a new item. With
+    ``replace=False`` (default) the new item is dropped; with ``replace=True``
+    it replaces the queued payload. A duplicate put at the right end keeps the
+    queued item's position, while a duplicate `putleft` moves it to the left
+    end. Both are O(1).
+
+    A coalesced put adds no task, so `tasks_count` and `join` count only the
+    items consumers will actually receive. A duplicate `put`/`putleft` into a
+    full queue is coalesced without waiting for space; batch puts still wait.
+    """
+
+    def __init__(
+        self,
+        key: Optional[Callable[[T], Hashable]] = None,
+        replace: bool = False,
+        maxsize: int = 0,
+        **kwargs: Any,
+    ):
+        """
+        Initializes the deque.
+
+        Args:
+            key (Optional[Callable[[T], Hashable]]): Function computing an item's
+                key. Defaults to the item itself, which must then be hashable.
+            replace (bool): If True, a duplicate put replaces the queued payload;
+                otherwise it is dropped.
+            maxsize (int): Maximum number of queued items. If 0, the queue is unbounded.
+            **kwargs (Any): Further options forwarded to `ThreadSafeDeque`.
+
+        Raises:
+            ValueError: If maxsize is negative or the overflow policy is "spill_to_disk".
+        """
+        if kwargs.get("overflow") == "spill_to_disk":
+            raise ValueError("Coalescing deques cannot spill to disk.")
+
+        storage = _CoalescingStorage(key if key is not None else _identity, replace)
+        super().__init__(maxsize, storage=lambda size: storage, **kwargs)
+
+    def _items_added(self, count: int, left: bool) -> None:
+        storage: _CoalescingStorage = self._deque  # type: ignore[assignment]
+        if storage.pending:
+            count -= storage.pending
+            storage.pending = 0
+            if not count:
+                return
+        super()._items_added(count, left)
+
+    def _settle_coalesced(self) -> None:
+        """
+        Finishes the tasks of items merged while being requeued or promoted
+        from the schedule; their tasks were registered earlier. Must be called
+        with `_mutex` held.
+        """
+        storage: _CoalescingStorage = self._deque  # type: ignore[assignment]
+        if storage.pending:
+            count, storage.pending = storage.pending, 0
+            self._remove_tasks(count)
+
+    def _requeue(self, item: T, left: bool) -> None:
+        super()._requeue(item, left)
+        self._settle_coalesced()
+
+    def _promote_due(self) -> None:
+        super()._promote_due()
+        self._settle_coalesced()
+
+    def _base_put(
+        self, item: T, timeout: Optional[float], left: bool, deadline: Optional[float] = None
+    ) -> None:
+        # Unlocked peek: only a put into a full queue needs a separate check
+        # that lets duplicates through without waiting for space.
+        if self._limitation and self._is_full():
+            with self._mutex:
+                if self._shutdown:
+                    raise DequeShutDown("The deque was shut down.")
+                if self._deque.coalesce(item, left):  # type: ignore[attr-defined]
+                    return
+        super()._base_put(item, timeout, left, deadline)
+
+    def coalesced_count(self) -> int:
+        """
+        Returns the number of puts merged into an already queued item.
+
+        Returns:
+            int: Total number of coalesced puts.
+        """
+        with self._mutex:
+            return self._deque.coalesced  # type: ignore[attr-defined]
+
+
+def _identity(item: Any) -> Any:
+    return item
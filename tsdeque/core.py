@@ -1,14 +1,49 @@
-from collections import deque
-from threading import Lock
-from typing import Generic, TypeVar, Deque, Optional
+import heapq
+import time
+from collections import OrderedDict, deque
+from threading import Lock, Condition
+from typing import (
+    Any, Callable, Generic, TypeVar, Deque, Dict, Optional, Iterable, Iterator, List, Protocol,
+    Sequence, Set, Tuple, Union,
+)
 
 import tsdeque.timer as tmr
 from tsdeque.devent import Devent
-from tsdeque.counter import Counter, Threshold, LowThresholdError
-from tsdeque.exceptions import NoActiveTaskError
+from tsdeque.handles import Consumer, Producer
+from tsdeque.ratelimit import TokenBucket
+from tsdeque.stats import DequeStats, StatsCollector, TimedLock
+from tsdeque.spill import SegmentStore, SpillingStorage
+from tsdeque.storage import Storage, StorageFactory, make_storage
+from tsdeque.exceptions import (
+    DequeFullError, DequeShutDown, LeaseError, NoActiveTaskError, PartialPutError,
+)
 
 T = TypeVar("T")
 
+OVERFLOW_POLICIES = (
+    "block",
+    "drop_oldest",
+    "drop_newest",
+    "raise_immediately",
+    "spill_to_disk",
+)
+
+
+class Waiter(Protocol):
+    """One-shot wake-up callback registered by non-thread waiters (e.g. coroutines)."""
+
+    def notify(self) -> bool:
+        """Wakes the waiter. Called with the deque mutex held.
+
+        Returns:
+            bool: False if the waiter was already abandoned and the wake-up was not consumed.
+        """
+
+
+# Registered waiters in registration order. A mapping rather than a deque, so
+# that a waiter giving up can remove itself in O(1).
+Waiters = OrderedDict[Waiter, None]
+
 
 class ThreadSafeDeque(Generic[T]):
     """
@@ -19,39 +54,558 @@ class ThreadSafeDeque(Generic[T]):
     allowing join-style synchronization for task completion.
     """
 
-    def __init__(self, maxsize: int = 0):
+    def __init__(
+        self,
+        maxsize: int = 0,
+        instrument: bool = False,
+        storage: Union[str, StorageFactory] = "deque",
+        overflow: str = "block",
+        spill_directory: Optional[str] = None,
+        get_limiter: Optional[TokenBucket] = None,
+        put_limiter: Optional[TokenBucket] = None,
+    ):
         """
         Initializes the deque.
 
         Args:
             maxsize (int): Maximum number of items allowed in the queue. If 0 or less,
                 the queue is unbounded.
+            instrument (bool): If True, collects operation counters and wait/lock
+                timings, available through `stats`. Off by default.
+            storage (Union[str, StorageFactory]): Item storage: "deque" (default)
+                for a `collections.deque`, "ring" for a preallocated ring buffer
+                of exactly `maxsize` slots, or a factory receiving `maxsize`.
+            overflow (str): What a put does when a bounded queue is full:
+                "block" (default) waits for space; "drop_oldest" evicts the item
+                at the opposite end; "drop_newest" discards the new item;
+                "raise_immediately" raises `DequeFullError`; "spill_to_disk"
+                keeps `maxsize` items in memory and pickles the rest to
+                segment files (see `tsdeque.spill`). Evicted and discarded items are counted by
+                `dropped_count` and carry no task.
+            spill_directory (Optional[str]): Directory of the segment files for
+                "spill_to_disk". Defaults to the platform's temporary directory.
+            get_limiter (Optional[TokenBucket]): Rate limit for taking items; every
+                taken item costs a token and getters wait for tokens like for items.
+            put_limiter (Optional[TokenBucket]): Rate limit for storing items.
 
         Raises:
-            ValueError: If maxsize is negative.
+            ValueError: If maxsize is negative, the storage is invalid, or the
+                overflow policy is unknown or used with an unbounded queue.
         """
-        self._deque: Deque[T] = deque()
-
-        self._mutex = Lock()
-        self._empty_event = Devent()
-
         if maxsize < 0:
             raise ValueError("Queue size cannot be negative.")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow!r}.")
+        if overflow != "block" and maxsize == 0:
+            raise ValueError("Overflow policies require a positive maxsize.")
+
+        self._deque: Storage[T] = make_storage(storage, maxsize)
+        self._maxsize = maxsize
         self._limitation = maxsize > 0
+        self._overflow = overflow
+        self._dropped = 0
 
-        if self._limitation:
-            self._full_event = Devent()
-            self._item_counter = Counter(
-                value=0,
-                high_threshold=Threshold(value=maxsize, event=self._full_event),
-            )
+        if overflow == "spill_to_disk":
+            # Puts never wait: the storage itself moves the overflow to disk.
+            self._deque = SpillingStorage(self._deque, maxsize, SegmentStore(spill_directory))
+            self._limitation = False
 
-        self._tasks_counter = Counter(
-            value=0,
-            low_threshold=Threshold(value=0, event=self._empty_event),
-        )
+        self._stats = StatsCollector() if instrument else None
+
+        # Getters and putters park on these conditions and are woken only
+        # when the number of stored items actually changes.
+        self._mutex = TimedLock(self._stats) if self._stats is not None else Lock()
+        # Timed waits on them expire through the shared timer wheel.
+        self._not_empty = tmr.WheelCondition(self._mutex)
+        self._not_full = tmr.WheelCondition(self._mutex)
+        self._waiting_getters = 0
+        self._waiting_putters = 0
+
+        # Callers out of rate-limit tokens sleep on this condition until the
+        # next token is due. It is never notified, so arriving items do not
+        # wake them early.
+        self._get_limiter = get_limiter
+        self._put_limiter = put_limiter
+        self._throttled = Condition(self._mutex)
+
+        self._shutdown = False
+
+        # Open producer handles, flushed by `join`. Held strongly until
+        # closed, so that items buffered by a dropped handle are not lost.
+        self._producers: Set[Producer[T]] = set()
+
+        # Waiters that are not threads (see `tsdeque.aio`) are woken through
+        # callbacks instead of the conditions above.
+        self._get_waiters: Waiters = OrderedDict()
+        self._put_waiters: Waiters = OrderedDict()
+        self._join_waiters: Waiters = OrderedDict()
+
+        # Persistent callbacks (see `tsdeque.selector`) invoked with the deque
+        # and `_mutex` held whenever the queue goes from empty to non-empty.
+        self._listeners: List[Callable[["ThreadSafeDeque[T]"], object]] = []
+
+        # Task accounting is a plain int guarded by `_mutex`; the event is
+        # touched only when the count crosses zero.
+        self._unfinished_tasks = 0
+        self._empty_event = Devent()
+        self._empty_event.set()
+
+        # Items delivered by `get_with_ack`, by handle: the entry to requeue
+        # (see `_pop_entries`), the end it was taken from and the id of its
+        # expiry timer.
+        self._leases: Dict[int, Tuple[Any, bool, int]] = {}
+        self._next_handle = 1
+
+        # Items of `put_at`/`put_after` waiting for their due time, as a heap
+        # of (due, sequence, item). One timer is armed for the earliest one.
+        self._scheduled: List[Tuple[float, int, T]] = []
+        self._next_sequence = 0
+        self._schedule_timer: Optional[int] = None
+
+    def _add_tasks(self, count: int) -> None:
+        """
+        Registers new unfinished tasks. Must be called with `_mutex` held.
+
+        Args:
+            count (int): Number of tasks to add.
+        """
+        if self._unfinished_tasks == 0 and count > 0:
+            self._empty_event.unset()
+        self._unfinished_tasks += count
+
+    def _remove_tasks(self, count: int) -> None:
+        """
+        Marks unfinished tasks as complete. Must be called with `_mutex` held.
+
+        Args:
+            count (int): Number of tasks to remove.
+
+        Raises:
+            NoActiveTaskError: If there are fewer unfinished tasks than `count`.
+        """
+        if count > self._unfinished_tasks:
+            raise NoActiveTaskError("All tasks have already been completed.")
+        self._unfinished_tasks -= count
+        if self._unfinished_tasks == 0 and count > 0:
+            self._empty_event.set()
+            if self._join_waiters:
+                self._wake_waiters(self._join_waiters, len(self._join_waiters))
+
+    @staticmethod
+    def _wake_waiters(waiters: Waiters, count: int) -> None:
+        """
+        Wakes up to `count` registered waiters, skipping abandoned ones.
+        Must be called with `_mutex` held.
+
+        Args:
+            waiters (Waiters): Waiters in registration order.
+            count (int): Maximum number of waiters to wake.
+        """
+        while count > 0 and waiters:
+            if waiters.popitem(last=False)[0].notify():
+                count -= 1
+
+    def _wait_for_space(self, timer: tmr.AnyTimer) -> None:
+        """
+        Blocks until the queue has room for one more item. Must be called with
+        `_mutex` held.
+
+        Args:
+            timer (AnyTimer): Timer tracking the time left to wait.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for space to become available.
+            DequeShutDown: If the deque is shut down.
+        """
+        stats = self._stats
+        started = time.perf_counter_ns() if stats is not None else 0
+
+        self._waiting_putters += 1
+        try:
+            while len(self._deque) >= self._maxsize:
+                if self._shutdown:
+                    raise DequeShutDown("The deque was shut down.")
+                wait_time = timer.get_spend()
+                if wait_time is not None and wait_time <= 0:
+                    self._record_timeout(error=True)
+                    raise TimeoutError(
+                        "The timeout has expired while waiting for available space."
+                    )
+                self._not_full.wait(timer)
+        finally:
+            self._waiting_putters -= 1
+            if stats is not None:
+                stats.counters().put_wait.record(time.perf_counter_ns() - started)
+
+    def _wait_for_item(self, timer: tmr.AnyTimer) -> None:
+        """
+        Blocks until the queue holds at least one item. Must be called with
+        `_mutex` held.
+
+        Args:
+            timer (AnyTimer): Timer tracking the time left to wait.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for an item to become available.
+            DequeShutDown: If the deque is shut down and empty.
+        """
+        stats = self._stats
+        started = time.perf_counter_ns() if stats is not None else 0
+
+        self._waiting_getters += 1
+        try:
+            while not self._deque:
+                # Items scheduled before a shutdown are still delivered.
+                if self._shutdown and not self._scheduled:
+                    raise DequeShutDown("The deque was shut down and is empty.")
+                wait_time = timer.get_spend()
+                if wait_time is not None and wait_time <= 0:
+                    self._record_timeout(error=True)
+                    raise TimeoutError(
+                        "The timeout has expired while waiting for an item."
+                    )
+                self._not_empty.wait(timer)
+        finally:
+            self._waiting_getters -= 1
+            if stats is not None:
+                stats.counters().get_wait.record(time.perf_counter_ns() - started)
+
+    def _wait_for_token(self, limiter: TokenBucket, timer: tmr.AnyTimer) -> None:
+        """
+        Sleeps until `limiter` has a token. Must be called with `_mutex` held;
+        it is released while sleeping, so the caller must recheck the queue.
+
+        Args:
+            limiter (TokenBucket): The exhausted bucket.
+            timer (AnyTimer): Timer tracking the time left to wait.
+
+        Raises:
+            TimeoutError: If the timeout is reached before a token is available.
+        """
+        delay = limiter.delay()
+        wait_time = timer.get_spend()
+        if wait_time is not None:
+            if wait_time <= 0:
+                self._record_timeout(error=True)
+                raise TimeoutError("The timeout has expired while waiting for the rate limit.")
+            delay = min(delay, wait_time)
+        started = time.monotonic()
+        self._throttled.wait(delay)
+        limiter._record_wait(time.monotonic() - started)
+
+    def _take_get_tokens(self, count: int, timer: tmr.AnyTimer) -> int:
+        """
+        Waits until the queue holds an item and the get limiter grants a token.
+        Must be called with `_mutex` held.
+
+        Args:
+            count (int): Maximum number of items the caller wants to take.
+            timer (AnyTimer): Timer tracking the time left to wait.
+
+        Returns:
+            int: Number of items the caller may take, at least 1 and at most
+                the number of stored items.
+
+        Raises:
+            TimeoutError: If the timeout is reached first.
+        """
+        limiter = self._get_limiter
+        while True:
+            if not self._deque:
+                self._wait_for_item(timer)
+            granted = limiter.take(min(count, len(self._deque)))  # type: ignore[union-attr]
+            if granted:
+                return granted
+            self._wait_for_token(limiter, timer)  # type: ignore[arg-type]
+
+    def _take_put_tokens(self, count: int, timer: tmr.AnyTimer) -> int:
+        """
+        Waits until the put limiter grants at least one of `count` tokens.
+        Must be called with `_mutex` held.
+
+        Args:
+            count (int): Number of items the caller wants to store.
+            timer (AnyTimer): Timer tracking the time left to wait.
+
+        Returns:
+            int: Number of items the caller may store.
+
+        Raises:
+            TimeoutError: If the timeout is reached first.
+        """
+        limiter = self._put_limiter
+        while True:
+            if self._shutdown:
+                raise DequeShutDown("The deque was shut down.")
+            granted = limiter.take(count)  # type: ignore[union-attr]
+            if granted:
+                return granted
+            self._wait_for_token(limiter, timer)  # type: ignore[arg-type]
 
-    def _base_put(self, item: T, timeout: Optional[float], left: bool) -> None:
+    def _record_timeout(self, error: bool) -> None:
+        """
+        Counts an expired wait when instrumentation is enabled.
+
+        Args:
+            error (bool): Whether the expiry is reported to the caller as a `TimeoutError`.
+        """
+        if self._stats is not None:
+            counters = self._stats.counters()
+            counters.timeouts += 1
+            if error:
+                counters.timeout_errors += 1
+
+    def _items_added(self, count: int, left: bool) -> None:
+        """
+        Accounts for items that were just stored and wakes parked getters.
+        Must be called with `_mutex` held.
+
+        Args:
+            count (int): Number of stored items.
+            left (bool): Whether the items were stored at the left end.
+        """
+        if self._stats is not None:
+            counters = self._stats.counters()
+            if left:
+                counters.puts_left += count
+            else:
+                counters.puts_right += count
+            if len(self._deque) > counters.high_water_mark:
+                counters.high_water_mark = len(self._deque)
+
+        self._add_tasks(count)
+        self._wake_getters(count)
+
+    def _wake_getters(self, count: int) -> None:
+        """
+        Wakes up to `count` parked getters. Must be called with `_mutex` held.
+
+        Args:
+            count (int): Number of items that became available.
+        """
+        if self._waiting_getters:
+            self._not_empty.notify(count)
+        if self._get_waiters:
+            self._wake_waiters(self._get_waiters, count)
+        if self._listeners and len(self._deque) == count:
+            for listener in self._listeners:
+                listener(self)
+
+    def _items_removed(self, count: int, left: bool) -> None:
+        """
+        Wakes parked putters after items were taken out of the storage.
+        Must be called with `_mutex` held.
+
+        Args:
+            count (int): Number of removed items.
+            left (bool): Whether the items were taken from the left end.
+        """
+        if self._stats is not None:
+            counters = self._stats.counters()
+            if left:
+                counters.gets_left += count
+            else:
+                counters.gets_right += count
+
+        if self._waiting_putters:
+            self._not_full.notify(count)
+        if self._put_waiters:
+            self._wake_waiters(self._put_waiters, count)
+
+    def _is_full(self) -> bool:
+        """
+        Checks whether a bounded queue has reached its capacity.
+        Must be called with `_mutex` held.
+
+        Returns:
+            bool: True if no more items can be stored right now.
+        """
+        return self._limitation and len(self._deque) >= self._maxsize
+
+    def _make_room(self, count: int, left: bool, inserted: int = 0) -> bool:
+        """
+        Applies the overflow policy to a full queue. Must be called with `_mutex` held.
+
+        Args:
+            count (int): Number of items waiting to be stored.
+            left (bool): End the items are going to be stored at.
+            inserted (int): Number of items of the current batch already stored.
+
+        Returns:
+            bool: True if room was made; False if the items were discarded.
+
+        Raises:
+            DequeFullError: If the policy is "raise_immediately".
+        """
+        policy = self._overflow
+        if policy == "drop_oldest":
+            count = min(count, len(self._deque))
+            self._evict(count, left)
+            self._dropped += count
+            self._remove_tasks(count)
+            return True
+        if policy == "drop_newest":
+            self._dropped += count
+            return False
+        raise DequeFullError("The queue is full.", inserted=inserted)
+
+    def _evict(self, count: int, left: bool) -> None:
+        """
+        Discards `count` items for the "drop_oldest" policy, from the end
+        opposite to the one new items are stored at. Must be called with
+        `_mutex` held.
+
+        Args:
+            count (int): Number of items to discard; at most `len(self._deque)`.
+            left (bool): End the new items are going to be stored at.
+        """
+        evict = self._deque.pop if left else self._deque.popleft
+        for _ in range(count):
+            evict()
+
+    def _store(self, item: T, left: bool) -> None:
+        """
+        Stores a single item and updates accounting. The caller must ensure
+        there is room for it. Must be called with `_mutex` held.
+
+        Args:
+            item (T): The item to store.
+            left (bool): If True, stores the item at the left end; otherwise, at the right.
+        """
+        if left:
+            self._deque.appendleft(item)
+        else:
+            self._deque.append(item)
+        self._items_added(1, left)
+
+    def _take(self, left: bool) -> T:
+        """
+        Removes a single item and updates accounting. The caller must ensure
+        the queue is not empty. Must be called with `_mutex` held.
+
+        Args:
+            left (bool): If True, removes the item from the left end; otherwise, from the right.
+
+        Returns:
+            T: The removed item.
+        """
+        if left:
+            item = self._deque.popleft()
+        else:
+            item = self._deque.pop()
+        self._items_removed(1, left)
+        return item
+
+    def _requeue(self, item: Any, left: bool) -> None:
+        """
+        Returns a delivered item to the queue for redelivery. The item keeps its
+        unfinished task and is stored even if the queue is full, so that it is
+        never lost. Must be called with `_mutex` held.
+
+        Args:
+            item (Any): The entry `_pop_entries` returned for the item.
+            left (bool): If True, stores the item at the left end; otherwise, at the right.
+        """
+        self._reserve_storage(1)
+        if left:
+            self._deque.appendleft(item)
+        else:
+            self._deque.append(item)
+        self._wake_getters(1)
+
+    def _commit(self) -> None:
+        """
+        Makes the changes of the calling thread durable. Called without
+        `_mutex` by callers that store or take items through `_store` and
+        `_take` directly; a no-op unless the storage is persistent.
+        """
+
+    def _reserve_storage(self, count: int) -> None:
+        """
+        Lets a fixed-capacity storage hold `count` more items, for items stored
+        past `maxsize`. Must be called with `_mutex` held.
+
+        Args:
+            count (int): Number of items about to be stored.
+        """
+        reserve = getattr(self._deque, "reserve", None)
+        if reserve is not None:
+            reserve(count)
+
+    def _expire_lease(self, handle: int) -> None:
+        """
+        Requeues a leased item at the end it was taken from once its lease
+        runs out. Called by the timer thread.
+
+        Args:
+            handle (int): Handle of the lease.
+        """
+        with self._mutex:
+            lease = self._leases.pop(handle, None)
+            if lease is not None:
+                self._requeue(lease[0], lease[1])
+
+    def _release_lease(self, handle: int) -> Tuple[Any, bool, int]:
+        """
+        Removes a lease from the in-flight table and cancels its expiry.
+        Must be called with `_mutex` held.
+
+        Args:
+            handle (int): Handle returned by `get_with_ack`.
+
+        Returns:
+            Tuple[Any, bool, int]: The entry to requeue, the end it was taken
+                from and its timer id.
+
+        Raises:
+            LeaseError: If the handle is unknown, already acknowledged or expired.
+        """
+        lease = self._leases.pop(handle, None)
+        if lease is None:
+            raise LeaseError(f"No active lease for handle {handle}.")
+        tmr.shared_wheel_thread().cancel(lease[2])
+        return lease
+
+    def _promote_due(self) -> None:
+        """
+        Moves scheduled items whose due time has passed to the right end of the
+        queue. Their tasks were registered when they were scheduled. Must be
+        called with `_mutex` held.
+        """
+        scheduled = self._scheduled
+        now = time.monotonic()
+        due = []
+        while scheduled and scheduled[0][0] <= now:
+            due.append(heapq.heappop(scheduled)[2])
+        if due:
+            self._reserve_storage(len(due))
+            for item in due:
+                self._deque.append(item)
+            self._wake_getters(len(due))
+
+    def _arm_schedule_timer(self) -> None:
+        """
+        Points the timer at the earliest scheduled item, replacing a timer set
+        for a later one. Must be called with `_mutex` held.
+        """
+        wheel = tmr.shared_wheel_thread()
+        if self._schedule_timer is not None:
+            wheel.cancel(self._schedule_timer)
+            self._schedule_timer = None
+        if self._scheduled:
+            self._schedule_timer = wheel.schedule(self._scheduled[0][0], self._on_schedule_timer)
+
+    def _on_schedule_timer(self) -> None:
+        """Promotes due items and rearms the timer. Called by the timer thread."""
+        with self._mutex:
+            self._schedule_timer = None
+            self._promote_due()
+            if self._scheduled and self._schedule_timer is None:
+                self._arm_schedule_timer()
+
+    def _base_put(
+        self, item: T, timeout: Optional[float], left: bool, deadline: Optional[float] = None
+    ) -> None:
         """
         Internal method to insert an item into the queue from either end,
         respecting optional timeout and capacity limits.
@@ -61,72 +615,354 @@ class ThreadSafeDeque(Generic[T]):
             timeout (Optional[float]): Maximum time to wait if the queue is full.
                 If None, the method blocks indefinitely.
             left (bool): If True, inserts the item at the left end; otherwise, at the right.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
 
         Raises:
+            ValueError: If both a timeout and a deadline are given.
             TimeoutError: If the timeout is reached while waiting for space to become available.
+            DequeFullError: If the queue is full and the overflow policy is "raise_immediately".
         """
-        if self._limitation:
-            timer = tmr.get_timer(timeout)
+        if deadline is not None and timeout is not None:
+            raise ValueError("Specify either a timeout or a deadline, not both.")
+        with self._mutex:
+            if self._shutdown:
+                raise DequeShutDown("The deque was shut down.")
+            timer = None
+            if self._put_limiter is not None:
+                timer = tmr.get_timer(timeout, deadline)
+                self._take_put_tokens(1, timer)
+            if self._is_full():
+                if self._overflow != "block":
+                    if not self._make_room(1, left):
+                        return
+                else:
+                    self._wait_for_space(timer or tmr.get_timer(timeout, deadline))
 
-        while True:
-            if self._limitation:
-                wait_time = timer.get_spend()  # type: ignore
-                if not self._full_event.wait_unset(wait_time):
-                    raise TimeoutError(
-                        "The timeout has expired while waiting for available space."
-                    )
+            self._store(item, left)
+
+    def _base_get(
+        self, timeout: Optional[float], left: bool, deadline: Optional[float] = None
+    ) -> T:
+        """
+        Internal method to remove and return an item from the queue from either end,
+        respecting optional timeout and availability constraints.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait if the queue is empty.
+                If None, the method blocks indefinitely.
+            left (bool): If True, removes the item from the left end; otherwise, from the right.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Returns:
+            T: The item retrieved from the queue.
+
+        Raises:
+            ValueError: If both a timeout and a deadline are given.
+            TimeoutError: If the timeout is reached while waiting for an item to become available.
+        """
+        if deadline is not None and timeout is not None:
+            raise ValueError("Specify either a timeout or a deadline, not both.")
+        with self._mutex:
+            if self._scheduled:
+                self._promote_due()
+            if self._get_limiter is not None:
+                self._take_get_tokens(1, tmr.get_timer(timeout, deadline))
+            elif not self._deque:
+                self._wait_for_item(tmr.get_timer(timeout, deadline))
+
+            return self._take(left)
+
+    def _base_put_many(
+        self,
+        items: Iterable[T],
+        timeout: Optional[float],
+        left: bool,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Internal method to insert a batch of items into the queue from either end.
+
+        On an unbounded queue the whole batch is stored under a single lock
+        acquisition. On a bounded queue the batch is stored in as many chunks as
+        free space allows, waiting for consumers between chunks; items of an
+        already stored chunk are immediately visible to consumers.
+
+        Args:
+            items (Iterable[T]): The items to insert, in insertion order.
+            timeout (Optional[float]): Maximum total time to wait for free space.
+                If None, the method blocks indefinitely.
+            left (bool): If True, inserts items at the left end; otherwise, at the right.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
 
-            with self._mutex:
+        Raises:
+            ValueError: If both a timeout and a deadline are given.
+            PartialPutError: If the timeout is reached before the whole batch was
+                stored. Its `inserted` attribute holds the number of stored items.
+        """
+        self._put_batch(list(items), tmr.get_timer(timeout, deadline), left)
+
+    def _put_batch(self, batch: Sequence[T], timer: tmr.AnyTimer, left: bool) -> None:
+        """
+        Stores a sliceable batch in chunks limited by free space (see `_base_put_many`).
+
+        Args:
+            batch (Sequence[T]): The items to insert, in insertion order. Chunks
+                are slices of it handed to the storage's `extend`/`extendleft`.
+            timer (AnyTimer): Timer tracking the total time left to wait.
+            left (bool): If True, inserts items at the left end; otherwise, at the right.
+
+        Raises:
+            PartialPutError: If the timeout is reached before the whole batch was stored.
+            DequeFullError: If the queue fills up and the overflow policy is "raise_immediately".
+        """
+        inserted = 0
+        # Number of items the put limiter lets through before the next token wait.
+        allowance = len(batch) if self._put_limiter is None else 0
+
+        with self._mutex:
+            if self._shutdown:
+                raise DequeShutDown("The deque was shut down.")
+            while inserted < len(batch):
+                if not allowance:
+                    try:
+                        allowance = self._take_put_tokens(len(batch) - inserted, timer)
+                    except TimeoutError:
+                        raise PartialPutError(
+                            "The timeout has expired while waiting for the rate limit.",
+                            inserted=inserted,
+                        ) from None
                 if self._limitation:
-                    if self._full_event.is_set():
+                    free = self._maxsize - len(self._deque)
+                    if free <= 0:
+                        if self._overflow != "block":
+                            count = min(allowance, len(batch) - inserted)
+                            if not self._make_room(count, left, inserted):
+                                return
+                            continue
+                        try:
+                            self._wait_for_space(timer)
+                        except TimeoutError:
+                            raise PartialPutError(
+                                "The timeout has expired while waiting for available space.",
+                                inserted=inserted,
+                            ) from None
                         continue
+                    chunk = batch[inserted : inserted + min(free, allowance)]
+                elif inserted or allowance < len(batch):
+                    chunk = batch[inserted : inserted + allowance]
+                else:
+                    chunk = batch
 
                 if left:
-                    self._deque.appendleft(item)
+                    self._deque.extendleft(chunk)
                 else:
-                    self._deque.append(item)
+                    self._deque.extend(chunk)
 
-                self._tasks_counter.incr()
-                if self._limitation:
-                    self._item_counter.incr()
-                break
+                inserted += len(chunk)
+                allowance -= len(chunk)
+                self._items_added(len(chunk), left)
 
-    def _base_get(self, timeout: Optional[float], left: bool) -> T:
+    def _base_get_many(
+        self,
+        max_items: int,
+        timeout: Optional[float],
+        left: bool,
+        deadline: Optional[float] = None,
+    ) -> List[T]:
         """
-        Internal method to remove and return an item from the queue from either end,
-        respecting optional timeout and availability constraints.
+        Internal method to remove up to `max_items` items from either end under a
+        single lock acquisition. Waits only until at least one item is available.
 
         Args:
-            timeout (Optional[float]): Maximum time to wait if the queue is empty.
+            max_items (int): Maximum number of items to return.
+            timeout (Optional[float]): Maximum time to wait for the first item.
                 If None, the method blocks indefinitely.
-            left (bool): If True, removes the item from the left end; otherwise, from the right.
+            left (bool): If True, removes items from the left end; otherwise, from the right.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
 
         Returns:
-            T: The item retrieved from the queue.
+            List[T]: Retrieved items in the order they were removed.
 
         Raises:
+            ValueError: If max_items is less than 1, or both a timeout and a deadline are given.
             TimeoutError: If the timeout is reached while waiting for an item to become available.
         """
-        timer = tmr.get_timer(timeout)
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1.")
+        if deadline is not None and timeout is not None:
+            raise ValueError("Specify either a timeout or a deadline, not both.")
 
-        while True:
-            wait_time = timer.get_spend()
+        with self._mutex:
+            count = self._await_items(max_items, tmr.get_timer(timeout, deadline))
+
+            pop = self._deque.popleft if left else self._deque.pop
+            items = [pop() for _ in range(count)]
 
-            if not self._empty_event.wait_unset(wait_time):
-                raise TimeoutError("The timeout has expired while waiting for an item.")
+            self._items_removed(count, left)
+            return items
 
-            with self._mutex:
-                if len(self._deque) > 0:
-                    if left:
-                        item = self._deque.popleft()
-                    else:
-                        item = self._deque.pop()
+    def _await_items(self, max_items: int, timer: tmr.AnyTimer) -> int:
+        """
+        Waits until at least one item can be taken. Must be called with `_mutex` held.
 
-                    if self._limitation:
-                        self._item_counter.decr()
-                    return item
+        Args:
+            max_items (int): Maximum number of items the caller wants.
+            timer (AnyTimer): Timer tracking the time left to wait.
 
-    def put(self, item: T, timeout: Optional[float] = None) -> None:
+        Returns:
+            int: Number of items, at most `max_items`, the caller may take.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for an item to become available.
+        """
+        if self._scheduled:
+            self._promote_due()
+        if self._get_limiter is not None:
+            return self._take_get_tokens(max_items, timer)
+        if not self._deque:
+            self._wait_for_item(timer)
+        return min(max_items, len(self._deque))
+
+    def _pop_entries(self, count: int, left: bool) -> Tuple[List[T], List[Any]]:
+        """
+        Takes `count` items for redelivery-aware consumers (leases, consumer
+        handles). Besides the items it returns the entries `_requeue` has to
+        store to put each of them back where it came from; for plain storages
+        these are the items themselves. Must be called with `_mutex` held.
+
+        Args:
+            count (int): Number of items to take; at most `len(self._deque)`.
+            left (bool): If True, takes items from the left end; otherwise, from the right.
+
+        Returns:
+            Tuple[List[T], List[Any]]: The items in removal order and their entries.
+        """
+        pop = self._deque.popleft if left else self._deque.pop
+        items = [pop() for _ in range(count)]
+        self._items_removed(count, left)
+        return items, items
+
+    def _base_get_entries(
+        self, max_items: int, timeout: Optional[float], left: bool
+    ) -> Tuple[List[T], List[Any]]:
+        """
+        Like `_base_get_many`, but also returns the entries to requeue the
+        items with (see `_pop_entries`). Used by `Consumer`.
+
+        Args:
+            max_items (int): Maximum number of items to return.
+            timeout (Optional[float]): Maximum time to wait for the first item.
+                If None, the method blocks indefinitely.
+            left (bool): If True, removes items from the left end; otherwise, from the right.
+
+        Returns:
+            Tuple[List[T], List[Any]]: The items in removal order and their entries.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for an item to become available.
+        """
+        with self._mutex:
+            return self._pop_entries(self._await_items(max_items, tmr.get_timer(timeout)), left)
+
+    def _base_get_chunk(
+        self, max_items: int, timer: tmr.AnyTimer, linger: float, left: bool
+    ) -> List[T]:
+        """
+        Internal method to remove a batch of up to `max_items` items under a
+        single lock acquisition, waiting up to `linger` seconds after the first
+        item for the batch to fill up.
+
+        Args:
+            max_items (int): Maximum number of items to return.
+            timer (AnyTimer): Timer tracking the time left to wait for the first item.
+            linger (float): Seconds to wait for more items once one is available.
+            left (bool): If True, removes items from the left end; otherwise, from the right.
+
+        Returns:
+            List[T]: Retrieved items in the order they were removed.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for the first item.
+        """
+        with self._mutex:
+            while True:
+                if self._scheduled:
+                    self._promote_due()
+                if not self._deque:
+                    self._wait_for_item(timer)
+                if linger <= 0 or len(self._deque) >= max_items:
+                    break
+                lingering = tmr.Timer(linger)
+                self._waiting_getters += 1
+                try:
+                    while len(self._deque) < max_items and not self._shutdown:
+                        if lingering.get_spend() <= 0:
+                            break
+                        self._not_empty.wait(lingering)
+                finally:
+                    self._waiting_getters -= 1
+                # Other consumers may have drained the queue meanwhile.
+                if self._deque:
+                    break
+
+            if self._get_limiter is not None:
+                count = self._take_get_tokens(max_items, timer)
+            else:
+                count = min(max_items, len(self._deque))
+            pop = self._deque.popleft if left else self._deque.pop
+            items = [pop() for _ in range(count)]
+
+            self._items_removed(count, left)
+            return items
+
+    def _base_get_with_ack(
+        self,
+        lease: float,
+        timeout: Optional[float],
+        left: bool,
+        deadline: Optional[float] = None,
+    ) -> Tuple[T, int]:
+        """
+        Internal method to remove an item from either end and lease it until it
+        is acknowledged.
+
+        Args:
+            lease (float): Seconds after which an unacknowledged item is requeued.
+            timeout (Optional[float]): Maximum time to wait if the queue is empty.
+                If None, the method blocks indefinitely.
+            left (bool): If True, removes the item from the left end; otherwise, from the right.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Returns:
+            Tuple[T, int]: The item and the handle of its lease.
+
+        Raises:
+            ValueError: If the lease is not positive, or both a timeout and a deadline are given.
+            TimeoutError: If the timeout is reached while waiting for an item to become available.
+        """
+        if lease <= 0:
+            raise ValueError("Lease must be positive.")
+        if deadline is not None and timeout is not None:
+            raise ValueError("Specify either a timeout or a deadline, not both.")
+        with self._mutex:
+            self._await_items(1, tmr.get_timer(timeout, deadline))
+            (item,), (entry,) = self._pop_entries(1, left)
+            handle = self._next_handle
+            self._next_handle += 1
+            timer_id = tmr.shared_wheel_thread().schedule(
+                time.monotonic() + lease, lambda: self._expire_lease(handle)
+            )
+            self._leases[handle] = (entry, left, timer_id)
+            return item, handle
+
+    def put(
+        self, item: T, timeout: Optional[float] = None, deadline: Optional[float] = None
+    ) -> None:
         """
         Inserts an item at the right end of the queue.
 
@@ -134,17 +970,25 @@ class ThreadSafeDeque(Generic[T]):
             item (T): The item to insert.
             timeout (Optional[float]): Maximum time to wait for free space.
                 If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
 
         Raises:
+            ValueError: If both a timeout and a deadline are given.
             TimeoutError: If the operation times out.
+            DequeFullError: If the queue is full and the overflow policy is
+                "raise_immediately".
         """
         self._base_put(
             item=item,
             timeout=timeout,
+            deadline=deadline,
             left=False,
         )
 
-    def putleft(self, item: T, timeout: Optional[float] = None) -> None:
+    def putleft(
+        self, item: T, timeout: Optional[float] = None, deadline: Optional[float] = None
+    ) -> None:
         """
         Inserts an item at the left end of the queue.
 
@@ -152,69 +996,532 @@ class ThreadSafeDeque(Generic[T]):
             item (T): The item to insert.
             timeout (Optional[float]): Maximum time to wait for free space.
                 If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
 
         Raises:
+            ValueError: If both a timeout and a deadline are given.
             TimeoutError: If the operation times out.
+            DequeFullError: If the queue is full and the overflow policy is
+                "raise_immediately".
         """
         self._base_put(
             item=item,
             timeout=timeout,
+            deadline=deadline,
             left=True,
         )
 
-    def get(self, timeout: Optional[float] = None) -> T:
+    def get(
+        self, timeout: Optional[float] = None, deadline: Optional[float] = None
+    ) -> T:
         """
         Removes and returns an item from the right end of the queue.
 
         Args:
             timeout (Optional[float]): Maximum time to wait for an item.
                 If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
 
         Returns:
             T: The retrieved item.
 
         Raises:
+            ValueError: If both a timeout and a deadline are given.
             TimeoutError: If the operation times out.
         """
         return self._base_get(
             timeout=timeout,
+            deadline=deadline,
             left=False,
         )
 
-    def getleft(self, timeout: Optional[float] = None) -> T:
+    def getleft(
+        self, timeout: Optional[float] = None, deadline: Optional[float] = None
+    ) -> T:
         """
         Removes and returns an item from the left end of the queue.
 
         Args:
             timeout (Optional[float]): Maximum time to wait for an item.
                 If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
 
         Returns:
             T: The retrieved item.
 
         Raises:
+            ValueError: If both a timeout and a deadline are given.
             TimeoutError: If the operation times out.
         """
         return self._base_get(
             timeout=timeout,
+            deadline=deadline,
+            left=True,
+        )
+
+    def put_at(self, item: T, deadline: float) -> None:
+        """
+        Schedules an item to be inserted at the right end of the queue at a
+        given time. Returns immediately.
+
+        The item counts as a task right away, so `join` waits for it, but it is
+        invisible to getters until it is due. Getters blocked on an empty
+        queue are woken when it arrives. Due items are inserted even if that
+        exceeds `maxsize`.
+
+        Args:
+            item (T): The item to insert.
+            deadline (float): Absolute time on the `time.monotonic()` clock at
+                which the item becomes available. Past times insert it at once.
+        """
+        with self._mutex:
+            if self._shutdown:
+                raise DequeShutDown("The deque was shut down.")
+            self._add_tasks(1)
+            sequence = self._next_sequence
+            self._next_sequence += 1
+            heapq.heappush(self._scheduled, (deadline, sequence, item))
+            if self._scheduled[0][1] == sequence:
+                self._promote_due()
+                self._arm_schedule_timer()
+
+    def put_after(self, item: T, delay: float) -> None:
+        """
+        Schedules an item to be inserted at the right end of the queue after a
+        delay. See `put_at`.
+
+        Args:
+            item (T): The item to insert.
+            delay (float): Seconds until the item becomes available.
+
+        Raises:
+            ValueError: If delay is negative.
+        """
+        if delay < 0:
+            raise ValueError("Delay cannot be negative.")
+        self.put_at(item, time.monotonic() + delay)
+
+    def put_many(
+        self,
+        items: Iterable[T],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Inserts a batch of items at the right end of the queue, preserving their order.
+
+        Args:
+            items (Iterable[T]): The items to insert.
+            timeout (Optional[float]): Maximum total time to wait for free space.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Raises:
+            ValueError: If both a timeout and a deadline are given.
+            PartialPutError: If the operation times out before the whole batch was
+                inserted. Items counted in its `inserted` attribute stay in the queue.
+            DequeFullError: If the queue fills up and the overflow policy is
+                "raise_immediately". Its `inserted` attribute is set likewise.
+        """
+        self._base_put_many(
+            items=items,
+            timeout=timeout,
+            deadline=deadline,
+            left=False,
+        )
+
+    def putleft_many(
+        self,
+        items: Iterable[T],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Inserts a batch of items at the left end of the queue, one after another,
+        as if `putleft` was called for each of them. The last item ends up leftmost.
+
+        Args:
+            items (Iterable[T]): The items to insert.
+            timeout (Optional[float]): Maximum total time to wait for free space.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Raises:
+            ValueError: If both a timeout and a deadline are given.
+            PartialPutError: If the operation times out before the whole batch was
+                inserted. Items counted in its `inserted` attribute stay in the queue.
+            DequeFullError: If the queue fills up and the overflow policy is
+                "raise_immediately". Its `inserted` attribute is set likewise.
+        """
+        self._base_put_many(
+            items=items,
+            timeout=timeout,
+            deadline=deadline,
+            left=True,
+        )
+
+    def get_many(
+        self,
+        max_items: int,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> List[T]:
+        """
+        Removes and returns up to `max_items` items from the right end of the queue.
+        Returns as soon as at least one item is available.
+
+        Args:
+            max_items (int): Maximum number of items to return.
+            timeout (Optional[float]): Maximum time to wait for the first item.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Returns:
+            List[T]: The retrieved items, rightmost first.
+
+        Raises:
+            ValueError: If max_items is less than 1, or both a timeout and a deadline are given.
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get_many(
+            max_items=max_items,
+            timeout=timeout,
+            deadline=deadline,
+            left=False,
+        )
+
+    def getleft_many(
+        self,
+        max_items: int,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> List[T]:
+        """
+        Removes and returns up to `max_items` items from the left end of the queue.
+        Returns as soon as at least one item is available.
+
+        Args:
+            max_items (int): Maximum number of items to return.
+            timeout (Optional[float]): Maximum time to wait for the first item.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Returns:
+            List[T]: The retrieved items, leftmost first.
+
+        Raises:
+            ValueError: If max_items is less than 1, or both a timeout and a deadline are given.
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get_many(
+            max_items=max_items,
+            timeout=timeout,
+            deadline=deadline,
+            left=True,
+        )
+
+    def iter(
+        self,
+        timeout: Optional[float] = None,
+        chunk: Optional[int] = None,
+        linger: float = 0.0,
+        left: bool = False,
+    ) -> Iterator[Union[T, List[T]]]:
+        """
+        Returns a consuming iterator that marks items done automatically.
+
+        Each step takes items like `get_many`, under a single lock acquisition.
+        Items handed out by one step are marked done in bulk (`task_done`)
+        when the next step is requested or the iterator is closed, so the
+        loop body must not call `task_done` for them::
+
+            for batch in dq.iter(chunk=100, linger=0.01):
+                process(batch)
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for the next item;
+                iteration ends when it expires, or once the deque is shut down
+                and empty. If None, waits indefinitely.
+            chunk (Optional[int]): If given, yields lists of up to `chunk`
+                items; otherwise yields single items.
+            linger (float): Seconds to wait, once an item is available, for
+                more items to fill the chunk.
+            left (bool): If True, takes items from the left end; otherwise, from the right.
+
+        Returns:
+            Iterator[Union[T, List[T]]]: Items, or lists of items if `chunk` is given.
+
+        Raises:
+            ValueError: If chunk is less than 1 or linger is negative.
+        """
+        if chunk is not None and chunk < 1:
+            raise ValueError("chunk must be at least 1.")
+        if linger < 0:
+            raise ValueError("linger cannot be negative.")
+        return self._iterate(timeout, chunk, linger, left)
+
+    def _iterate(
+        self, timeout: Optional[float], chunk: Optional[int], linger: float, left: bool
+    ) -> Iterator[Union[T, List[T]]]:
+        """Generator behind `iter`."""
+        unfinished = 0
+        try:
+            while True:
+                if unfinished:
+                    self.task_done(unfinished)
+                    unfinished = 0
+                try:
+                    items = self._base_get_chunk(chunk or 1, tmr.get_timer(timeout), linger, left)
+                except (TimeoutError, DequeShutDown):
+                    return
+                unfinished = len(items)
+                yield items if chunk is not None else items[0]
+        finally:
+            if unfinished:
+                self.task_done(unfinished)
+
+    def consumer(self, prefetch: int = 32, left: bool = False) -> Consumer[T]:
+        """
+        Returns a handle that takes up to `prefetch` items per lock acquisition
+        and serves them to the calling thread without locking.
+
+        Prefetched items keep their unfinished tasks, and items the handle has
+        not served are put back when it is closed, so `join` stays correct.
+        The handle is meant for a single thread and is a context manager:
+
+            with dq.consumer(prefetch=64) as consumer:
+                while True:
+                    process(consumer.get())
+                    consumer.task_done()
+
+        Args:
+            prefetch (int): Maximum number of items taken at once. Defaults to 32.
+            left (bool): If True, takes items from the left end; otherwise, from the right.
+
+        Returns:
+            Consumer[T]: The consumer handle.
+
+        Raises:
+            ValueError: If prefetch is less than 1.
+        """
+        return Consumer(self, prefetch, left)
+
+    def producer(
+        self, flush_size: int = 64, flush_interval: Optional[float] = 0.005, left: bool = False
+    ) -> Producer[T]:
+        """
+        Returns a handle that buffers puts and stores them in batches of up to
+        `flush_size` items under a single lock acquisition.
+
+        Items of one handle keep their order. `join` flushes every open handle
+        before waiting, so buffered items are never overlooked. The handle is
+        meant for a single thread and is a context manager; closing it stores
+        the remaining items.
+
+        Args:
+            flush_size (int): Number of buffered items that triggers a flush.
+                Defaults to 64.
+            flush_interval (Optional[float]): Maximum seconds an item stays
+                buffered. Defaults to 5 ms. If None, items wait for the batch
+                to fill up or for an explicit flush.
+            left (bool): If True, stores items at the left end; otherwise, at the right.
+
+        Returns:
+            Producer[T]: The producer handle.
+
+        Raises:
+            ValueError: If flush_size is less than 1 or flush_interval is not positive.
+        """
+        handle = Producer(self, flush_size, flush_interval, left)
+        with self._mutex:
+            self._producers.add(handle)
+        return handle
+
+    def _flush_producers(self, timer: tmr.AnyTimer, wait: bool) -> None:
+        """
+        Stores the items buffered by open producer handles. Items that cannot
+        be stored in time stay buffered.
+
+        Args:
+            timer (AnyTimer): Timer tracking the time left to wait for space.
+            wait (bool): If False, skips handles that are busy and never waits for space.
+        """
+        with self._mutex:
+            producers = list(self._producers)
+        for producer in producers:
+            try:
+                producer._flush(timer, wait)
+            except (TimeoutError, DequeFullError, DequeShutDown):
+                pass
+
+    def get_with_ack(
+        self,
+        lease: float = 30.0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[T, int]:
+        """
+        Removes an item from the right end of the queue and leases it.
+
+        The item's task stays unfinished until the returned handle is passed to
+        `ack`. If neither `ack` nor `nack` is called within `lease` seconds,
+        the item is put back at the right end for another consumer.
+
+        Args:
+            lease (float): Seconds the consumer has to acknowledge the item.
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Returns:
+            Tuple[T, int]: The item and the handle of its lease.
+
+        Raises:
+            ValueError: If the lease is not positive, or both a timeout and a deadline are given.
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get_with_ack(
+            lease=lease,
+            timeout=timeout,
+            deadline=deadline,
+            left=False,
+        )
+
+    def getleft_with_ack(
+        self,
+        lease: float = 30.0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[T, int]:
+        """
+        Removes an item from the left end of the queue and leases it.
+
+        See `get_with_ack`; an expired item is put back at the left end.
+
+        Args:
+            lease (float): Seconds the consumer has to acknowledge the item.
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Returns:
+            Tuple[T, int]: The item and the handle of its lease.
+
+        Raises:
+            ValueError: If the lease is not positive, or both a timeout and a deadline are given.
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get_with_ack(
+            lease=lease,
+            timeout=timeout,
+            deadline=deadline,
             left=True,
         )
 
+    def ack(self, handle: int) -> None:
+        """
+        Marks a leased item as processed and finishes its task. Replaces
+        `task_done` for items obtained through `get_with_ack`.
+
+        Args:
+            handle (int): Handle returned by `get_with_ack`.
+
+        Raises:
+            LeaseError: If the handle is unknown, already acknowledged, or its
+                lease expired and the item was requeued.
+        """
+        with self._mutex:
+            self._release_lease(handle)
+            self._remove_tasks(1)
+
+    def nack(self, handle: int, requeue_left: bool = True) -> None:
+        """
+        Gives a leased item back for redelivery. Its task stays unfinished.
+
+        Args:
+            handle (int): Handle returned by `get_with_ack`.
+            requeue_left (bool): If True (default), puts the item back at the
+                left end; otherwise, at the right end.
+
+        Raises:
+            LeaseError: If the handle is unknown, already acknowledged, or its
+                lease expired and the item was requeued.
+        """
+        with self._mutex:
+            entry = self._release_lease(handle)[0]
+            self._requeue(entry, requeue_left)
+
     def clear(self) -> None:
         """
         Removes all items from the queue and resets internal counters.
         """
         with self._mutex:
-            self._tasks_counter.set_value(
-                self._tasks_counter.value() - len(self._deque)
-            )
+            self._remove_tasks(len(self._deque))
+            self._deque.clear()
+            if self._waiting_putters:
+                self._not_full.notify_all()
+            if self._put_waiters:
+                self._wake_waiters(self._put_waiters, len(self._put_waiters))
+
+    def close(self) -> None:
+        """
+        Stops accepting new items while letting consumers drain the queue.
+        Same as `shutdown(immediate=False)`.
+        """
+        self.shutdown()
+
+    def shutdown(self, immediate: bool = False) -> None:
+        """
+        Shuts the deque down, like `queue.Queue.shutdown` in Python 3.13.
+
+        Afterwards every put raises `DequeShutDown`, and gets raise it once the
+        queue is empty. All blocked putters are woken and raise; blocked
+        getters are woken and raise if there is nothing left to take. The cost
+        is proportional to the number of waiters.
+
+        Args:
+            immediate (bool): If True, also discards all queued and scheduled
+                items and finishes their tasks, so blocked getters raise at once
+                and `join` returns as soon as taken items are done.
+        """
+        with self._mutex:
+            self._shutdown_locked(immediate)
+
+    def _shutdown_locked(self, immediate: bool) -> None:
+        """Implements `shutdown`. Must be called with `_mutex` held."""
+        self._shutdown = True
+        if immediate:
+            self._remove_tasks(len(self._deque) + len(self._scheduled))
             self._deque.clear()
-            if self._limitation:
-                self._item_counter.reset()
+            self._scheduled.clear()
+            if self._schedule_timer is not None:
+                tmr.shared_wheel_thread().cancel(self._schedule_timer)
+                self._schedule_timer = None
+        self._not_empty.notify_all()
+        self._not_full.notify_all()
+        self._throttled.notify_all()
+        self._wake_waiters(self._get_waiters, len(self._get_waiters))
+        self._wake_waiters(self._put_waiters, len(self._put_waiters))
+
+    @property
+    def is_shutdown(self) -> bool:
+        """Whether `close` or `shutdown` was called."""
+        return self._shutdown
 
     def join(self, timeout: Optional[float] = None) -> None:
         """
         Blocks until all items in the queue have been marked as done via `task_done`.
+        Items buffered by open producer handles are flushed first; a handle
+        whose owner is busy is waited for only within the timeout.
 
         Args:
             timeout (Optional[float]): Maximum time to wait. If None, waits indefinitely.
@@ -222,21 +1529,30 @@ class ThreadSafeDeque(Generic[T]):
         Raises:
             TimeoutError: If the operation times out.
         """
-        self._empty_event.wait_set(timeout)
+        if self._producers:
+            timer = tmr.get_timer(timeout)
+            self._flush_producers(timer, True)
+            timeout = timer.get_spend()
+        if not self._empty_event.wait_set(timeout):
+            self._record_timeout(error=False)
 
-    def task_done(self) -> None:
+    def task_done(self, count: int = 1) -> None:
         """
-        Decrements the internal task counter. Used to indicate that a previously
-        enqueued task is complete.
+        Decrements the internal task counter. Used to indicate that previously
+        enqueued tasks are complete.
+
+        Args:
+            count (int): Number of completed tasks. Defaults to 1.
 
         Raises:
+            ValueError: If count is less than 1.
             NoActiveTaskError: If called more times than there were tasks.
         """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+
         with self._mutex:
-            try:
-                self._tasks_counter.decr()
-            except LowThresholdError:
-                raise NoActiveTaskError("All tasks have already been completed.")
+            self._remove_tasks(count)
 
     def tasks_count(self) -> int:
         """
@@ -246,7 +1562,41 @@ class ThreadSafeDeque(Generic[T]):
             int: The number of unfinished tasks.
         """
         with self._mutex:
-            return self._tasks_counter.value()
+            return self._unfinished_tasks
+
+    def scheduled_count(self) -> int:
+        """
+        Returns the number of items scheduled by `put_at`/`put_after` that are
+        not due yet.
+
+        Returns:
+            int: Number of pending scheduled items.
+        """
+        with self._mutex:
+            if self._scheduled:
+                self._promote_due()
+            return len(self._scheduled)
+
+    def leased_count(self) -> int:
+        """
+        Returns the number of items delivered by `get_with_ack` and not yet
+        acknowledged or expired.
+
+        Returns:
+            int: Number of active leases.
+        """
+        with self._mutex:
+            return len(self._leases)
+
+    def dropped_count(self) -> int:
+        """
+        Returns the number of items evicted or discarded by the overflow policy.
+
+        Returns:
+            int: Total number of dropped items.
+        """
+        with self._mutex:
+            return self._dropped
 
     def __len__(self) -> int:
         """
@@ -257,3 +1607,15 @@ class ThreadSafeDeque(Generic[T]):
         """
         with self._mutex:
             return len(self._deque)
+
+    def stats(self) -> Optional[DequeStats]:
+        """
+        Returns a snapshot of the instrumentation counters and histograms.
+
+        Returns:
+            Optional[DequeStats]: The merged statistics of all threads, or None
+                if the deque was created without `instrument=True`.
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
@@ -1,2 +1,38 @@
 class NoActiveTaskError(TypeError):
     """Raised when there is an attempt to mark a task done but no active tasks exist."""
+
+
+class PartialPutError(TimeoutError):
+    """Raised when a batch put times out after storing only part of the batch.
+
+    Attributes:
+        inserted (int): Number of items from the batch that were stored.
+    """
+
+    def __init__(self, message: str, inserted: int) -> None:
+        super().__init__(message)
+        self.inserted = inserted
+
+
+class DequeFullError(Exception):
+    """Raised by a bounded deque with the "raise_immediately" overflow policy
+    when an item does not fit.
+
+    Attributes:
+        inserted (int): Number of items of a batch that were stored before the
+            queue filled up; 0 for single-item puts.
+    """
+
+    def __init__(self, message: str, inserted: int = 0) -> None:
+        super().__init__(message)
+        self.inserted = inserted
+
+
+class LeaseError(LookupError):
+    """Raised when acknowledging a handle that is unknown, was already
+    acknowledged, or whose lease has expired and whose item was requeued."""
+
+
+class DequeShutDown(Exception):
+    """Raised by puts on a deque that was shut down, and by gets once such a
+    deque has no items left."""
@@ -0,0 +1,312 @@
+import time
+from collections import deque
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Deque, Generic, List, Optional, TypeVar
+
+import tsdeque.timer as tmr
+from tsdeque.exceptions import DequeFullError, DequeShutDown
+
+if TYPE_CHECKING:
+    from tsdeque.core import ThreadSafeDeque
+
+T = TypeVar("T")
+
+
+class Consumer(Generic[T]):
+    """
+    A single-thread handle taking items from a `ThreadSafeDeque` in batches.
+
+    `get` refills a local buffer with up to `prefetch` items under one lock
+    acquisition and serves the buffered items without locking. Prefetched
+    items remain unfinished tasks of the deque, so `tasks_count` and `join`
+    keep counting them; call `task_done` for every item as usual. Closing the
+    handle returns the items it has not served to the end they were taken
+    from, in their original order.
+
+    A handle must be used by one thread only. Buffered items are invisible to
+    other consumers, so keep `prefetch` small when the work per item varies.
+    """
+
+    def __init__(self, dq: "ThreadSafeDeque[T]", prefetch: int, left: bool) -> None:
+        """
+        Initializes the handle. Use `ThreadSafeDeque.consumer` instead.
+
+        Args:
+            dq (ThreadSafeDeque[T]): The deque to consume.
+            prefetch (int): Maximum number of items taken per lock acquisition.
+            left (bool): If True, takes items from the left end; otherwise, from the right.
+
+        Raises:
+            ValueError: If prefetch is less than 1.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1.")
+
+        self._dq = dq
+        self._prefetch = prefetch
+        self._left = left
+        self._buffer: Deque[T] = deque()
+        # Entries to requeue the buffered items with, when they differ from
+        # the items themselves (see `ThreadSafeDeque._pop_entries`).
+        self._entries: Optional[Deque[Any]] = None
+        self._closed = False
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        """
+        Returns the next item, taking a new batch from the deque when the
+        buffer is empty.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait if the deque is empty.
+                If None, waits indefinitely.
+
+        Returns:
+            T: The next item.
+
+        Raises:
+            RuntimeError: If the handle is closed.
+            TimeoutError: If the timeout is reached while waiting for an item.
+            DequeShutDown: If the deque is shut down and empty.
+        """
+        buffer = self._buffer
+        if not buffer:
+            if self._closed:
+                raise RuntimeError("The consumer is closed.")
+            items, entries = self._dq._base_get_entries(self._prefetch, timeout, self._left)
+            buffer.extend(items)
+            if entries is not items:
+                self._entries = deque(entries)
+        if self._entries is not None:
+            self._entries.popleft()
+        return buffer.popleft()
+
+    def task_done(self, count: int = 1) -> None:
+        """
+        Marks items as complete. See `ThreadSafeDeque.task_done`.
+
+        Args:
+            count (int): Number of completed tasks. Defaults to 1.
+        """
+        self._dq.task_done(count)
+
+    def close(self) -> None:
+        """Returns the unserved items to the deque. Idempotent."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._buffer:
+            return
+        dq = self._dq
+        buffer = self._buffer
+        entries = self._entries if self._entries is not None else buffer
+        with dq._mutex:
+            # The last buffered item goes back first so that the first one
+            # ends up outermost again. Items leave the buffer only once stored.
+            while entries:
+                dq._requeue(entries[-1], self._left)
+                entries.pop()
+                if entries is not buffer:
+                    buffer.pop()
+
+    def __len__(self) -> int:
+        """Returns the number of buffered items."""
+        return len(self._buffer)
+
+    def __enter__(self) -> "Consumer[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class Producer(Generic[T]):
+    """
+    A handle buffering puts into a `ThreadSafeDeque` and storing them in batches.
+
+    `put` appends to a local buffer, which is stored with one lock acquisition
+    and one task counter update once it holds `flush_size` items, at the
+    latest `flush_interval` seconds after its first item, on `flush` and
+    `close`, and whenever a thread calls `join` on the deque. The items of one
+    handle keep their order. Buffered items are not tasks yet, so `len` and
+    `tasks_count` see them only after a flush. The deque keeps a reference to
+    every open handle, so items of a handle that was dropped without `close`
+    are still flushed by `join` or by the timer.
+
+    A flush by `put`, `flush` or `close` waits for space like `put_many`; if it
+    fails, the items that were not stored stay buffered. A timed flush runs on
+    the shared timer thread and never waits: it stores what fits and retries
+    after another interval.
+    """
+
+    def __init__(
+        self,
+        dq: "ThreadSafeDeque[T]",
+        flush_size: int,
+        flush_interval: Optional[float],
+        left: bool,
+    ) -> None:
+        """
+        Initializes the handle. Use `ThreadSafeDeque.producer` instead.
+
+        Args:
+            dq (ThreadSafeDeque[T]): The deque to fill.
+            flush_size (int): Number of buffered items that triggers a flush.
+            flush_interval (Optional[float]): Maximum seconds an item stays
+                buffered. If None, only size, `flush`, `close` and `join` flush.
+            left (bool): If True, stores items at the left end; otherwise, at the right.
+
+        Raises:
+            ValueError: If flush_size is less than 1 or flush_interval is not positive.
+        """
+        if flush_size < 1:
+            raise ValueError("flush_size must be at least 1.")
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval must be positive.")
+
+        self._dq = dq
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._left = left
+        # Held while the buffer is changed or stored; contended only by flushes
+        # from the timer thread and from `join`.
+        self._lock = Lock()
+        self._buffer: List[T] = []
+        self._timer: Optional[int] = None
+        self._closed = False
+
+    def put(self, item: T) -> None:
+        """
+        Buffers an item, storing the buffer if it reached `flush_size`.
+
+        Args:
+            item (T): The item to insert.
+
+        Raises:
+            RuntimeError: If the handle is closed.
+            DequeFullError: If the flush overfills the queue and the overflow
+                policy is "raise_immediately".
+            DequeShutDown: If the deque is shut down.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The producer is closed.")
+            buffer = self._buffer
+            buffer.append(item)
+            if len(buffer) >= self._flush_size:
+                self._store(tmr.get_timer(None))
+            elif self._timer is None and self._flush_interval is not None:
+                self._arm()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Stores all buffered items.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for space. If None,
+                waits indefinitely.
+
+        Raises:
+            PartialPutError: If the timeout is reached before all items were stored.
+            DequeFullError: If the queue fills up and the overflow policy is
+                "raise_immediately".
+            DequeShutDown: If the deque is shut down.
+        """
+        self._flush(tmr.get_timer(timeout), True)
+
+    def _flush(self, timer: tmr.AnyTimer, wait: bool) -> None:
+        """
+        Stores all buffered items within `timer`.
+
+        Args:
+            timer (AnyTimer): Timer tracking the time left to wait for the
+                buffer and for space.
+            wait (bool): If False, returns at once when another thread is
+                using the buffer.
+        """
+        if wait:
+            # The owner may be waiting for space while holding the lock.
+            remaining = timer.get_spend()
+            acquired = self._lock.acquire(timeout=-1 if remaining is None else remaining)
+        else:
+            acquired = self._lock.acquire(blocking=False)
+        if not acquired:
+            return
+        try:
+            if self._buffer:
+                self._store(timer)
+        finally:
+            self._lock.release()
+
+    def _store(self, timer: tmr.AnyTimer) -> None:
+        """Puts the buffer into the deque. Must be called with `_lock` held."""
+        batch, self._buffer = self._buffer, []
+        try:
+            self._dq._put_batch(batch, timer, self._left)
+        except (TimeoutError, DequeFullError) as error:
+            self._buffer = batch[getattr(error, "inserted", 0) :]
+            raise
+        except DequeShutDown:
+            self._buffer = batch
+            raise
+        finally:
+            if not self._buffer and self._timer is not None:
+                tmr.shared_wheel_thread().cancel(self._timer)
+                self._timer = None
+            elif self._buffer and self._timer is None and self._flush_interval is not None:
+                if not self._dq._shutdown:
+                    self._arm()
+
+    def _arm(self) -> None:
+        """Schedules a timed flush. Must be called with `_lock` held."""
+        self._timer = tmr.shared_wheel_thread().schedule(
+            time.monotonic() + self._flush_interval,  # type: ignore[operator]
+            self._on_timer,
+        )
+
+    def _on_timer(self) -> None:
+        """Stores what fits without waiting. Called by the timer thread."""
+        if not self._lock.acquire(blocking=False):
+            # The owner is using the buffer and may be waiting for space; the
+            # timer thread must not block, so look again later. This retry is
+            # not recorded in `_timer` and at worst causes an early flush.
+            tmr.shared_wheel_thread().schedule(
+                time.monotonic() + self._flush_interval,  # type: ignore[operator]
+                self._on_timer,
+            )
+            return
+        try:
+            self._timer = None
+            if self._buffer:
+                self._store(tmr.Timer(0))
+        except (TimeoutError, DequeFullError, DequeShutDown):
+            pass
+        finally:
+            self._lock.release()
+
+    def close(self) -> None:
+        """
+        Stores the remaining items and detaches the handle from the deque.
+
+        Raises:
+            DequeFullError: If the queue fills up and the overflow policy is
+                "raise_immediately".
+            DequeShutDown: If items are still buffered and the deque is shut down.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        dq = self._dq
+        with dq._mutex:
+            dq._producers.discard(self)
+        self.flush()
+
+    def __len__(self) -> int:
+        """Returns the number of buffered items."""
+        return len(self._buffer)
+
+    def __enter__(self) -> "Producer[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,389 @@
+from collections import deque
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from tsdeque.core import ThreadSafeDeque
+
+T = TypeVar("T")
+
+
+class _Routed:
+    """An item tagged with the lane it has to be stored in."""
+
+    __slots__ = ("lane", "item")
+
+    def __init__(self, lane: int, item: Any) -> None:
+        self.lane = lane
+        self.item = item
+
+
+class _Lanes:
+    """
+    Deque-like storage made of K lanes. Lane 0 has the highest priority.
+
+    Items are routed to a lane by wrapping them in `_Routed`; bare items go to
+    the default lane. `pop`/`popleft` first select a lane, using a bitmap of
+    non-empty lanes so that selection does not depend on the number of lanes,
+    and then take the item from the requested end of that lane.
+    """
+
+    def __init__(
+        self, lanes: int, default_lane: int, weights: Optional[Sequence[int]]
+    ) -> None:
+        """
+        Initializes empty lanes.
+
+        Args:
+            lanes (int): Number of lanes.
+            default_lane (int): Lane receiving items that are not routed explicitly.
+            weights (Optional[Sequence[int]]): Per-lane weights for weighted
+                round-robin selection, or None for strict priority.
+        """
+        self._lanes: List[Deque[Any]] = [deque() for _ in range(lanes)]
+        self._default_lane = default_lane
+        self._weights = list(weights) if weights is not None else None
+        self._bitmap = 0
+        self._size = 0
+
+        # Weighted round-robin position: the lane being served and how many
+        # more items it may give before the next non-empty lane gets a turn.
+        self._current = 0
+        self._credit = self._weights[0] if self._weights is not None else 0
+
+    def _push(self, entry: Any, left: bool) -> None:
+        """Stores an entry at the left or right end of its lane."""
+        if isinstance(entry, _Routed):
+            lane, item = entry.lane, entry.item
+        else:
+            lane, item = self._default_lane, entry
+        if left:
+            self._lanes[lane].appendleft(item)
+        else:
+            self._lanes[lane].append(item)
+        self._bitmap |= 1 << lane
+        self._size += 1
+
+    def _select(self) -> int:
+        """
+        Picks the lane to serve next. Must only be called when not empty.
+
+        Returns:
+            int: Index of a non-empty lane.
+        """
+        bitmap = self._bitmap
+        if self._weights is None:
+            return (bitmap & -bitmap).bit_length() - 1
+
+        lane = self._current
+        if self._credit > 0 and bitmap >> lane & 1:
+            self._credit -= 1
+            return lane
+
+        # Move on to the next non-empty lane after the current one, wrapping around.
+        above = bitmap >> (lane + 1) << (lane + 1)
+        mask = above if above else bitmap
+        lane = (mask & -mask).bit_length() - 1
+        self._current = lane
+        self._credit = self._weights[lane] - 1
+        return lane
+
+    def _pop(self, left: bool) -> Tuple[int, Any]:
+        """
+        Removes an item from the left or right end of the selected lane.
+
+        Returns:
+            Tuple[int, Any]: The lane and the item.
+        """
+        if not self._size:
+            raise IndexError("pop from an empty deque")
+        lane = self._select()
+        items = self._lanes[lane]
+        item = items.popleft() if left else items.pop()
+        if not items:
+            self._bitmap &= ~(1 << lane)
+        self._size -= 1
+        return lane, item
+
+    def evict(self, count: int, left: bool) -> None:
+        """
+        Discards `count` items from the lowest-priority non-empty lanes, at
+        the end opposite to `left`, without consuming round-robin credit.
+        """
+        for _ in range(count):
+            lane = self._bitmap.bit_length() - 1
+            items = self._lanes[lane]
+            if left:
+                items.pop()
+            else:
+                items.popleft()
+            if not items:
+                self._bitmap &= ~(1 << lane)
+            self._size -= 1
+
+    def pop_routed(self, left: bool) -> _Routed:
+        """Removes an item like `pop`/`popleft` and tags it with its lane."""
+        return _Routed(*self._pop(left))
+
+    def append(self, entry: Any) -> None:
+        """Stores an entry at the right end of its lane."""
+        self._push(entry, left=False)
+
+    def appendleft(self, entry: Any) -> None:
+        """Stores an entry at the left end of its lane."""
+        self._push(entry, left=True)
+
+    def extend(self, entries: Iterable[Any]) -> None:
+        """Stores entries at the right ends of their lanes."""
+        for entry in entries:
+            self._push(entry, left=False)
+
+    def extendleft(self, entries: Iterable[Any]) -> None:
+        """Stores entries one by one at the left ends of their lanes."""
+        for entry in entries:
+            self._push(entry, left=True)
+
+    def pop(self) -> Any:
+        """Removes the rightmost item of the selected lane."""
+        return self._pop(left=False)[1]
+
+    def popleft(self) -> Any:
+        """Removes the leftmost item of the selected lane."""
+        return self._pop(left=True)[1]
+
+    def clear(self) -> None:
+        """Removes all items from all lanes."""
+        for items in self._lanes:
+            items.clear()
+        self._bitmap = 0
+        self._size = 0
+
+    def depths(self) -> List[int]:
+        """Returns the number of items in each lane."""
+        return [len(items) for items in self._lanes]
+
+    def __len__(self) -> int:
+        """Returns the total number of items."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over items lane by lane, highest priority first."""
+        for items in self._lanes:
+            yield from items
+
+
+class PriorityThreadSafeDeque(ThreadSafeDeque[T]):
+    """
+    A `ThreadSafeDeque` whose items are kept in K priority lanes.
+
+    Lane 0 has the highest priority. Getters first select a lane, then take
+    the item from the requested end of that lane, so `getleft` returns the
+    oldest item of the selected lane. Lanes are selected either by strict
+    priority (the lowest non-empty lane always wins) or by weighted round-robin,
+    where lane i gives up to ``weights[i]`` items before the next non-empty lane
+    is served.
+
+    `maxsize` bounds the total number of items over all lanes; task tracking
+    and `join` work exactly as in `ThreadSafeDeque`. The "drop_oldest" policy
+    evicts from the lowest-priority non-empty lane. Items returned by `nack`,
+    an expired lease or a closed consumer handle go back to their own lane.
+    """
+
+    def __init__(
+        self,
+        lanes: int = 2,
+        maxsize: int = 0,
+        weights: Optional[Sequence[int]] = None,
+        default_lane: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initializes the deque.
+
+        Args:
+            lanes (int): Number of priority lanes.
+            maxsize (int): Maximum number of items over all lanes. If 0, the queue is unbounded.
+            weights (Optional[Sequence[int]]): Per-lane weights for weighted
+                round-robin dequeuing. If None, lanes are served by strict priority.
+            default_lane (Optional[int]): Lane used when no lane is given.
+                Defaults to the lowest-priority lane.
+            **kwargs (Any): Further options forwarded to `ThreadSafeDeque`,
+                except `storage`.
+
+        Raises:
+            ValueError: If the lane configuration or maxsize is invalid, a
+                storage is given, or the overflow policy is "spill_to_disk".
+        """
+        if "storage" in kwargs:
+            raise ValueError("Priority deques store items in their own lanes.")
+        if kwargs.get("overflow") == "spill_to_disk":
+            raise ValueError("Priority deques cannot spill to disk.")
+        if lanes < 1:
+            raise ValueError("Number of lanes must be at least 1.")
+        if weights is not None:
+            if len(weights) != lanes:
+                raise ValueError("Exactly one weight per lane is required.")
+            if any(weight < 1 for weight in weights):
+                raise ValueError("Lane weights must be positive.")
+        if default_lane is None:
+            default_lane = lanes - 1
+        if not 0 <= default_lane < lanes:
+            raise ValueError("Default lane is out of range.")
+
+        storage = _Lanes(lanes, default_lane, weights)
+        super().__init__(maxsize, storage=lambda size: storage, **kwargs)
+        self._lanes_count = lanes
+
+    def _evict(self, count: int, left: bool) -> None:
+        # "drop_oldest" sheds the least urgent items rather than the ones a
+        # getter would select next.
+        self._deque.evict(count, left)  # type: ignore[attr-defined]
+
+    def _pop_entries(self, count: int, left: bool) -> Tuple[List[T], List[Any]]:
+        storage: _Lanes = self._deque  # type: ignore[assignment]
+        entries = [storage.pop_routed(left) for _ in range(count)]
+        self._items_removed(count, left)
+        return [entry.item for entry in entries], entries
+
+    def _route(self, item: T, lane: Optional[int]) -> Any:
+        """
+        Tags an item with its target lane.
+
+        Args:
+            item (T): The item to route.
+            lane (Optional[int]): Target lane, or None for the default lane.
+
+        Returns:
+            Any: The item itself or its routed wrapper.
+
+        Raises:
+            ValueError: If the lane is out of range.
+        """
+        if lane is None:
+            return item
+        if not 0 <= lane < self._lanes_count:
+            raise ValueError("Lane is out of range.")
+        return _Routed(lane, item)
+
+    def put(
+        self,
+        item: T,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        *,
+        lane: Optional[int] = None,
+    ) -> None:
+        """
+        Inserts an item at the right end of a lane.
+
+        Args:
+            item (T): The item to insert.
+            timeout (Optional[float]): Maximum time to wait for free space.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+            lane (Optional[int]): Target lane. Defaults to the default lane.
+
+        Raises:
+            ValueError: If the lane is out of range, or both a timeout and a deadline are given.
+            TimeoutError: If the operation times out.
+        """
+        self._base_put(
+            item=self._route(item, lane), timeout=timeout, left=False, deadline=deadline
+        )
+
+    def putleft(
+        self,
+        item: T,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        *,
+        lane: Optional[int] = None,
+    ) -> None:
+        """
+        Inserts an item at the left end of a lane.
+
+        Args:
+            item (T): The item to insert.
+            timeout (Optional[float]): Maximum time to wait for free space.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+            lane (Optional[int]): Target lane. Defaults to the default lane.
+
+        Raises:
+            ValueError: If the lane is out of range, or both a timeout and a deadline are given.
+            TimeoutError: If the operation times out.
+        """
+        self._base_put(
+            item=self._route(item, lane), timeout=timeout, left=True, deadline=deadline
+        )
+
+    def put_many(
+        self,
+        items: Iterable[T],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        *,
+        lane: Optional[int] = None,
+    ) -> None:
+        """
+        Inserts a batch of items at the right end of a lane, preserving their order.
+
+        Args:
+            items (Iterable[T]): The items to insert.
+            timeout (Optional[float]): Maximum total time to wait for free space.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+            lane (Optional[int]): Target lane. Defaults to the default lane.
+
+        Raises:
+            ValueError: If the lane is out of range, or both a timeout and a deadline are given.
+            PartialPutError: If the operation times out before the whole batch was inserted.
+        """
+        self._base_put_many(
+            items=[self._route(item, lane) for item in items],
+            timeout=timeout,
+            left=False,
+            deadline=deadline,
+        )
+
+    def putleft_many(
+        self,
+        items: Iterable[T],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        *,
+        lane: Optional[int] = None,
+    ) -> None:
+        """
+        Inserts a batch of items at the left end of a lane, as if `putleft` was
+        called for each of them.
+
+        Args:
+            items (Iterable[T]): The items to insert.
+            timeout (Optional[float]): Maximum total time to wait for free space.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+            lane (Optional[int]): Target lane. Defaults to the default lane.
+
+        Raises:
+            ValueError: If the lane is out of range, or both a timeout and a deadline are given.
+            PartialPutError: If the operation times out before the whole batch was inserted.
+        """
+        self._base_put_many(
+            items=[self._route(item, lane) for item in items],
+            timeout=timeout,
+            left=True,
+            deadline=deadline,
+        )
+
+    def lane_depths(self) -> List[int]:
+        """
+        Returns the number of items currently stored in each lane.
+
+        Returns:
+            List[int]: Item counts indexed by lane.
+        """
+        with self._mutex:
+            return self._deque.depths()  # type: ignore[attr-defined]
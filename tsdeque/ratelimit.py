@@ -0,0 +1,168 @@
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Optional
+
+
+@dataclass
+class RateLimitStats:
+    """
+    Point-in-time snapshot of a token bucket.
+
+    Attributes:
+        rate (float): Configured tokens per second.
+        burst (float): Bucket capacity.
+        tokens (float): Tokens available right now.
+        granted (int): Tokens handed out so far.
+        throttled (int): Waits callers spent on an empty bucket.
+        throttled_seconds (float): Total time spent in those waits.
+        observed_rate (float): Tokens granted per second over roughly the last
+            `window` seconds.
+    """
+
+    rate: float
+    burst: float
+    tokens: float
+    granted: int
+    throttled: int
+    throttled_seconds: float
+    observed_rate: float
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for `ThreadSafeDeque(get_limiter=..., put_limiter=...)`.
+
+    The bucket refills continuously at `rate` tokens per second up to `burst`
+    tokens and starts full. Every item stored or taken costs one token. The
+    deque consults the bucket inside its wait logic: a caller that finds it
+    empty sleeps exactly until the next token is due instead of polling.
+
+    The bucket is thread-safe, so one instance may throttle several deques
+    against a common budget.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        window: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            burst (Optional[float]): Maximum number of tokens; one second's
+                worth of `rate` (at least 1) by default.
+            window (float): Length in seconds of the window `observed_rate` is
+                measured over.
+            clock (Callable[[], float]): Monotonic clock in seconds.
+
+        Raises:
+            ValueError: If rate or window is not positive, or burst is less than 1.
+        """
+        if rate <= 0 or window <= 0:
+            raise ValueError("Rate and window must be positive.")
+        if burst is None:
+            burst = max(1.0, rate)
+        if burst < 1:
+            raise ValueError("Burst must be at least 1 token.")
+
+        self._rate = rate
+        self._burst = float(burst)
+        self._clock = clock
+        self._mutex = Lock()
+        self._tokens = self._burst
+        self._updated = clock()
+
+        self._granted = 0
+        self._throttled = 0
+        self._throttled_seconds = 0.0
+
+        # Sliding window approximated by the counts of the current and the
+        # previous fixed window.
+        self._window = window
+        self._window_start = self._updated
+        self._window_count = 0
+        self._previous_count = 0
+
+    def _refill(self, now: float) -> None:
+        """Adds the tokens accrued since the last update. Requires `_mutex`."""
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _roll_window(self, now: float) -> None:
+        """Advances the statistics window to `now`. Requires `_mutex`."""
+        elapsed = now - self._window_start
+        if elapsed >= self._window:
+            windows = int(elapsed // self._window)
+            self._previous_count = self._window_count if windows == 1 else 0
+            self._window_count = 0
+            self._window_start += windows * self._window
+
+    def take(self, count: int = 1) -> int:
+        """
+        Takes up to `count` tokens without waiting.
+
+        Args:
+            count (int): Number of tokens wanted.
+
+        Returns:
+            int: Number of tokens granted; 0 if the bucket holds less than one.
+        """
+        with self._mutex:
+            now = self._clock()
+            self._refill(now)
+            granted = min(count, int(self._tokens))
+            if granted > 0:
+                self._tokens -= granted
+                self._granted += granted
+                self._roll_window(now)
+                self._window_count += granted
+            return max(granted, 0)
+
+    def delay(self, count: int = 1) -> float:
+        """
+        Returns how long it takes until `count` tokens are available.
+
+        Args:
+            count (int): Number of tokens wanted; capped at the burst size.
+
+        Returns:
+            float: Seconds to wait; 0 if they are available now.
+        """
+        with self._mutex:
+            self._refill(self._clock())
+            missing = min(count, self._burst) - self._tokens
+            return max(0.0, missing / self._rate)
+
+    def _record_wait(self, seconds: float) -> None:
+        """Accounts for a caller that waited for a token."""
+        with self._mutex:
+            self._throttled += 1
+            self._throttled_seconds += seconds
+
+    def stats(self) -> RateLimitStats:
+        """
+        Returns a snapshot of the bucket's state and counters.
+
+        Returns:
+            RateLimitStats: The current statistics.
+        """
+        with self._mutex:
+            now = self._clock()
+            self._refill(now)
+            self._roll_window(now)
+            weight = 1 - (now - self._window_start) / self._window
+            observed = (self._previous_count * weight + self._window_count) / self._window
+            return RateLimitStats(
+                rate=self._rate,
+                burst=self._burst,
+                tokens=self._tokens,
+                granted=self._granted,
+                throttled=self._throttled,
+                throttled_seconds=self._throttled_seconds,
+                observed_rate=observed,
+            )
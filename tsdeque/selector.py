@@ -0,0 +1,189 @@
+import os
+from threading import Condition, Lock
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import tsdeque.timer as tmr
+from tsdeque.core import ThreadSafeDeque
+
+
+class DequeSelector:
+    """
+    Waits on many `ThreadSafeDeque`s at once.
+
+    Registering installs a listener that the deque invokes from its put path
+    whenever it goes from empty to non-empty, so `select` blocks on a single
+    condition and is woken by producers instead of polling the deques. The
+    selector keeps a set of possibly ready deques; `select` checks only those
+    and returns every one that actually holds items.
+
+    `fileno()` exposes a pipe that is readable while some registered deque may
+    be ready, so the selector can be watched by the `selectors` module or an
+    asyncio event loop (`loop.add_reader`). Readiness is level-triggered: the
+    pipe is drained by a `select` that finds no ready deque.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty selector."""
+        self._mutex = Lock()
+        self._changed = Condition(self._mutex)
+        self._registered: Dict[ThreadSafeDeque[Any], Any] = {}
+        # Bumped by every empty -> non-empty transition, so that `select` can
+        # tell a deque it saw empty apart from one that was refilled since.
+        self._generations: Dict[ThreadSafeDeque[Any], int] = {}
+        self._ready: Set[ThreadSafeDeque[Any]] = set()
+        self._pipe: Optional[Tuple[int, int]] = None
+        self._signalled = False
+
+    def _on_ready(self, dq: ThreadSafeDeque[Any]) -> None:
+        """Listener called by a deque that received items, with its mutex held."""
+        with self._mutex:
+            if dq not in self._registered:
+                return
+            self._generations[dq] += 1
+            self._ready.add(dq)
+            self._changed.notify_all()
+            self._signal()
+
+    def _signal(self) -> None:
+        """Makes the pipe readable. Requires `_mutex`."""
+        if self._pipe is not None and not self._signalled:
+            try:
+                os.write(self._pipe[1], b"\0")
+            except BlockingIOError:
+                pass
+            self._signalled = True
+
+    def _drain(self) -> None:
+        """Empties the pipe. Requires `_mutex`."""
+        if self._pipe is not None and self._signalled:
+            try:
+                while os.read(self._pipe[0], 4096):
+                    pass
+            except BlockingIOError:
+                pass
+            self._signalled = False
+
+    def register(self, dq: ThreadSafeDeque[Any], data: Any = None) -> None:
+        """
+        Starts watching a deque.
+
+        Args:
+            dq (ThreadSafeDeque[Any]): The deque to watch.
+            data (Any): Arbitrary value returned alongside the deque by `select`.
+
+        Raises:
+            KeyError: If the deque is already registered.
+        """
+        with self._mutex:
+            if dq in self._registered:
+                raise KeyError(f"{dq!r} is already registered.")
+            self._registered[dq] = data
+            self._generations[dq] = 0
+            # Checked by the next `select`; the deque may already hold items.
+            self._ready.add(dq)
+            self._changed.notify_all()
+            self._signal()
+        with dq._mutex:
+            dq._listeners.append(self._on_ready)
+
+    def unregister(self, dq: ThreadSafeDeque[Any]) -> None:
+        """
+        Stops watching a deque.
+
+        Args:
+            dq (ThreadSafeDeque[Any]): A registered deque.
+
+        Raises:
+            KeyError: If the deque is not registered.
+        """
+        with self._mutex:
+            if dq not in self._registered:
+                raise KeyError(f"{dq!r} is not registered.")
+            del self._registered[dq]
+            del self._generations[dq]
+            self._ready.discard(dq)
+        with dq._mutex:
+            dq._listeners.remove(self._on_ready)
+
+    def select(self, timeout: Optional[float] = None) -> List[Tuple[ThreadSafeDeque[Any], Any]]:
+        """
+        Waits until at least one registered deque holds items.
+
+        Items may still be taken by other consumers between `select` returning
+        and the caller's `get`, so callers should use non-blocking gets.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait. If None, waits
+                indefinitely; if 0, only checks.
+
+        Returns:
+            List[Tuple[ThreadSafeDeque[Any], Any]]: Every ready deque with the
+                data it was registered with; empty if the timeout expired.
+        """
+        timer = tmr.get_timer(timeout)
+        while True:
+            with self._mutex:
+                candidates = [(dq, self._generations[dq]) for dq in self._ready]
+
+            # Deque mutexes must not be taken while holding the selector's,
+            # because listeners acquire them in the opposite order.
+            ready = []
+            empty = []
+            for dq, generation in candidates:
+                if len(dq):
+                    ready.append(dq)
+                else:
+                    empty.append((dq, generation))
+
+            with self._mutex:
+                for dq, generation in empty:
+                    if self._generations.get(dq) == generation:
+                        self._ready.discard(dq)
+                result = [(dq, self._registered[dq]) for dq in ready if dq in self._registered]
+                if result:
+                    return result
+                if not self._ready:
+                    self._drain()
+                    wait_time = timer.get_spend()
+                    if wait_time is not None and wait_time <= 0:
+                        return []
+                    self._changed.wait(wait_time)
+
+    def fileno(self) -> int:
+        """
+        Returns the read end of a non-blocking pipe that is readable while a
+        registered deque may hold items. The pipe is created on first use.
+
+        Returns:
+            int: The file descriptor.
+        """
+        with self._mutex:
+            if self._pipe is None:
+                read_fd, write_fd = os.pipe()
+                os.set_blocking(read_fd, False)
+                os.set_blocking(write_fd, False)
+                self._pipe = (read_fd, write_fd)
+                if self._ready:
+                    self._signal()
+            return self._pipe[0]
+
+    def close(self) -> None:
+        """Unregisters every deque and closes the pipe."""
+        for dq in list(self._registered):
+            self.unregister(dq)
+        with self._mutex:
+            if self._pipe is not None:
+                os.close(self._pipe[0])
+                os.close(self._pipe[1])
+                self._pipe = None
+                self._signalled = False
+
+    def __len__(self) -> int:
+        """Returns the number of registered deques."""
+        return len(self._registered)
+
+    def __enter__(self) -> "DequeSelector":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,420 @@
+import itertools
+import os
+from collections import deque
+from threading import Lock, local
+from typing import Any, Deque, Generic, List, Optional, Tuple, TypeVar
+
+import tsdeque.timer as tmr
+from tsdeque.devent import Devent
+from tsdeque.exceptions import NoActiveTaskError
+
+T = TypeVar("T")
+
+
+class _Shard:
+    """A single lock-protected partition of a sharded deque."""
+
+    __slots__ = ("mutex", "items", "tasks")
+
+    def __init__(self) -> None:
+        self.mutex = Lock()
+        self.items: Deque[Any] = deque()
+        self.tasks = 0
+
+
+class ShardedThreadSafeDeque(Generic[T]):
+    """
+    A thread-safe unbounded double-ended queue that spreads items over several
+    independently locked shards to let many producers and consumers run in parallel.
+
+    Each thread is assigned a home shard on first use. Producers only ever lock
+    their home shard. Consumers start with their home shard and steal from the
+    other shards, at the same end, when it is empty.
+
+    Ordering:
+        With ``relaxed=True`` (default) only the items stored in one shard keep
+        their relative order, so items put by one thread are retrieved in FIFO
+        order by `getleft` (LIFO by `get`) but items of different threads may be
+        interleaved arbitrarily. With ``relaxed=False`` every item gets a ticket
+        when it is stored and consumers lock all shards to take the item with
+        the lowest (`getleft`) or highest (`get`) ticket, which restores the order
+        of `ThreadSafeDeque` for committed puts at the cost of serialising consumers.
+
+    Task tracking (`task_done`, `join`, `tasks_count`) has the same semantics as
+    in `ThreadSafeDeque`. Tasks are counted per shard; a consumer taking an item
+    from another shard moves its task to the consumer's home shard, so that
+    `task_done` normally locks only that shard.
+    """
+
+    def __init__(self, shards: Optional[int] = None, relaxed: bool = True):
+        """
+        Initializes the deque.
+
+        Args:
+            shards (Optional[int]): Number of shards. Defaults to the number of CPUs.
+            relaxed (bool): If False, keeps a global order across shards; see the
+                class docstring.
+
+        Raises:
+            ValueError: If shards is less than 1.
+        """
+        if shards is None:
+            shards = os.cpu_count() or 1
+        if shards < 1:
+            raise ValueError("Number of shards must be at least 1.")
+
+        self._shards: List[_Shard] = [_Shard() for _ in range(shards)]
+        self._relaxed = relaxed
+
+        self._local = local()
+        self._assignment = itertools.count()
+
+        # Tickets establish the global order in strict mode: right puts count up,
+        # left puts count down, so the smallest ticket is always the leftmost item.
+        self._right_tickets = itertools.count()
+        self._left_tickets = itertools.count(-1, -1)
+
+        # Consumers that found every shard empty sleep here. Producers only touch
+        # the condition when somebody is actually sleeping.
+        self._sleep_cond = tmr.WheelCondition(Lock())
+        self._sleepers = 0
+
+        self._empty_event = Devent()
+        self._empty_event.set()
+
+    def _home(self) -> int:
+        """
+        Returns the index of the calling thread's home shard, assigning one
+        round-robin on first use.
+
+        Returns:
+            int: Shard index.
+        """
+        try:
+            return self._local.index
+        except AttributeError:
+            index = next(self._assignment) % len(self._shards)
+            self._local.index = index
+            return index
+
+    def _lock_all(self) -> None:
+        """Acquires every shard lock in index order."""
+        for shard in self._shards:
+            shard.mutex.acquire()
+
+    def _unlock_all(self) -> None:
+        """Releases every shard lock."""
+        for shard in reversed(self._shards):
+            shard.mutex.release()
+
+    def _base_put(self, item: T, left: bool) -> None:
+        """
+        Internal method to insert an item into the calling thread's home shard.
+
+        Args:
+            item (T): The item to insert.
+            left (bool): If True, inserts the item at the left end; otherwise, at the right.
+        """
+        shard = self._shards[self._home()]
+        with shard.mutex:
+            if not self._relaxed:
+                ticket = next(self._left_tickets if left else self._right_tickets)
+                item = (ticket, item)  # type: ignore[assignment]
+            if left:
+                shard.items.appendleft(item)
+            else:
+                shard.items.append(item)
+            if shard.tasks == 0:
+                self._empty_event.unset()
+            shard.tasks += 1
+
+        if self._sleepers:
+            with self._sleep_cond:
+                self._sleep_cond.notify()
+
+    def _try_get_relaxed(self, left: bool, peek: bool = True) -> Tuple[bool, Any]:
+        """
+        Takes an item from the home shard, or steals one from another shard.
+
+        Args:
+            left (bool): If True, takes items from the left end; otherwise, from the right.
+            peek (bool): If True, shards that look empty without locking are skipped.
+
+        Returns:
+            Tuple[bool, Any]: Whether an item was found, and the item.
+        """
+        shards = self._shards
+        start = self._home()
+        home = shards[start]
+        for offset in range(len(shards)):
+            index = (start + offset) % len(shards)
+            shard = shards[index]
+            if peek and not shard.items:
+                continue
+            if shard is home:
+                with shard.mutex:
+                    if shard.items:
+                        return True, shard.items.popleft() if left else shard.items.pop()
+                continue
+            # Locks are taken in index order, like `_lock_all`.
+            first, second = (home, shard) if start < index else (shard, home)
+            with first.mutex, second.mutex:
+                if shard.items:
+                    self._move_task(shard, home)
+                    return True, shard.items.popleft() if left else shard.items.pop()
+        return False, None
+
+    @staticmethod
+    def _move_task(source: _Shard, target: _Shard) -> None:
+        """
+        Moves one task of a stolen item to the consumer's home shard, so that
+        its `task_done` stays on the single-shard path. Must be called with
+        both shard locks held.
+
+        Args:
+            source (_Shard): The shard the item was taken from.
+            target (_Shard): The consumer's home shard.
+        """
+        if source.tasks > 0:
+            source.tasks -= 1
+            target.tasks += 1
+
+    def _try_get_strict(self, left: bool, peek: bool = True) -> Tuple[bool, Any]:
+        """
+        Takes the item with the lowest (left) or highest (right) ticket across all shards.
+
+        Args:
+            left (bool): If True, takes items from the left end; otherwise, from the right.
+            peek (bool): Unused; every shard is always locked.
+
+        Returns:
+            Tuple[bool, Any]: Whether an item was found, and the item.
+        """
+        self._lock_all()
+        try:
+            best: Optional[_Shard] = None
+            for shard in self._shards:
+                if not shard.items:
+                    continue
+                if best is None:
+                    best = shard
+                elif left and shard.items[0][0] < best.items[0][0]:
+                    best = shard
+                elif not left and shard.items[-1][0] > best.items[-1][0]:
+                    best = shard
+            if best is None:
+                return False, None
+            home = self._shards[self._home()]
+            if best is not home:
+                self._move_task(best, home)
+            _, item = best.items.popleft() if left else best.items.pop()
+            return True, item
+        finally:
+            self._unlock_all()
+
+    def _base_get(self, timeout: Optional[float], left: bool) -> T:
+        """
+        Internal method to remove and return an item from either end.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait if every shard is empty.
+                If None, the method blocks indefinitely.
+            left (bool): If True, removes the item from the left end; otherwise, from the right.
+
+        Returns:
+            T: The item retrieved from the queue.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for an item to become available.
+        """
+        try_get = self._try_get_relaxed if self._relaxed else self._try_get_strict
+
+        found, item = try_get(left)
+        if found:
+            return item
+
+        timer = tmr.get_timer(timeout)
+        with self._sleep_cond:
+            self._sleepers += 1
+            try:
+                while True:
+                    # Rescan under the shard locks after registering as a sleeper:
+                    # a producer either stored its item before this scan or will
+                    # see `_sleepers`.
+                    found, item = try_get(left, peek=False)
+                    if found:
+                        return item
+                    wait_time = timer.get_spend()
+                    if wait_time is not None and wait_time <= 0:
+                        raise TimeoutError(
+                            "The timeout has expired while waiting for an item."
+                        )
+                    self._sleep_cond.wait(timer)
+            finally:
+                self._sleepers -= 1
+
+    def put(self, item: T) -> None:
+        """
+        Inserts an item at the right end of the calling thread's home shard.
+
+        Args:
+            item (T): The item to insert.
+        """
+        self._base_put(item=item, left=False)
+
+    def putleft(self, item: T) -> None:
+        """
+        Inserts an item at the left end of the calling thread's home shard.
+
+        Args:
+            item (T): The item to insert.
+        """
+        self._base_put(item=item, left=True)
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns an item from the right end of a shard.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+
+        Returns:
+            T: The retrieved item.
+
+        Raises:
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get(timeout=timeout, left=False)
+
+    def getleft(self, timeout: Optional[float] = None) -> T:
+        """
+        Removes and returns an item from the left end of a shard.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+
+        Returns:
+            T: The retrieved item.
+
+        Raises:
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get(timeout=timeout, left=True)
+
+    def _drop_tasks(self, count: int) -> None:
+        """
+        Removes `count` tasks from whichever shards hold them and sets the join
+        event when none are left. Must be called with every shard lock held.
+
+        Args:
+            count (int): Number of tasks to remove; must not exceed the total.
+        """
+        for shard in self._shards:
+            taken = min(shard.tasks, count)
+            shard.tasks -= taken
+            count -= taken
+        if all(shard.tasks == 0 for shard in self._shards):
+            self._empty_event.set()
+
+    def _set_if_all_done(self) -> None:
+        """
+        Sets the join event if no shard has unfinished tasks. The event is only
+        ever set with every shard lock held, so it cannot overwrite the unset
+        made by a concurrent put.
+        """
+        # Unlocked peek: all locks are taken only to confirm a total of zero.
+        # Whichever thread drains the last shard sees every count at zero.
+        if any(shard.tasks for shard in self._shards):
+            return
+        self._lock_all()
+        try:
+            if all(shard.tasks == 0 for shard in self._shards):
+                self._empty_event.set()
+        finally:
+            self._unlock_all()
+
+    def task_done(self, count: int = 1) -> None:
+        """
+        Decrements the task counter. Used to indicate that previously enqueued
+        tasks are complete.
+
+        Args:
+            count (int): Number of completed tasks. Defaults to 1.
+
+        Raises:
+            ValueError: If count is less than 1.
+            NoActiveTaskError: If called more times than there were tasks.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+
+        shard = self._shards[self._home()]
+        with shard.mutex:
+            fast = shard.tasks >= count
+            if fast:
+                shard.tasks -= count
+                drained = shard.tasks == 0
+        if fast:
+            if drained:
+                self._set_if_all_done()
+            return
+
+        self._lock_all()
+        try:
+            if sum(shard.tasks for shard in self._shards) < count:
+                raise NoActiveTaskError("All tasks have already been completed.")
+            self._drop_tasks(count)
+        finally:
+            self._unlock_all()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Blocks until all items in the queue have been marked as done via `task_done`.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait. If None, waits indefinitely.
+        """
+        self._empty_event.wait_set(timeout)
+
+    def tasks_count(self) -> int:
+        """
+        Returns the current number of active tasks.
+
+        Returns:
+            int: The number of unfinished tasks.
+        """
+        self._lock_all()
+        try:
+            return sum(shard.tasks for shard in self._shards)
+        finally:
+            self._unlock_all()
+
+    def clear(self) -> None:
+        """
+        Removes all items from the queue and drops their tasks.
+        """
+        self._lock_all()
+        try:
+            removed = 0
+            for shard in self._shards:
+                removed += len(shard.items)
+                shard.items.clear()
+            # Tasks are not bound to the shard their item lives in.
+            self._drop_tasks(removed)
+        finally:
+            self._unlock_all()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items currently stored in all shards.
+
+        Returns:
+            int: The number of items in the queue.
+        """
+        self._lock_all()
+        try:
+            return sum(len(shard.items) for shard in self._shards)
+        finally:
+            self._unlock_all()
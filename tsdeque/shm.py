@@ -0,0 +1,490 @@
+import os
+import struct
+from contextlib import contextmanager
+from multiprocessing import get_context, shared_memory
+from typing import Any, Dict, Iterator, Optional
+
+import tsdeque.timer as tmr
+from tsdeque.exceptions import NoActiveTaskError
+
+# Header fields, stored as signed 64-bit integers at the start of the segment.
+_HEAD = 0
+_COUNT = 1
+_TASKS = 2
+_FREE = 3
+_HEADER_FIELDS = 4
+_HEADER_SIZE = _HEADER_FIELDS * 8
+
+# Every data slot starts with the length of its payload.
+_LENGTH = struct.Struct("<I")
+
+
+class SharedMemoryDeque:
+    """
+    A bounded, process-safe deque of byte strings kept in a
+    `multiprocessing.shared_memory` segment.
+
+    The segment holds a header, a ring of slot numbers that forms the deque,
+    a stack of free slot numbers and `capacity` data slots of `slot_size`
+    bytes, each prefixed with the payload length. Items are copied into a slot
+    once on `put` and can be read without copying through `get_view`; a slot
+    stays leased, and counts against capacity, until its view is released.
+
+    Waiting is done on `multiprocessing` conditions, which are backed by
+    named semaphores, so blocked processes sleep instead of polling. The deque
+    can be passed to child processes like any other `multiprocessing`
+    synchronisation primitive, e.g. as a `Process` argument.
+
+    Task tracking mirrors `ThreadSafeDeque`: every put adds a task that a
+    consumer completes with `task_done`, and `join` waits for all of them.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        slot_size: int = 4096,
+        name: Optional[str] = None,
+        ctx: Any = None,
+    ):
+        """
+        Creates the shared memory segment and synchronisation primitives.
+
+        Args:
+            capacity (int): Maximum number of items, including leased ones.
+            slot_size (int): Maximum size of a single item in bytes.
+            name (Optional[str]): Name of the segment. Generated if None.
+            ctx (Any): `multiprocessing` context used to create the lock and
+                conditions. Defaults to the default context.
+
+        Raises:
+            ValueError: If capacity or slot_size is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+        if slot_size < 1:
+            raise ValueError("Slot size must be at least 1.")
+
+        ctx = ctx if ctx is not None else get_context()
+        size = _HEADER_SIZE + capacity * 8 + capacity * (_LENGTH.size + slot_size)
+
+        self._capacity = capacity
+        self._slot_size = slot_size
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._owner_pid: Optional[int] = os.getpid()
+
+        self._mutex = ctx.Lock()
+        self._not_empty = ctx.Condition(self._mutex)
+        self._not_full = ctx.Condition(self._mutex)
+        self._all_done = ctx.Condition(self._mutex)
+
+        self._attach()
+        self._header[_HEAD] = 0
+        self._header[_COUNT] = 0
+        self._header[_TASKS] = 0
+        self._header[_FREE] = capacity
+        for slot in range(capacity):
+            self._free[slot] = slot
+
+    def _attach(self) -> None:
+        """Creates typed views over the regions of the shared memory segment."""
+        buf = self._shm.buf
+        ring_start = _HEADER_SIZE
+        free_start = ring_start + self._capacity * 4
+        data_start = free_start + self._capacity * 4
+
+        self._header = buf[:_HEADER_SIZE].cast("q")
+        self._ring = buf[ring_start:free_start].cast("i")
+        self._free = buf[free_start:data_start].cast("i")
+        self._data = buf[data_start:]
+        self._stride = _LENGTH.size + self._slot_size
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "name": self._shm.name,
+            "capacity": self._capacity,
+            "slot_size": self._slot_size,
+            "mutex": self._mutex,
+            "not_empty": self._not_empty,
+            "not_full": self._not_full,
+            "all_done": self._all_done,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._capacity = state["capacity"]
+        self._slot_size = state["slot_size"]
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._owner_pid = None
+        self._mutex = state["mutex"]
+        self._not_empty = state["not_empty"]
+        self._not_full = state["not_full"]
+        self._all_done = state["all_done"]
+        self._attach()
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment."""
+        return self._shm.name
+
+    def _wait(self, condition: Any, ready: Any, timer: tmr.AnyTimer, message: str) -> None:
+        """
+        Waits on a condition until `ready()` is true. Must be called with `_mutex` held.
+
+        Args:
+            condition (Any): The condition to wait on.
+            ready (Any): Predicate checked after every wake-up.
+            timer (AnyTimer): Timer tracking the time left to wait.
+            message (str): Message of the TimeoutError.
+
+        Raises:
+            TimeoutError: If the timeout is reached before the predicate holds.
+        """
+        while not ready():
+            wait_time = timer.get_spend()
+            if wait_time is not None and wait_time <= 0:
+                raise TimeoutError(message)
+            condition.wait(wait_time)
+
+    def _store(self, data: memoryview, left: bool) -> None:
+        """
+        Copies an item into a free slot and links it at one end of the ring.
+        Must be called with `_mutex` held and a free slot available.
+
+        Args:
+            data (memoryview): The item's bytes.
+            left (bool): If True, links the item at the left end; otherwise, at the right.
+        """
+        header = self._header
+        header[_FREE] -= 1
+        slot = self._free[header[_FREE]]
+
+        offset = slot * self._stride
+        _LENGTH.pack_into(self._data, offset, data.nbytes)
+        start = offset + _LENGTH.size
+        self._data[start : start + data.nbytes] = data
+
+        if left:
+            header[_HEAD] = (header[_HEAD] - 1) % self._capacity
+            self._ring[header[_HEAD]] = slot
+        else:
+            self._ring[(header[_HEAD] + header[_COUNT]) % self._capacity] = slot
+        header[_COUNT] += 1
+        header[_TASKS] += 1
+        self._not_empty.notify()
+
+    def _take(self, left: bool) -> int:
+        """
+        Unlinks the slot at one end of the ring. Must be called with `_mutex`
+        held and at least one item stored.
+
+        Args:
+            left (bool): If True, unlinks the leftmost slot; otherwise, the rightmost.
+
+        Returns:
+            int: The unlinked slot, still holding the item.
+        """
+        header = self._header
+        if left:
+            slot = self._ring[header[_HEAD]]
+            header[_HEAD] = (header[_HEAD] + 1) % self._capacity
+        else:
+            slot = self._ring[(header[_HEAD] + header[_COUNT] - 1) % self._capacity]
+        header[_COUNT] -= 1
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """
+        Returns a slot to the free stack. Must be called with `_mutex` held.
+
+        Args:
+            slot (int): The slot to release.
+        """
+        header = self._header
+        self._free[header[_FREE]] = slot
+        header[_FREE] += 1
+        self._not_full.notify()
+
+    def _slot_view(self, slot: int) -> memoryview:
+        """Returns a view of the payload stored in a slot."""
+        offset = slot * self._stride
+        (length,) = _LENGTH.unpack_from(self._data, offset)
+        start = offset + _LENGTH.size
+        return self._data[start : start + length]
+
+    def _base_put(self, item: Any, timeout: Optional[float], left: bool) -> None:
+        """
+        Internal method to insert an item from either end, waiting for a free slot.
+
+        Args:
+            item (Any): A bytes-like object to insert.
+            timeout (Optional[float]): Maximum time to wait for a free slot.
+                If None, the method blocks indefinitely.
+            left (bool): If True, inserts the item at the left end; otherwise, at the right.
+
+        Raises:
+            ValueError: If the item does not fit into a slot.
+            TimeoutError: If the timeout is reached while waiting for a free slot.
+        """
+        with memoryview(item) as data, data.cast("B") as data:
+            if data.nbytes > self._slot_size:
+                raise ValueError(
+                    f"Item of {data.nbytes} bytes exceeds the slot size of {self._slot_size} bytes."
+                )
+            with self._mutex:
+                if not self._header[_FREE]:
+                    self._wait(
+                        self._not_full,
+                        lambda: self._header[_FREE] > 0,
+                        tmr.get_timer(timeout),
+                        "The timeout has expired while waiting for available space.",
+                    )
+                self._store(data, left)
+
+    def _wait_for_item(self, timeout: Optional[float]) -> None:
+        """
+        Blocks until at least one item is stored. Must be called with `_mutex` held.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait. If None, waits indefinitely.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for an item.
+        """
+        if not self._header[_COUNT]:
+            self._wait(
+                self._not_empty,
+                lambda: self._header[_COUNT] > 0,
+                tmr.get_timer(timeout),
+                "The timeout has expired while waiting for an item.",
+            )
+
+    def _base_get(self, timeout: Optional[float], left: bool) -> bytes:
+        """
+        Internal method to remove an item from either end and return a copy of it.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, the method blocks indefinitely.
+            left (bool): If True, removes the item from the left end; otherwise, from the right.
+
+        Returns:
+            bytes: The retrieved item.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for an item.
+        """
+        with self._mutex:
+            self._wait_for_item(timeout)
+            slot = self._take(left)
+            with self._slot_view(slot) as view:
+                item = bytes(view)
+            self._release(slot)
+            return item
+
+    @contextmanager
+    def _base_get_view(self, timeout: Optional[float], left: bool) -> Iterator[memoryview]:
+        """
+        Internal method to remove an item from either end and lend out a view
+        of its slot until the context exits.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, the method blocks indefinitely.
+            left (bool): If True, removes the item from the left end; otherwise, from the right.
+
+        Yields:
+            memoryview: Read-only view of the item's bytes in shared memory.
+
+        Raises:
+            TimeoutError: If the timeout is reached while waiting for an item.
+        """
+        with self._mutex:
+            self._wait_for_item(timeout)
+            slot = self._take(left)
+
+        view = self._slot_view(slot)
+        readonly = view.toreadonly()
+        try:
+            yield readonly
+        finally:
+            readonly.release()
+            view.release()
+            with self._mutex:
+                self._release(slot)
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        """
+        Inserts an item at the right end of the queue.
+
+        Args:
+            item (Any): A bytes-like object to insert.
+            timeout (Optional[float]): Maximum time to wait for a free slot.
+                If None, waits indefinitely.
+
+        Raises:
+            ValueError: If the item does not fit into a slot.
+            TimeoutError: If the operation times out.
+        """
+        self._base_put(item=item, timeout=timeout, left=False)
+
+    def putleft(self, item: Any, timeout: Optional[float] = None) -> None:
+        """
+        Inserts an item at the left end of the queue.
+
+        Args:
+            item (Any): A bytes-like object to insert.
+            timeout (Optional[float]): Maximum time to wait for a free slot.
+                If None, waits indefinitely.
+
+        Raises:
+            ValueError: If the item does not fit into a slot.
+            TimeoutError: If the operation times out.
+        """
+        self._base_put(item=item, timeout=timeout, left=True)
+
+    def get(self, timeout: Optional[float] = None) -> bytes:
+        """
+        Removes and returns a copy of the item at the right end of the queue.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+
+        Returns:
+            bytes: The retrieved item.
+
+        Raises:
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get(timeout=timeout, left=False)
+
+    def getleft(self, timeout: Optional[float] = None) -> bytes:
+        """
+        Removes and returns a copy of the item at the left end of the queue.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+
+        Returns:
+            bytes: The retrieved item.
+
+        Raises:
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get(timeout=timeout, left=True)
+
+    def get_view(self, timeout: Optional[float] = None) -> Any:
+        """
+        Removes the item at the right end of the queue and lends out a
+        zero-copy view of it. The view is released and its slot reused once
+        the context exits; do not keep references to it.
+
+        Usage:
+            with dq.get_view() as view:
+                process(view)
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+
+        Returns:
+            ContextManager[memoryview]: Context yielding a read-only view of the item.
+
+        Raises:
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get_view(timeout=timeout, left=False)
+
+    def getleft_view(self, timeout: Optional[float] = None) -> Any:
+        """
+        Removes the item at the left end of the queue and lends out a
+        zero-copy view of it, like `get_view`.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for an item.
+                If None, waits indefinitely.
+
+        Returns:
+            ContextManager[memoryview]: Context yielding a read-only view of the item.
+
+        Raises:
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get_view(timeout=timeout, left=True)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Blocks until all tasks are marked as done, or the timeout elapses.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait. If None, waits indefinitely.
+        """
+        with self._mutex:
+            try:
+                self._wait(
+                    self._all_done,
+                    lambda: self._header[_TASKS] == 0,
+                    tmr.get_timer(timeout),
+                    "",
+                )
+            except TimeoutError:
+                pass
+
+    def task_done(self, count: int = 1) -> None:
+        """
+        Marks `count` tasks as completed.
+
+        Args:
+            count (int): Number of tasks to mark as done.
+
+        Raises:
+            ValueError: If count is less than 1.
+            NoActiveTaskError: If there are fewer unfinished tasks than `count`.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+        with self._mutex:
+            if count > self._header[_TASKS]:
+                raise NoActiveTaskError("All tasks have already been completed.")
+            self._header[_TASKS] -= count
+            if self._header[_TASKS] == 0:
+                self._all_done.notify_all()
+
+    def tasks_count(self) -> int:
+        """
+        Returns the number of unfinished tasks.
+
+        Returns:
+            int: Number of tasks not yet marked as done.
+        """
+        with self._mutex:
+            return self._header[_TASKS]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items currently stored, excluding leased ones.
+
+        Returns:
+            int: Number of items in the queue.
+        """
+        with self._mutex:
+            return self._header[_COUNT]
+
+    def close(self) -> None:
+        """
+        Detaches this process from the shared memory segment. The deque must
+        not be used afterwards. The creating process also destroys the segment;
+        forked children inheriting the deque only detach.
+        """
+        for view in (self._header, self._ring, self._free, self._data):
+            view.release()
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
+            self._owner_pid = None
+
+    def __enter__(self) -> "SharedMemoryDeque":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
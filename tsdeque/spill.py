@@ -0,0 +1,431 @@
+import mmap
+import os
+import pickle
+import tempfile
+import weakref
+from array import array
+from collections import deque
+from typing import Any, Deque, Iterator, Optional, Protocol
+
+from tsdeque.storage import Storage
+
+# Default size of a segment file. Files are sparse, so only written records
+# take up disk space.
+DEFAULT_SEGMENT_SIZE = 64 * 2**20
+
+
+class Serializer(Protocol):
+    """Converts items to and from bytes. The `pickle` module is one."""
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class RawBytes:
+    """Passthrough serializer for items that already are bytes-like objects."""
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        return obj
+
+    @staticmethod
+    def loads(data: bytes) -> bytes:
+        return data
+
+
+def _remove_file(segment_map: mmap.mmap, fd: int, path: str) -> None:
+    """Unmaps, closes and deletes a segment file."""
+    segment_map.close()
+    os.close(fd)
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class _Segment:
+    """
+    An append-only, memory-mapped file of records.
+
+    Records are written one after another; `offsets` and `lengths` index them
+    in write order. The live records are those between `lo` and `hi`. A
+    forward segment holds them in logical order; a backward segment receives
+    items put at the left end, so its logical order is the reverse of the
+    write order.
+    """
+
+    __slots__ = (
+        "backward",
+        "offsets",
+        "lengths",
+        "lo",
+        "hi",
+        "_end",
+        "_map",
+        "_finalizer",
+        "__weakref__",
+    )
+
+    def __init__(self, directory: Optional[str], size: int, backward: bool) -> None:
+        """
+        Creates and maps the segment file.
+
+        Args:
+            directory (Optional[str]): Directory of the file; the platform's
+                temporary directory if None.
+            size (int): File size in bytes.
+            backward (bool): Whether the segment receives left-end items.
+        """
+        fd, path = tempfile.mkstemp(prefix="tsdeque-", suffix=".seg", dir=directory)
+        try:
+            os.ftruncate(fd, size)
+            segment_map = mmap.mmap(fd, size)
+        except BaseException:
+            os.close(fd)
+            os.unlink(path)
+            raise
+        self._map = segment_map
+        self._finalizer = weakref.finalize(self, _remove_file, segment_map, fd, path)
+        self.backward = backward
+        self.offsets = array("q")
+        self.lengths = array("q")
+        self.lo = 0
+        self.hi = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self.hi - self.lo
+
+    def fits(self, size: int) -> bool:
+        """Checks whether a record of `size` bytes can still be written."""
+        return self._end + size <= len(self._map)
+
+    def write(self, data: bytes) -> None:
+        """Appends a record after the last live one in write order."""
+        if self.hi < len(self.offsets):
+            # Records popped from the write end are dead; forget them.
+            del self.offsets[self.hi :]
+            del self.lengths[self.hi :]
+        end = self._end + len(data)
+        self._map[self._end : end] = data
+        self.offsets.append(self._end)
+        self.lengths.append(len(data))
+        self._end = end
+        self.hi += 1
+
+    def read(self, index: int) -> bytes:
+        """Returns the record with the given write-order index."""
+        offset = self.offsets[index]
+        return self._map[offset : offset + self.lengths[index]]
+
+    def take_first(self) -> bytes:
+        """Removes and returns the logically first live record."""
+        if self.backward:
+            self.hi -= 1
+            return self.read(self.hi)
+        self.lo += 1
+        return self.read(self.lo - 1)
+
+    def take_last(self) -> bytes:
+        """Removes and returns the logically last live record."""
+        if self.backward:
+            self.lo += 1
+            return self.read(self.lo - 1)
+        self.hi -= 1
+        return self.read(self.hi)
+
+    def records(self) -> Iterator[bytes]:
+        """Iterates over live records in logical order."""
+        indexes = range(self.lo, self.hi)
+        for index in reversed(indexes) if self.backward else indexes:
+            yield self.read(index)
+
+    def remove(self) -> None:
+        """Deletes the segment file."""
+        self._finalizer()
+
+
+class SegmentStore:
+    """
+    Disk-backed deque of serialized items kept in memory-mapped segment files.
+
+    Items added at the right end are appended to the last forward segment and
+    items added at the left end to the first backward segment, so files are
+    only ever appended to. Only the record index stays in memory. A segment
+    file is deleted as soon as its last live record is consumed.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        serializer: Serializer = pickle,  # type: ignore[assignment]
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+    ) -> None:
+        """
+        Initializes an empty store. No file is created until the first item arrives.
+
+        Args:
+            directory (Optional[str]): Directory of the segment files. Defaults
+                to the platform's temporary directory.
+            serializer (Serializer): Object with `dumps`/`loads`, e.g. `pickle`
+                (default), `msgpack` or `RawBytes`.
+            segment_size (int): Size of a segment file in bytes. Larger records
+                get a segment of their own.
+        """
+        self._directory = directory
+        self._serializer = serializer
+        self._segment_size = segment_size
+        self._segments: Deque[_Segment] = deque()
+        self._size = 0
+
+    @property
+    def segments(self) -> int:
+        """Number of segment files currently on disk."""
+        return len(self._segments)
+
+    def _writable(self, data: bytes, left: bool) -> _Segment:
+        """Returns the segment the next record at the given end goes to."""
+        segments = self._segments
+        if segments:
+            segment = segments[0] if left else segments[-1]
+            if segment.backward == left and segment.fits(len(data)):
+                return segment
+        segment = _Segment(self._directory, max(self._segment_size, len(data)), left)
+        if left:
+            segments.appendleft(segment)
+        else:
+            segments.append(segment)
+        return segment
+
+    def _reclaim(self, segment: _Segment, left: bool) -> None:
+        """Deletes a segment at one end once it has no live records."""
+        if not len(segment):
+            if left:
+                self._segments.popleft()
+            else:
+                self._segments.pop()
+            segment.remove()
+
+    def append(self, item: Any) -> None:
+        data = self._serializer.dumps(item)
+        self._writable(data, left=False).write(data)
+        self._size += 1
+
+    def appendleft(self, item: Any) -> None:
+        data = self._serializer.dumps(item)
+        self._writable(data, left=True).write(data)
+        self._size += 1
+
+    def pop(self) -> Any:
+        if not self._size:
+            raise IndexError("pop from an empty segment store")
+        segment = self._segments[-1]
+        item = self._serializer.loads(segment.take_last())
+        self._size -= 1
+        self._reclaim(segment, left=False)
+        return item
+
+    def popleft(self) -> Any:
+        if not self._size:
+            raise IndexError("pop from an empty segment store")
+        segment = self._segments[0]
+        item = self._serializer.loads(segment.take_first())
+        self._size -= 1
+        self._reclaim(segment, left=True)
+        return item
+
+    def clear(self) -> None:
+        for segment in self._segments:
+            segment.remove()
+        self._segments.clear()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        for segment in list(self._segments):
+            for data in segment.records():
+                yield self._serializer.loads(data)
+
+
+class SpillingStorage:
+    """
+    Storage keeping at most `capacity` items in memory and the rest on disk.
+
+    The logical sequence is the in-memory items followed by the spilled ones.
+    Whenever anything is spilled, memory is full: items leaving the left end
+    are immediately replaced from the head of the spill, items taken from the
+    right end come from the tail of the spill, and items put at the left end
+    push the rightmost in-memory item to the head of the spill.
+    """
+
+    def __init__(self, memory: Storage, capacity: int, spill: SegmentStore) -> None:
+        """
+        Initializes the storage.
+
+        Args:
+            memory (Storage): Empty in-memory storage.
+            capacity (int): Maximum number of items kept in memory.
+            spill (SegmentStore): Empty disk storage for the overflow.
+        """
+        self._memory = memory
+        self._capacity = capacity
+        self._spill = spill
+
+    @property
+    def spilled(self) -> int:
+        """Number of items currently stored on disk."""
+        return len(self._spill)
+
+    def append(self, item: Any) -> None:
+        if self._spill or len(self._memory) >= self._capacity:
+            self._spill.append(item)
+        else:
+            self._memory.append(item)
+
+    def appendleft(self, item: Any) -> None:
+        if len(self._memory) >= self._capacity:
+            displaced = self._memory.pop()
+            try:
+                self._spill.appendleft(displaced)
+            except BaseException:
+                self._memory.append(displaced)
+                raise
+        self._memory.appendleft(item)
+
+    def extend(self, items: Any) -> None:
+        for item in items:
+            self.append(item)
+
+    def extendleft(self, items: Any) -> None:
+        for item in items:
+            self.appendleft(item)
+
+    def pop(self) -> Any:
+        if self._spill:
+            return self._spill.pop()
+        return self._memory.pop()
+
+    def popleft(self) -> Any:
+        item = self._memory.popleft()
+        if self._spill:
+            self._memory.append(self._spill.popleft())
+        return item
+
+    def clear(self) -> None:
+        self._memory.clear()
+        self._spill.clear()
+
+    def __len__(self) -> int:
+        return len(self._memory) + len(self._spill)
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self._memory
+        yield from self._spill
+
+
+class TieredStorage:
+    """
+    Storage with hot in-memory windows at both ends and the middle on disk.
+
+    The logical sequence is ``left + middle + right``. Each window holds up
+    to `window` items; when a put overflows a window, the item closest to the
+    middle moves into it (straight into the other window while the middle is
+    empty). A getter that finds its window empty pages in up to `window`
+    items from the matching end of the middle, so disk is read in batches and
+    only when consumers actually reach spilled items.
+    """
+
+    def __init__(self, window: int, middle: SegmentStore) -> None:
+        """
+        Initializes the storage.
+
+        Args:
+            window (int): Maximum number of items in each in-memory window.
+            middle (SegmentStore): Empty disk storage for the middle.
+        """
+        self._window = window
+        self._left: Deque[Any] = deque()
+        self._right: Deque[Any] = deque()
+        self._middle = middle
+
+    @property
+    def spilled(self) -> int:
+        """Number of items currently stored on disk."""
+        return len(self._middle)
+
+    @property
+    def segments(self) -> int:
+        """Number of segment files currently on disk."""
+        return self._middle.segments
+
+    def append(self, item: Any) -> None:
+        right = self._right
+        right.append(item)
+        if len(right) > self._window:
+            if not self._middle and len(self._left) < self._window:
+                self._left.append(right.popleft())
+            else:
+                inner = right.popleft()
+                try:
+                    self._middle.append(inner)
+                except BaseException:
+                    right.appendleft(inner)
+                    right.pop()
+                    raise
+
+    def appendleft(self, item: Any) -> None:
+        left = self._left
+        left.appendleft(item)
+        if len(left) > self._window:
+            if not self._middle and len(self._right) < self._window:
+                self._right.appendleft(left.pop())
+            else:
+                inner = left.pop()
+                try:
+                    self._middle.appendleft(inner)
+                except BaseException:
+                    left.append(inner)
+                    left.popleft()
+                    raise
+
+    def extend(self, items: Any) -> None:
+        for item in items:
+            self.append(item)
+
+    def extendleft(self, items: Any) -> None:
+        for item in items:
+            self.appendleft(item)
+
+    def popleft(self) -> Any:
+        if not self._left:
+            middle = self._middle
+            for _ in range(min(self._window, len(middle))):
+                self._left.append(middle.popleft())
+            if not self._left:
+                return self._right.popleft()
+        return self._left.popleft()
+
+    def pop(self) -> Any:
+        if not self._right:
+            middle = self._middle
+            for _ in range(min(self._window, len(middle))):
+                self._right.appendleft(middle.pop())
+            if not self._right:
+                return self._left.pop()
+        return self._right.pop()
+
+    def clear(self) -> None:
+        self._left.clear()
+        self._middle.clear()
+        self._right.clear()
+
+    def __len__(self) -> int:
+        return len(self._left) + len(self._middle) + len(self._right)
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self._left
+        yield from self._middle
+        yield from self._right
@@ -0,0 +1,81 @@
+import pickle
+from typing import Any, Optional, TypeVar
+
+from tsdeque.core import ThreadSafeDeque
+from tsdeque.spill import DEFAULT_SEGMENT_SIZE, SegmentStore, Serializer, TieredStorage
+
+T = TypeVar("T")
+
+
+class SpillableThreadSafeDeque(ThreadSafeDeque[T]):
+    """
+    A `ThreadSafeDeque` that holds at most `memory_limit` items in memory and
+    moves the rest to disk instead of blocking or dropping them.
+
+    Items are kept in two hot in-memory windows, one at each end, so puts and
+    gets at either end stay in memory. Overflow from the middle goes to
+    append-only, memory-mapped segment files and is paged back in batches as
+    consumers drain a window. Segment files are deleted once all of their
+    items were consumed.
+
+    `maxsize`, task tracking and `join` work exactly as in `ThreadSafeDeque`;
+    spilled items count as queued items and tasks.
+    """
+
+    def __init__(
+        self,
+        memory_limit: int = 4096,
+        directory: Optional[str] = None,
+        serializer: Serializer = pickle,  # type: ignore[assignment]
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        maxsize: int = 0,
+        **kwargs: Any,
+    ):
+        """
+        Initializes the deque.
+
+        Args:
+            memory_limit (int): Maximum number of items held in memory, split
+                evenly between the two windows.
+            directory (Optional[str]): Directory of the segment files. Defaults
+                to the platform's temporary directory.
+            serializer (Serializer): Object with `dumps`/`loads` converting items
+                to bytes, e.g. `pickle` (default), `msgpack` or
+                `tsdeque.spill.RawBytes` for bytes items.
+            segment_size (int): Size of a segment file in bytes.
+            maxsize (int): Maximum number of items overall, including spilled
+                ones. If 0, the queue is unbounded.
+            **kwargs (Any): Further options forwarded to `ThreadSafeDeque`.
+
+        Raises:
+            ValueError: If memory_limit is less than 2 or maxsize is negative.
+        """
+        if memory_limit < 2:
+            raise ValueError("Memory limit must be at least 2 items.")
+
+        def storage(size: int) -> TieredStorage:
+            return TieredStorage(
+                memory_limit // 2, SegmentStore(directory, serializer, segment_size)
+            )
+
+        super().__init__(maxsize, storage=storage, **kwargs)
+
+    def spilled_count(self) -> int:
+        """
+        Returns the number of items currently stored on disk.
+
+        Returns:
+            int: Number of spilled items.
+        """
+        with self._mutex:
+            return self._deque.spilled  # type: ignore[attr-defined]
+
+    def segment_count(self) -> int:
+        """
+        Returns the number of segment files currently on disk.
+
+        Returns:
+            int: Number of segment files.
+        """
+        with self._mutex:
+            return self._deque.segments  # type: ignore[attr-defined]
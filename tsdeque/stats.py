@@ -0,0 +1,300 @@
+import time
+from dataclasses import dataclass, field
+from threading import Lock, get_ident, local
+from typing import List, Optional
+
+# Every power of two is split into this many linear sub-buckets, which keeps
+# the relative error of recorded values below 1 / _SUB_BUCKETS (about 6%).
+_SUB_BUCKETS = 16
+_SUB_BITS = _SUB_BUCKETS.bit_length() - 1
+_MAX_BITS = 64
+_BUCKETS = (_MAX_BITS - _SUB_BITS + 1) * _SUB_BUCKETS
+
+
+def _bucket_index(value: int) -> int:
+    """Maps a non-negative integer to its log-linear bucket."""
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BITS - 1
+    return (shift + 1) * _SUB_BUCKETS + (value >> shift) - _SUB_BUCKETS
+
+
+def _bucket_value(index: int) -> int:
+    """Returns the lowest value that falls into the given bucket."""
+    if index < _SUB_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    return (index % _SUB_BUCKETS + _SUB_BUCKETS) << shift
+
+
+class Histogram:
+    """
+    HDR-style histogram of non-negative integers (nanoseconds in this package)
+    with log-linear buckets of bounded relative error.
+
+    Not thread-safe: each thread records into its own histogram and
+    histograms are merged for reporting.
+    """
+
+    __slots__ = ("_counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        """Initializes an empty histogram."""
+        self._counts: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def record(self, value: int) -> None:
+        """Records a single value.
+
+        Args:
+            value (int): The value to record; negative values are clamped to zero.
+        """
+        if value < 0:
+            value = 0
+        self._counts[min(_bucket_index(value), _BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "Histogram") -> None:
+        """Adds the values recorded by another histogram to this one.
+
+        Args:
+            other (Histogram): The histogram to merge in.
+        """
+        counts = self._counts
+        for index, count in enumerate(other._counts):
+            if count:
+                counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def mean(self) -> float:
+        """Returns the mean of recorded values, or 0.0 if there are none.
+
+        Returns:
+            float: The arithmetic mean.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """Returns an approximation of the given percentile.
+
+        Args:
+            percent (float): Percentile in the range [0, 100].
+
+        Returns:
+            int: Lower bound of the bucket holding the percentile, or 0 if empty.
+
+        Raises:
+            ValueError: If percent is outside [0, 100].
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be within [0, 100].")
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return max(_bucket_value(index), self.min or 0)
+        return self.max or 0
+
+
+class _ThreadCounters:
+    """Counters owned and updated by a single thread."""
+
+    __slots__ = (
+        "puts_left",
+        "puts_right",
+        "gets_left",
+        "gets_right",
+        "timeouts",
+        "timeout_errors",
+        "contended_acquisitions",
+        "high_water_mark",
+        "put_wait",
+        "get_wait",
+        "lock_wait",
+        "lock_hold",
+    )
+
+    def __init__(self) -> None:
+        self.puts_left = 0
+        self.puts_right = 0
+        self.gets_left = 0
+        self.gets_right = 0
+        self.timeouts = 0
+        self.timeout_errors = 0
+        self.contended_acquisitions = 0
+        self.high_water_mark = 0
+        self.put_wait = Histogram()
+        self.get_wait = Histogram()
+        self.lock_wait = Histogram()
+        self.lock_hold = Histogram()
+
+
+@dataclass
+class DequeStats:
+    """
+    Point-in-time snapshot of a deque's instrumentation.
+
+    Attributes:
+        puts_left (int): Items stored at the left end.
+        puts_right (int): Items stored at the right end.
+        gets_left (int): Items taken from the left end.
+        gets_right (int): Items taken from the right end.
+        timeouts (int): Waits that ran out of time, including `join` timeouts.
+        timeout_errors (int): `TimeoutError`s raised to callers.
+        contended_acquisitions (int): Mutex acquisitions that had to block.
+        high_water_mark (int): Largest number of items stored at once.
+        put_wait (Histogram): Nanoseconds putters spent blocked on a full queue.
+        get_wait (Histogram): Nanoseconds getters spent blocked on an empty queue.
+        lock_wait (Histogram): Nanoseconds spent blocked on contended mutex acquisitions.
+        lock_hold (Histogram): Nanoseconds the mutex was held per acquisition.
+    """
+
+    puts_left: int = 0
+    puts_right: int = 0
+    gets_left: int = 0
+    gets_right: int = 0
+    timeouts: int = 0
+    timeout_errors: int = 0
+    contended_acquisitions: int = 0
+    high_water_mark: int = 0
+    put_wait: Histogram = field(default_factory=Histogram)
+    get_wait: Histogram = field(default_factory=Histogram)
+    lock_wait: Histogram = field(default_factory=Histogram)
+    lock_hold: Histogram = field(default_factory=Histogram)
+
+
+class StatsCollector:
+    """
+    Collects instrumentation for one deque.
+
+    Every thread updates its own `_ThreadCounters` without locking; the
+    registry lock is only taken the first time a thread records something and
+    when a snapshot merges all per-thread counters.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty collector."""
+        self._local = local()
+        self._registry: List[_ThreadCounters] = []
+        self._registry_mutex = Lock()
+
+    def counters(self) -> _ThreadCounters:
+        """Returns the calling thread's counters, registering them on first use.
+
+        Returns:
+            _ThreadCounters: Counters owned by the calling thread.
+        """
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters = _ThreadCounters()
+            with self._registry_mutex:
+                self._registry.append(counters)
+            self._local.counters = counters
+            return counters
+
+    def snapshot(self) -> DequeStats:
+        """Merges the counters of every thread into a snapshot.
+
+        Returns:
+            DequeStats: The merged statistics.
+        """
+        stats = DequeStats()
+        with self._registry_mutex:
+            registry = list(self._registry)
+
+        for counters in registry:
+            stats.puts_left += counters.puts_left
+            stats.puts_right += counters.puts_right
+            stats.gets_left += counters.gets_left
+            stats.gets_right += counters.gets_right
+            stats.timeouts += counters.timeouts
+            stats.timeout_errors += counters.timeout_errors
+            stats.contended_acquisitions += counters.contended_acquisitions
+            stats.high_water_mark = max(stats.high_water_mark, counters.high_water_mark)
+            stats.put_wait.merge(counters.put_wait)
+            stats.get_wait.merge(counters.get_wait)
+            stats.lock_wait.merge(counters.lock_wait)
+            stats.lock_hold.merge(counters.lock_hold)
+        return stats
+
+
+class TimedLock:
+    """
+    Drop-in replacement for `threading.Lock` that records contention and hold
+    times into a `StatsCollector`. Usable as the lock of a `threading.Condition`;
+    time spent in `Condition.wait` is not counted as hold time.
+    """
+
+    __slots__ = ("_lock", "_collector", "_owner", "_acquired_at")
+
+    def __init__(self, collector: StatsCollector) -> None:
+        """Initializes the lock.
+
+        Args:
+            collector (StatsCollector): Collector receiving the measurements.
+        """
+        self._lock = Lock()
+        self._collector = collector
+        self._owner: Optional[int] = None
+        self._acquired_at = 0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquires the lock, recording the time spent blocked if it was contended.
+
+        Args:
+            blocking (bool): Whether to block until the lock is available.
+            timeout (float): Maximum time to block, or -1 for no limit.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        if not self._lock.acquire(False):
+            if not blocking:
+                return False
+            start = time.perf_counter_ns()
+            if not self._lock.acquire(True, timeout):
+                return False
+            counters = self._collector.counters()
+            counters.contended_acquisitions += 1
+            counters.lock_wait.record(time.perf_counter_ns() - start)
+        self._owner = get_ident()
+        self._acquired_at = time.perf_counter_ns()
+        return True
+
+    def release(self) -> None:
+        """Releases the lock and records how long it was held."""
+        held = time.perf_counter_ns() - self._acquired_at
+        self._owner = None
+        self._lock.release()
+        self._collector.counters().lock_hold.record(held)
+
+    def locked(self) -> bool:
+        """Returns whether the lock is currently held."""
+        return self._lock.locked()
+
+    def _is_owned(self) -> bool:
+        """Tells `threading.Condition` whether the calling thread holds the lock."""
+        return self._owner == get_ident()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
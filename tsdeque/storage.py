@@ -0,0 +1,185 @@
+from collections import deque
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, Protocol, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class Storage(Protocol[T]):
+    """
+    The subset of the `collections.deque` interface `ThreadSafeDeque` stores items with.
+
+    Fixed-capacity storages additionally provide `reserve(count)`, which lets
+    them hold items the queue stores past `maxsize`, such as requeued ones.
+    """
+
+    def append(self, item: T) -> None: ...
+
+    def appendleft(self, item: T) -> None: ...
+
+    def extend(self, items: Iterable[T]) -> None: ...
+
+    def extendleft(self, items: Iterable[T]) -> None: ...
+
+    def pop(self) -> T: ...
+
+    def popleft(self) -> T: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[T]: ...
+
+
+class RingBuffer(Generic[T]):
+    """
+    Fixed-capacity double-ended storage over a preallocated list.
+
+    Both ends are O(1) and nothing is allocated after construction: items live
+    in `capacity` list slots addressed by a head index and a size. Removed
+    slots are reset to None so that taken items are not kept alive. Memory use
+    is flat for the buffer's lifetime; in exchange, every operation costs a
+    little more than on the C-implemented `collections.deque`.
+
+    The caller is responsible for capacity checks; storing into a full buffer
+    raises IndexError. `reserve` grows the buffer for the rare items the queue
+    stores past its capacity.
+    """
+
+    __slots__ = ("_slots", "_capacity", "_head", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initializes an empty buffer.
+
+        Args:
+            capacity (int): Number of preallocated slots.
+
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("Ring buffer capacity must be at least 1.")
+        self._slots: List[Optional[T]] = [None] * capacity
+        self._capacity = capacity
+        self._head = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of preallocated slots."""
+        return self._capacity
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the buffer, if needed, so that `count` more items fit.
+
+        Args:
+            count (int): Number of items about to be stored.
+        """
+        needed = self._size + count
+        if needed <= self._capacity:
+            return
+        capacity = max(self._capacity * 2, needed)
+        self._slots = list(self) + [None] * (capacity - self._size)
+        self._capacity = capacity
+        self._head = 0
+
+    def append(self, item: T) -> None:
+        """Stores an item at the right end."""
+        if self._size == self._capacity:
+            raise IndexError("append to a full ring buffer")
+        index = self._head + self._size
+        if index >= self._capacity:
+            index -= self._capacity
+        self._slots[index] = item
+        self._size += 1
+
+    def appendleft(self, item: T) -> None:
+        """Stores an item at the left end."""
+        if self._size == self._capacity:
+            raise IndexError("append to a full ring buffer")
+        self._head = (self._head or self._capacity) - 1
+        self._slots[self._head] = item
+        self._size += 1
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Stores items at the right end, in order."""
+        for item in items:
+            self.append(item)
+
+    def extendleft(self, items: Iterable[T]) -> None:
+        """Stores items one by one at the left end, reversing their order."""
+        for item in items:
+            self.appendleft(item)
+
+    def pop(self) -> T:
+        """Removes and returns the rightmost item."""
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+        self._size -= 1
+        index = self._head + self._size
+        if index >= self._capacity:
+            index -= self._capacity
+        item = self._slots[index]
+        self._slots[index] = None
+        return item  # type: ignore[return-value]
+
+    def popleft(self) -> T:
+        """Removes and returns the leftmost item."""
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+        head = self._head
+        item = self._slots[head]
+        self._slots[head] = None
+        self._head = head + 1 if head + 1 < self._capacity else 0
+        self._size -= 1
+        return item  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        """Removes all items, keeping the preallocated slots."""
+        slots = self._slots
+        for offset in range(self._size):
+            slots[(self._head + offset) % self._capacity] = None
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Returns the number of stored items."""
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterates over items from left to right."""
+        for offset in range(self._size):
+            yield self._slots[(self._head + offset) % self._capacity]  # type: ignore[misc]
+
+
+StorageFactory = Callable[[int], Storage]
+
+
+def make_storage(storage: Union[str, StorageFactory], maxsize: int) -> Storage:
+    """
+    Creates the item storage of a `ThreadSafeDeque`.
+
+    Args:
+        storage (Union[str, StorageFactory]): "deque" for a `collections.deque`,
+            "ring" for a preallocated `RingBuffer`, or a callable receiving
+            `maxsize` and returning a storage object.
+        maxsize (int): Capacity of the queue; 0 for unbounded.
+
+    Returns:
+        Storage: An empty storage object.
+
+    Raises:
+        ValueError: If the storage kind is unknown, or "ring" is requested for
+            an unbounded queue.
+    """
+    if callable(storage):
+        return storage(maxsize)
+    if storage == "deque":
+        return deque()
+    if storage == "ring":
+        if maxsize <= 0:
+            raise ValueError("Ring buffer storage requires a positive maxsize.")
+        return RingBuffer(maxsize)
+    raise ValueError(f"Unknown storage: {storage!r}.")
@@ -1,18 +1,46 @@
+import functools
+import itertools
+import logging
+import math
 import time
-from typing import Optional, Union
+from collections import deque
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
 
 
 class Timer:
     """Timer that measures elapsed time against a specified period."""
 
+    __slots__ = ("_deadline",)
+
     def __init__(self, period: float) -> None:
         """Initializes the timer with a given period.
 
         Args:
             period (float): The total time period for the timer in seconds.
         """
-        self._period = period
-        self._start = time.perf_counter()
+        self._deadline = time.monotonic() + period
+
+    @classmethod
+    def at(cls, deadline: float) -> "Timer":
+        """Creates a timer expiring at an absolute point in time.
+
+        Args:
+            deadline (float): Expiry time on the `time.monotonic()` clock.
+
+        Returns:
+            Timer: A timer expiring at the given deadline.
+        """
+        timer = cls.__new__(cls)
+        timer._deadline = deadline
+        return timer
+
+    @property
+    def deadline(self) -> float:
+        """Expiry time on the `time.monotonic()` clock."""
+        return self._deadline
 
     def get_spend(self) -> float:
         """Calculates the remaining time before the period elapses.
@@ -20,14 +48,14 @@ class Timer:
         Returns:
             float: Remaining time in seconds; never negative (minimum zero).
         """
-        elapsed = time.perf_counter() - self._start
-        remainder = max(0, self._period - elapsed)
-        return remainder
+        return max(0, self._deadline - time.monotonic())
 
 
 class NullTimer:
     """Timer stub that represents an infinite or no timeout."""
 
+    __slots__ = ()
+
     def get_spend(self) -> None:
         """Returns None to indicate no timeout.
 
@@ -37,16 +65,390 @@ class NullTimer:
         return None
 
 
-def get_timer(period: Optional[float]) -> Union[Timer, NullTimer]:
+AnyTimer = Union[Timer, NullTimer]
+
+# NullTimer is stateless, so a single instance serves every untimed wait.
+_NULL_TIMER = NullTimer()
+
+
+def get_timer(period: Optional[float], deadline: Optional[float] = None) -> AnyTimer:
     """Factory function returning a Timer or NullTimer based on the period.
 
     Args:
         period (Optional[float]): Desired timeout period in seconds, or None for no timeout.
+        deadline (Optional[float]): Absolute expiry time on the `time.monotonic()`
+            clock; an alternative to `period`.
 
     Returns:
-        Timer or NullTimer: Timer instance corresponding to the given period.
+        Timer or NullTimer: Timer instance corresponding to the given period or deadline.
+
+    Raises:
+        ValueError: If both a period and a deadline are given.
     """
+    if deadline is not None:
+        if period is not None:
+            raise ValueError("Specify either a timeout or a deadline, not both.")
+        return Timer.at(deadline)
     if period is None:
-        return NullTimer()
+        return _NULL_TIMER
     else:
         return Timer(period)
+
+
+class _TimerEntry:
+    """A scheduled callback. Entries are recycled once they fire or are cancelled."""
+
+    __slots__ = ("timer_id", "due", "callback", "bucket")
+
+    def __init__(self) -> None:
+        self.timer_id = 0
+        self.due = 0
+        self.callback: Optional[Callable[[], object]] = None
+        self.bucket: Optional[Set["_TimerEntry"]] = None
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel for expiring many deadlines in one sweep.
+
+    Time is divided into ticks of `tick` seconds. Level 0 has one slot per
+    tick; every higher level has slots `slots` times wider than the level
+    below and is cascaded down when the lower level wraps around. Scheduling
+    and cancelling are O(1), and `expire` touches only the slots that became
+    due since the previous sweep. Deadlines are rounded up to a whole tick, so
+    callbacks fire at most one tick late, never early.
+
+    The wheel does not run a thread of its own: its owner calls `expire`
+    periodically, for example every `next_expiry() - time.monotonic()` seconds.
+    Callbacks are invoked from `expire`, outside the wheel's lock.
+    """
+
+    def __init__(
+        self,
+        tick: float = 0.001,
+        slots: int = 256,
+        levels: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes an empty wheel.
+
+        Args:
+            tick (float): Resolution of the wheel in seconds.
+            slots (int): Slots per level.
+            levels (int): Number of levels. Deadlines beyond
+                ``tick * slots ** levels`` seconds are parked in the top level
+                and re-examined each time it cascades.
+            clock (Callable[[], float]): Monotonic clock the deadlines refer to.
+
+        Raises:
+            ValueError: If any of the parameters is not positive.
+        """
+        if tick <= 0 or slots < 2 or levels < 1:
+            raise ValueError("Tick must be positive, with at least 2 slots and 1 level.")
+
+        self._tick = tick
+        self._slots = slots
+        self._levels = levels
+        self._clock = clock
+        self._wheels: List[List[Set[_TimerEntry]]] = [
+            [set() for _ in range(slots)] for _ in range(levels)
+        ]
+        self._entries: Dict[int, _TimerEntry] = {}
+        self._free: List[_TimerEntry] = []
+        self._ids = itertools.count(1)
+        self._current = math.floor(clock() / tick)
+        self._mutex = Lock()
+
+    def _to_ticks(self, moment: float) -> int:
+        """Converts a point in time to a tick number, rounding up."""
+        return math.ceil(moment / self._tick)
+
+    def _place(self, entry: _TimerEntry, earliest: int) -> None:
+        """Puts an entry into the slot matching its due tick, but not before
+        tick `earliest`. Requires `_mutex`."""
+        slots = self._slots
+        due = max(entry.due, earliest)
+        delta = due - self._current
+        width = 1
+        for level in range(self._levels):
+            if delta < width * slots or level == self._levels - 1:
+                if delta >= width * slots:
+                    # Too far in the future: park it in the farthest slot of the
+                    # top level; it is placed again when that slot cascades.
+                    due = self._current + width * slots - 1
+                bucket = self._wheels[level][due // width % slots]
+                bucket.add(entry)
+                entry.bucket = bucket
+                return
+            width *= slots
+
+    def _release(self, entry: _TimerEntry) -> None:
+        """Returns a fired or cancelled entry to the free list. Requires `_mutex`."""
+        del self._entries[entry.timer_id]
+        entry.callback = None
+        entry.bucket = None
+        self._free.append(entry)
+
+    def schedule(self, deadline: float, callback: Callable[[], object]) -> int:
+        """Schedules a callback.
+
+        Args:
+            deadline (float): Time on the wheel's clock at which the callback is due.
+            callback (Callable[[], object]): Called without arguments once due.
+
+        Returns:
+            int: Identifier of the timer, for `cancel`.
+        """
+        with self._mutex:
+            entry = self._free.pop() if self._free else _TimerEntry()
+            entry.timer_id = next(self._ids)
+            entry.due = self._to_ticks(deadline)
+            entry.callback = callback
+            self._entries[entry.timer_id] = entry
+            self._place(entry, self._current + 1)
+            return entry.timer_id
+
+    def cancel(self, timer_id: int) -> bool:
+        """Cancels a scheduled callback.
+
+        Args:
+            timer_id (int): Identifier returned by `schedule`.
+
+        Returns:
+            bool: True if the timer was pending; False if it already fired or was cancelled.
+        """
+        with self._mutex:
+            entry = self._entries.get(timer_id)
+            if entry is None:
+                return False
+            entry.bucket.discard(entry)  # type: ignore[union-attr]
+            self._release(entry)
+            return True
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Invokes every callback whose deadline has passed. Exceptions raised
+        by callbacks are logged and do not stop the remaining ones.
+
+        Args:
+            now (Optional[float]): Current time on the wheel's clock. Defaults to reading the clock.
+
+        Returns:
+            int: Number of callbacks invoked.
+        """
+        if now is None:
+            now = self._clock()
+        target = math.floor(now / self._tick)
+        callbacks: List[Callable[[], object]] = []
+
+        with self._mutex:
+            if not self._entries:
+                self._current = max(self._current, target)
+            slots = self._slots
+            while self._current < target:
+                self._current += 1
+                tick = self._current
+
+                # Cascade higher levels whose slot boundary has been reached.
+                width = slots
+                for level in range(1, self._levels):
+                    if tick % width:
+                        break
+                    bucket = self._wheels[level][tick // width % slots]
+                    if bucket:
+                        cascaded = list(bucket)
+                        bucket.clear()
+                        for entry in cascaded:
+                            self._place(entry, tick)
+                    width *= slots
+
+                bucket = self._wheels[0][tick % slots]
+                if bucket:
+                    for entry in bucket:
+                        callbacks.append(entry.callback)  # type: ignore[arg-type]
+                        self._release(entry)
+                    bucket.clear()
+
+                if not self._entries:
+                    self._current = target
+
+        for callback in callbacks:
+            # A failing callback must not take down the others, or the thread
+            # driving the wheel.
+            try:
+                callback()
+            except Exception:
+                logger.exception("Timer callback %r failed.", callback)
+        return len(callbacks)
+
+    def next_expiry(self) -> Optional[float]:
+        """Returns when `expire` should be called next.
+
+        The result is exact for deadlines within one revolution of level 0 and
+        otherwise the next cascade boundary, which is never later than the
+        earliest pending deadline.
+
+        Returns:
+            Optional[float]: Time on the wheel's clock, or None if nothing is scheduled.
+        """
+        with self._mutex:
+            if not self._entries:
+                return None
+            slots = self._slots
+            level0 = self._wheels[0]
+            boundary = (self._current // slots + 1) * slots
+            for tick in range(self._current + 1, boundary + 1):
+                if level0[tick % slots]:
+                    return tick * self._tick
+            return boundary * self._tick
+
+    def __len__(self) -> int:
+        """Returns the number of pending timers."""
+        return len(self._entries)
+
+
+class WheelThread:
+    """
+    Daemon thread driving a `TimerWheel`.
+
+    The thread sleeps until the wheel's next expiry and is woken early when a
+    sooner deadline is scheduled, so an idle wheel costs nothing and each
+    sweep touches only the timers that are due.
+    """
+
+    def __init__(self, wheel: Optional[TimerWheel] = None) -> None:
+        """Initializes the driver. The thread is started by the first `schedule`.
+
+        Args:
+            wheel (Optional[TimerWheel]): Wheel to drive; a new default one if None.
+        """
+        self._wheel = wheel if wheel is not None else TimerWheel()
+        self._changed = Condition(Lock())
+        self._wake_at = math.inf
+        self._thread: Optional[Thread] = None
+
+    def schedule(self, deadline: float, callback: Callable[[], object]) -> int:
+        """Schedules a callback to run on the thread (see `TimerWheel.schedule`)."""
+        timer_id = self._wheel.schedule(deadline, callback)
+        with self._changed:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="tsdeque-timers", daemon=True)
+                self._thread.start()
+            if deadline < self._wake_at:
+                self._wake_at = deadline
+                self._changed.notify()
+        return timer_id
+
+    def cancel(self, timer_id: int) -> bool:
+        """Cancels a scheduled callback (see `TimerWheel.cancel`)."""
+        return self._wheel.cancel(timer_id)
+
+    def _run(self) -> None:
+        wheel = self._wheel
+        while True:
+            wheel.expire()
+            with self._changed:
+                due = wheel.next_expiry()
+                self._wake_at = math.inf if due is None else due
+                self._changed.wait(None if due is None else max(0.0, due - time.monotonic()))
+
+
+_shared_wheel_thread: Optional[WheelThread] = None
+_shared_wheel_lock = Lock()
+
+
+def shared_wheel_thread() -> WheelThread:
+    """Returns the process-wide `WheelThread`, creating it on first use.
+
+    Returns:
+        WheelThread: The shared driver.
+    """
+    global _shared_wheel_thread
+    with _shared_wheel_lock:
+        if _shared_wheel_thread is None:
+            _shared_wheel_thread = WheelThread()
+        return _shared_wheel_thread
+
+
+class WheelCondition:
+    """
+    Condition variable whose timed waits expire through the shared `WheelThread`.
+
+    A timed `wait` registers its deadline with the wheel instead of blocking in
+    a timed acquire of its own, so the timeouts of all waiters are expired by
+    one thread in sweeps, and a waiter whose deadline passes is woken
+    individually. Untimed waits never touch the wheel. Waiters are woken by
+    `notify` in the order they started waiting.
+    """
+
+    def __init__(self, lock: Any) -> None:
+        """Initializes the condition.
+
+        Args:
+            lock (Any): The lock guarding the waited-for state; a `threading.Lock`
+                or an object with the same `acquire`/`release` interface.
+        """
+        self._lock = lock
+        self._waiters: Deque[Any] = deque()
+
+    def __enter__(self) -> bool:
+        return self._lock.acquire()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._lock.release()
+
+    def wait(self, timer: AnyTimer) -> None:
+        """Releases the lock until notified or until `timer` expires, then
+        reacquires it. Must be called with the lock held; the caller rechecks
+        its predicate and the timer afterwards.
+
+        Args:
+            timer (AnyTimer): Timer bounding the wait; a `NullTimer` waits until notified.
+        """
+        waiter = Lock()
+        waiter.acquire()
+        self._waiters.append(waiter)
+        timer_id = None
+        if isinstance(timer, Timer):
+            timer_id = shared_wheel_thread().schedule(
+                timer.deadline, functools.partial(self._expire, waiter)
+            )
+        self._lock.release()
+        woken = False
+        try:
+            waiter.acquire()
+            woken = True
+        finally:
+            self._lock.acquire()
+            if timer_id is not None:
+                shared_wheel_thread().cancel(timer_id)
+            if not woken:
+                # Interrupted before being woken.
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+    def _expire(self, waiter: Any) -> None:
+        """Wakes a waiter whose deadline passed. Called by the timer thread."""
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                # Already notified.
+                return
+            waiter.release()
+
+    def notify(self, n: int = 1) -> None:
+        """Wakes up to `n` waiters. Must be called with the lock held.
+
+        Args:
+            n (int): Maximum number of waiters to wake.
+        """
+        waiters = self._waiters
+        while n > 0 and waiters:
+            waiters.popleft().release()
+            n -= 1
+
+    def notify_all(self) -> None:
+        """Wakes all waiters. Must be called with the lock held."""
+        self.notify(len(self._waiters))
@@ -0,0 +1,447 @@
+import sys
+from array import array
+from typing import Any, Iterator, Optional
+
+import tsdeque.timer as tmr
+from tsdeque.core import ThreadSafeDeque
+
+# Numeric type names accepted as `dtype`, mapped to `array` type codes.
+_DTYPES = {
+    "int8": "b",
+    "uint8": "B",
+    "int16": "h",
+    "uint16": "H",
+    "int32": "i",
+    "uint32": "I",
+    "int64": "q",
+    "uint64": "Q",
+    "float32": "f",
+    "float64": "d",
+}
+_TYPECODES = set(_DTYPES.values())
+# Buffer format characters grouped by kind; formats of one kind are
+# interchangeable when their item sizes match (e.g. "l" and "q" on LP64).
+_FORMAT_KINDS = {
+    **dict.fromkeys("bhilqn", "signed"),
+    **dict.fromkeys("BHILQN", "unsigned"),
+    "f": "f",
+    "d": "d",
+}
+_NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+_INITIAL_CAPACITY = 64
+
+
+def _typecode(dtype: Any) -> str:
+    """
+    Resolves a dtype to an `array` type code.
+
+    Args:
+        dtype (Any): A type code such as "d", a name such as "float64", or any
+            object whose `str()` is such a name (e.g. a NumPy dtype).
+
+    Returns:
+        str: The matching `array` type code.
+
+    Raises:
+        ValueError: If the dtype is not a supported numeric type.
+    """
+    name = str(dtype)
+    if name in _TYPECODES:
+        return name
+    if name in _DTYPES:
+        return _DTYPES[name]
+    raise ValueError(f"Unsupported dtype: {dtype!r}.")
+
+
+def _as_view(data: Any, typecode: str) -> memoryview:
+    """
+    Returns a flat view of `data` with the given type code.
+
+    Buffers holding numbers of the same kind and size (`array.array`, NumPy
+    arrays, ...) are viewed without copying, whatever their format character;
+    anything else is converted element by element.
+
+    Args:
+        data (Any): A buffer or an iterable of numbers.
+        typecode (str): The required `array` type code.
+
+    Returns:
+        memoryview: One-dimensional view of the values.
+
+    Raises:
+        TypeError: If the values cannot be represented with the type code.
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return memoryview(array(typecode, data))
+
+    fmt = view.format
+    if fmt[:1] in ("@", "=", _NATIVE_ORDER):
+        fmt = fmt[1:]
+    kind = _FORMAT_KINDS.get(fmt)
+    if (
+        kind is not None
+        and kind == _FORMAT_KINDS[typecode]
+        and view.itemsize == array(typecode).itemsize
+        and view.c_contiguous
+    ):
+        if view.ndim == 1 and view.format == typecode:
+            return view
+        return view.cast("B").cast(typecode)
+    if view.ndim != 1:
+        raise TypeError("Multi-dimensional buffers must be contiguous and of the deque's dtype.")
+    return memoryview(array(typecode, view.tolist()))
+
+
+class _ArrayRing:
+    """
+    Deque-like storage of unboxed numbers in an `array.array` ring.
+
+    A bounded ring has exactly `maxsize` slots unless `reserve` grows it for
+    items stored past the limit; an unbounded one starts small and doubles
+    when full. Besides the scalar deque methods it copies whole
+    slices in and out with `write` and `read`.
+    """
+
+    __slots__ = ("_typecode", "_items", "_view", "_capacity", "_fixed", "_head", "_size")
+
+    def __init__(self, typecode: str, maxsize: int) -> None:
+        """
+        Initializes an empty ring.
+
+        Args:
+            typecode (str): `array` type code of the stored numbers.
+            maxsize (int): Fixed capacity, or 0 for a growing ring.
+        """
+        self._typecode = typecode
+        self._fixed = maxsize > 0
+        self._capacity = maxsize if self._fixed else _INITIAL_CAPACITY
+        self._items = self._allocate(self._capacity)
+        self._view = memoryview(self._items)
+        self._head = 0
+        self._size = 0
+
+    def _allocate(self, capacity: int) -> array:
+        """Returns a zero-filled array of `capacity` numbers."""
+        return array(self._typecode, [0]) * capacity
+
+    def _slice(self, start: int, count: int) -> array:
+        """Copies `count` numbers starting at ring position `start`, in ring order."""
+        end = start + count
+        if end <= self._capacity:
+            return self._items[start:end]
+        out = self._items[start:]
+        out.extend(self._items[: end - self._capacity])
+        return out
+
+    def _fill(self, start: int, values: memoryview) -> None:
+        """Copies values into the ring starting at position `start`, wrapping around."""
+        count = len(values)
+        first = min(count, self._capacity - start)
+        self._view[start : start + first] = values[:first]
+        if count > first:
+            self._view[: count - first] = values[first:]
+
+    def _reserve(self, count: int) -> None:
+        """
+        Makes room for `count` more numbers, growing an unbounded ring.
+
+        Raises:
+            IndexError: If a bounded ring has no room left.
+        """
+        if self._fixed and self._size + count > self._capacity:
+            raise IndexError("append to a full ring buffer")
+        self.reserve(count)
+
+    def reserve(self, count: int) -> None:
+        """Grows the ring, bounded or not, so that `count` more numbers fit."""
+        needed = self._size + count
+        if needed <= self._capacity:
+            return
+        capacity = max(self._capacity * 2, needed)
+        items = self._allocate(capacity)
+        items[: self._size] = self._slice(self._head, self._size)
+        self._view.release()
+        self._items = items
+        self._view = memoryview(items)
+        self._capacity = capacity
+        self._head = 0
+
+    def write(self, values: memoryview, left: bool) -> None:
+        """
+        Stores a slice of numbers at one end, like `extend`/`extendleft`.
+
+        Args:
+            values (memoryview): Flat view with the ring's type code.
+            left (bool): If True, stores the values one by one at the left end,
+                so the last one ends up leftmost; otherwise, at the right end in order.
+        """
+        count = len(values)
+        self._reserve(count)
+        if left:
+            head = (self._head - count) % self._capacity
+            self._fill(head, values[::-1])
+            self._head = head
+        else:
+            self._fill((self._head + self._size) % self._capacity, values)
+        self._size += count
+
+    def read(self, count: int, left: bool) -> array:
+        """
+        Removes `count` numbers from one end, like repeated `popleft`/`pop`.
+
+        Args:
+            count (int): Number of values to remove; at most `len(self)`.
+            left (bool): If True, removes from the left end; otherwise, from the right.
+
+        Returns:
+            array: The removed values in removal order.
+        """
+        if left:
+            out = self._slice(self._head, count)
+            self._head = (self._head + count) % self._capacity
+        else:
+            out = self._slice((self._head + self._size - count) % self._capacity, count)
+            out.reverse()
+        self._size -= count
+        return out
+
+    def append(self, item: Any) -> None:
+        self._reserve(1)
+        self._items[(self._head + self._size) % self._capacity] = item
+        self._size += 1
+
+    def appendleft(self, item: Any) -> None:
+        self._reserve(1)
+        head = (self._head - 1) % self._capacity
+        self._items[head] = item
+        self._head = head
+        self._size += 1
+
+    def extend(self, items: Any) -> None:
+        self.write(_as_view(items, self._typecode), left=False)
+
+    def extendleft(self, items: Any) -> None:
+        self.write(_as_view(items, self._typecode), left=True)
+
+    def pop(self) -> Any:
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+        self._size -= 1
+        return self._items[(self._head + self._size) % self._capacity]
+
+    def popleft(self) -> Any:
+        if not self._size:
+            raise IndexError("pop from an empty ring buffer")
+        item = self._items[self._head]
+        self._head = (self._head + 1) % self._capacity
+        self._size -= 1
+        return item
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._slice(self._head, self._size))
+
+
+class TypedThreadSafeDeque(ThreadSafeDeque[Any]):
+    """
+    A `ThreadSafeDeque` of numbers stored unboxed in an `array.array` ring,
+    taking `itemsize` bytes per item (8 for float64/int64) instead of a
+    pointer to a boxed Python object.
+
+    Scalar operations work as in `ThreadSafeDeque`. `put_array` and
+    `get_array` move whole slices with memory copies under a single lock
+    acquisition. They accept any buffer of the deque's dtype, including NumPy
+    arrays, without NumPy being a dependency; arrays returned by `get_array`
+    can be wrapped with `numpy.frombuffer` without copying.
+    """
+
+    def __init__(self, dtype: Any = "float64", maxsize: int = 0, **kwargs: Any):
+        """
+        Initializes the deque.
+
+        Args:
+            dtype (Any): Item type: an `array` type code ("d", "q", ...), a
+                name such as "float64" or "int32", or a NumPy dtype.
+            maxsize (int): Maximum number of items allowed in the queue. If 0,
+                the queue is unbounded and its storage grows on demand.
+            **kwargs (Any): Further options forwarded to `ThreadSafeDeque`.
+
+        Raises:
+            ValueError: If the dtype is not supported, maxsize is negative or
+                the overflow policy is "spill_to_disk".
+        """
+        if kwargs.get("overflow") == "spill_to_disk":
+            raise ValueError("Typed deques cannot spill to disk.")
+
+        typecode = _typecode(dtype)
+        super().__init__(
+            maxsize, storage=lambda size: _ArrayRing(typecode, size), **kwargs
+        )
+        self._typecode = typecode
+
+    @property
+    def typecode(self) -> str:
+        """The `array` type code of stored items."""
+        return self._typecode
+
+    def _base_get_array(
+        self,
+        max_items: int,
+        timeout: Optional[float],
+        left: bool,
+        deadline: Optional[float] = None,
+    ) -> array:
+        """
+        Internal method to remove up to `max_items` items from either end with
+        a single slice copy. Waits only until at least one item is available.
+
+        Args:
+            max_items (int): Maximum number of items to return.
+            timeout (Optional[float]): Maximum time to wait for the first item.
+                If None, the method blocks indefinitely.
+            left (bool): If True, removes items from the left end; otherwise, from the right.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Returns:
+            array: Retrieved items in the order they were removed.
+
+        Raises:
+            ValueError: If max_items is less than 1, or both a timeout and a deadline are given.
+            TimeoutError: If the timeout is reached while waiting for an item to become available.
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1.")
+        timer = tmr.get_timer(timeout, deadline)
+
+        with self._mutex:
+            if self._get_limiter is not None:
+                count = self._take_get_tokens(max_items, timer)
+            else:
+                if not self._deque:
+                    self._wait_for_item(timer)
+                count = min(max_items, len(self._deque))
+
+            items = self._deque.read(count, left)  # type: ignore[attr-defined]
+            self._items_removed(count, left)
+            return items
+
+    def put_array(
+        self, data: Any, timeout: Optional[float] = None, deadline: Optional[float] = None
+    ) -> None:
+        """
+        Inserts a batch of numbers at the right end of the queue, preserving their order.
+
+        Args:
+            data (Any): A buffer of the deque's dtype (copied without
+                conversion) or any iterable of numbers.
+            timeout (Optional[float]): Maximum total time to wait for free space.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Raises:
+            TypeError: If the values cannot be represented in the deque's dtype.
+            ValueError: If both a timeout and a deadline are given.
+            PartialPutError: If the operation times out before the whole batch was
+                inserted. Items counted in its `inserted` attribute stay in the queue.
+        """
+        timer = tmr.get_timer(timeout, deadline)
+        with _as_view(data, self._typecode) as values:
+            self._put_batch(values, timer, left=False)  # type: ignore[arg-type]
+
+    def putleft_array(
+        self, data: Any, timeout: Optional[float] = None, deadline: Optional[float] = None
+    ) -> None:
+        """
+        Inserts a batch of numbers at the left end of the queue, as if `putleft`
+        was called for each of them. The last number ends up leftmost.
+
+        Args:
+            data (Any): A buffer of the deque's dtype (copied without
+                conversion) or any iterable of numbers.
+            timeout (Optional[float]): Maximum total time to wait for free space.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Raises:
+            TypeError: If the values cannot be represented in the deque's dtype.
+            ValueError: If both a timeout and a deadline are given.
+            PartialPutError: If the operation times out before the whole batch was
+                inserted. Items counted in its `inserted` attribute stay in the queue.
+        """
+        timer = tmr.get_timer(timeout, deadline)
+        with _as_view(data, self._typecode) as values:
+            self._put_batch(values, timer, left=True)  # type: ignore[arg-type]
+
+    def get_array(
+        self,
+        max_items: int,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> array:
+        """
+        Removes and returns up to `max_items` numbers from the right end of the queue.
+        Returns as soon as at least one item is available.
+
+        Args:
+            max_items (int): Maximum number of items to return.
+            timeout (Optional[float]): Maximum time to wait for the first item.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Returns:
+            array: The retrieved numbers, rightmost first.
+
+        Raises:
+            ValueError: If max_items is less than 1, or both a timeout and a deadline are given.
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get_array(
+            max_items=max_items,
+            timeout=timeout,
+            deadline=deadline,
+            left=False,
+        )
+
+    def getleft_array(
+        self,
+        max_items: int,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> array:
+        """
+        Removes and returns up to `max_items` numbers from the left end of the queue.
+        Returns as soon as at least one item is available.
+
+        Args:
+            max_items (int): Maximum number of items to return.
+            timeout (Optional[float]): Maximum time to wait for the first item.
+                If None, waits indefinitely.
+            deadline (Optional[float]): Absolute time on the `time.monotonic()` clock
+                until which to wait; an alternative to `timeout`.
+
+        Returns:
+            array: The retrieved numbers, leftmost first.
+
+        Raises:
+            ValueError: If max_items is less than 1, or both a timeout and a deadline are given.
+            TimeoutError: If the operation times out.
+        """
+        return self._base_get_array(
+            max_items=max_items,
+            timeout=timeout,
+            deadline=deadline,
+            left=True,
+        )
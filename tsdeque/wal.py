@@ -0,0 +1,568 @@
+import os
+import pickle
+import struct
+import threading
+import weakref
+import zlib
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+import tsdeque.timer as tmr
+from tsdeque.core import ThreadSafeDeque
+from tsdeque.handles import Consumer
+from tsdeque.spill import Serializer
+
+T = TypeVar("T")
+
+FSYNC_POLICIES = ("always", "interval", "never")
+
+# Default log size after which the log is rewritten as a snapshot.
+DEFAULT_COMPACT_THRESHOLD = 64 * 2**20
+
+# Record: crc32 of everything after it, payload length, type, item id, payload.
+_HEADER = struct.Struct("<IIBQ")
+
+_PUT = 1
+_PUTLEFT = 2
+_GET = 3
+_GETLEFT = 4
+_DONE = 5
+_CLEAR = 6
+_INFLIGHT = 7
+
+
+def _encode(kind: int, item_id: int, payload: bytes = b"") -> bytes:
+    """Frames a log record."""
+    body = _HEADER.pack(0, len(payload), kind, item_id)[4:] + payload
+    return struct.pack("<I", zlib.crc32(body)) + body
+
+
+def _records(data: bytes) -> Iterator[Tuple[int, int, bytes, int]]:
+    """
+    Decodes log records up to the first torn or corrupted one.
+
+    Yields:
+        Tuple[int, int, bytes, int]: Type, item id, payload and the offset
+            right after the record.
+    """
+    offset = 0
+    while offset + _HEADER.size <= len(data):
+        crc, length, kind, item_id = _HEADER.unpack_from(data, offset)
+        end = offset + _HEADER.size + length
+        if end > len(data) or zlib.crc32(data[offset + 4 : end]) != crc:
+            return
+        yield kind, item_id, data[offset + _HEADER.size : end], end
+        offset = end
+
+
+def _replay(data: bytes) -> Tuple[Deque[Tuple[int, bytes]], Dict[int, bytes], int]:
+    """
+    Rebuilds the logged state.
+
+    Args:
+        data (bytes): Contents of the log.
+
+    Returns:
+        Tuple: Queued ``(id, payload)`` pairs in order, payloads of in-flight
+            items by id in delivery order, and the length of the valid prefix
+            of the log.
+    """
+    items: Deque[Tuple[int, bytes]] = deque()
+    in_flight: Dict[int, bytes] = OrderedDict()
+    valid = 0
+    for kind, item_id, payload, end in _records(data):
+        if kind == _PUT:
+            items.append((item_id, payload))
+        elif kind == _PUTLEFT:
+            items.appendleft((item_id, payload))
+        elif kind in (_GET, _GETLEFT):
+            if not items or items[0 if kind == _GETLEFT else -1][0] != item_id:
+                break
+            _, in_flight[item_id] = items.popleft() if kind == _GETLEFT else items.pop()
+        elif kind == _DONE:
+            in_flight.pop(item_id, None)
+        elif kind == _CLEAR:
+            items.clear()
+        elif kind == _INFLIGHT:
+            in_flight[item_id] = payload
+        else:
+            break
+        valid = end
+    return items, in_flight, valid
+
+
+class WriteAheadLog:
+    """
+    Append-only, checksummed operation log with group commit.
+
+    Records are appended to an in-memory buffer; `commit` writes everything
+    buffered so far in one `write` call, so concurrent committers share a
+    single write (and fsync) instead of paying for one each. Whoever enters
+    `commit` first writes the records of everyone who buffered before it;
+    the others find their records already written and return.
+
+    With the "interval" policy nobody waits: a background thread writes and
+    fsyncs the buffer every `interval` seconds.
+    """
+
+    def __init__(self, path: str, fsync: str = "interval", interval: float = 0.05) -> None:
+        """
+        Opens the log for appending, creating it if needed.
+
+        Args:
+            path (str): Path of the log file.
+            fsync (str): "always" fsyncs on every commit, "interval" writes and
+                fsyncs in the background every `interval` seconds, "never"
+                writes on every commit and leaves flushing to the OS.
+            interval (float): Period of the background flush in seconds.
+
+        Raises:
+            ValueError: If the policy is unknown or the interval is not positive.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync!r}.")
+        if interval <= 0:
+            raise ValueError("Fsync interval must be positive.")
+
+        self.path = path
+        self._policy = fsync
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self.size = os.fstat(self._fd).st_size
+
+        self._buffer: List[bytes] = []
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # Counts of records appended, written to the file, and fsynced.
+        self._appended = 0
+        self._written = 0
+        self._synced = 0
+
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if fsync == "interval":
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, args=(interval,), daemon=True
+            )
+            self._flusher.start()
+
+    def read(self) -> bytes:
+        """Returns the current contents of the log file."""
+        with open(self.path, "rb") as file:
+            return file.read()
+
+    def truncate(self, size: int) -> None:
+        """Cuts off a torn tail found during recovery."""
+        os.ftruncate(self._fd, size)
+        self.size = size
+
+    def append(self, record: bytes) -> None:
+        """Buffers a record. Records are written in the order they were appended."""
+        with self._buffer_lock:
+            self._buffer.append(record)
+            self._appended += 1
+
+    def commit(self) -> None:
+        """
+        Makes every record appended so far durable as configured: written and
+        fsynced for "always", written for "never". No-op for "interval".
+        """
+        if self._policy != "interval":
+            self.flush(sync=self._policy == "always")
+
+    def flush(self, sync: bool = True) -> None:
+        """
+        Writes every record appended so far to the file. No-op once closed.
+
+        Args:
+            sync (bool): Whether to fsync the file afterwards.
+        """
+        target = self._appended
+        if self._written >= target and (not sync or self._synced >= target):
+            return
+        with self._flush_lock:
+            if self._fd < 0:
+                return
+            if self._written < target:
+                with self._buffer_lock:
+                    batch, self._buffer = self._buffer, []
+                    appended = self._appended
+                data = b"".join(batch)
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(self._fd, view) :]
+                self.size += len(data)
+                self._written = appended
+            if sync and self._synced < self._written:
+                written = self._written
+                os.fsync(self._fd)
+                self._synced = written
+
+    def rewrite(self, records: Iterable[bytes]) -> None:
+        """
+        Atomically replaces the log with the given records and drops the
+        buffer. The records must describe the state produced by everything
+        appended so far. No-op once closed.
+
+        Args:
+            records (Iterable[bytes]): Records of the snapshot.
+        """
+        temporary = self.path + ".compact"
+        with self._flush_lock:
+            if self._fd < 0:
+                return
+            fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                data = b"".join(records)
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(temporary, self.path)
+            self._sync_directory()
+
+            os.close(self._fd)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_APPEND)
+            self.size = len(data)
+            with self._buffer_lock:
+                self._buffer = []
+                self._written = self._synced = self._appended
+
+    def _sync_directory(self) -> None:
+        """Persists the rename of the log file."""
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the log was closed."""
+        return self._fd < 0
+
+    def close(self) -> None:
+        """Writes and fsyncs the remaining records and closes the file. Idempotent."""
+        if self._fd < 0:
+            return
+        self._stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
+        os.close(self._fd)
+        self._fd = -1
+
+
+class _LoggedStorage:
+    """
+    Deque storage that logs every change to a `WriteAheadLog`.
+
+    Items are kept with sequence ids. Taken items stay in the in-flight table
+    until `complete` retires them, so they can be written to snapshots and
+    redelivered after a crash. Each thread's deliveries are remembered in
+    order, so `task_done` retires the oldest item the calling thread got.
+    """
+
+    def __init__(self, log: WriteAheadLog, serializer: Serializer) -> None:
+        self._log = log
+        self._serializer = serializer
+        self._items: Deque[Tuple[int, Any]] = deque()
+        self.in_flight: Dict[int, Any] = OrderedDict()
+        self._owners: Dict[int, Deque[int]] = {}
+        self.next_id = 1
+
+    def restore(self, items: Iterable[Tuple[int, Any]]) -> None:
+        """Adds recovered items at the right end without logging them."""
+        self._items.extend(items)
+
+    def _add(self, item: Any, left: bool) -> None:
+        item_id = self.next_id
+        data = self._serializer.dumps(item)
+        self._log.append(_encode(_PUTLEFT if left else _PUT, item_id, data))
+        self.next_id += 1
+        if left:
+            self._items.appendleft((item_id, item))
+        else:
+            self._items.append((item_id, item))
+
+    def _remove(self, left: bool) -> Any:
+        item_id, item = self._items[0 if left else -1]
+        self._log.append(_encode(_GETLEFT if left else _GET, item_id))
+        if left:
+            self._items.popleft()
+        else:
+            self._items.pop()
+        self.in_flight[item_id] = item
+        self._owners.setdefault(threading.get_ident(), deque()).append(item_id)
+        return item
+
+    def append(self, item: Any) -> None:
+        self._add(item, left=False)
+
+    def appendleft(self, item: Any) -> None:
+        self._add(item, left=True)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self._add(item, left=False)
+
+    def extendleft(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self._add(item, left=True)
+
+    def pop(self) -> Any:
+        return self._remove(left=False)
+
+    def popleft(self) -> Any:
+        return self._remove(left=True)
+
+    def clear(self) -> None:
+        self._log.append(_encode(_CLEAR, 0))
+        self._items.clear()
+
+    def complete(self, count: int) -> None:
+        """
+        Retires up to `count` in-flight items: those the calling thread got
+        first, then the oldest ones delivered to anybody.
+        """
+        ident = threading.get_ident()
+        owned = self._owners.get(ident)
+        in_flight = self.in_flight
+        for _ in range(count):
+            item_id = None
+            while owned:
+                candidate = owned.popleft()
+                if candidate in in_flight:
+                    item_id = candidate
+                    break
+            if item_id is None:
+                if not in_flight:
+                    break
+                item_id = next(iter(in_flight))
+            del in_flight[item_id]
+            self._log.append(_encode(_DONE, item_id))
+        if owned is not None and not owned:
+            del self._owners[ident]
+
+    def snapshot(self) -> Iterator[bytes]:
+        """Yields records describing the current state."""
+        dumps = self._serializer.dumps
+        for item_id, item in self.in_flight.items():
+            yield _encode(_INFLIGHT, item_id, dumps(item))
+        for item_id, item in self._items:
+            yield _encode(_PUT, item_id, dumps(item))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        for _, item in self._items:
+            yield item
+
+
+class DurableThreadSafeDeque(ThreadSafeDeque[T]):
+    """
+    A `ThreadSafeDeque` whose contents survive a crash of the process.
+
+    Every put, get, `task_done` and `clear` is appended to a write-ahead log
+    before the call returns (see `WriteAheadLog` for group commit and fsync
+    policies). When the log outgrows `compact_threshold` bytes it is replaced
+    by a snapshot of the queued and in-flight items.
+
+    Opening an existing log restores the queue. Items that were got but not
+    marked done are redelivered: they are put back at the left end, in the
+    order they were originally got, and count as unfinished tasks again.
+    Delivery is therefore at-least-once.
+
+    `task_done` retires the oldest item the calling thread got and has not
+    finished yet, or the oldest in-flight item if the thread holds none.
+
+    Leases, consumer handles and scheduled puts (`put_at`/`put_after`) are not
+    supported, because the log cannot record them.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fsync: str = "interval",
+        fsync_interval: float = 0.05,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        serializer: Serializer = pickle,  # type: ignore[assignment]
+        maxsize: int = 0,
+        **kwargs: Any,
+    ):
+        """
+        Opens or creates the log and restores its items.
+
+        Args:
+            path (str): Path of the log file.
+            fsync (str): "always" fsyncs before every operation returns,
+                "interval" (default) fsyncs in the background every
+                `fsync_interval` seconds, "never" only writes to the OS.
+            fsync_interval (float): Period of the background fsync in seconds.
+            compact_threshold (int): Log size in bytes that triggers compaction.
+            serializer (Serializer): Object with `dumps`/`loads`, e.g. `pickle`
+                (default), `msgpack` or `tsdeque.spill.RawBytes` for bytes items.
+            maxsize (int): Maximum number of items allowed in the queue. If 0,
+                the queue is unbounded. Recovered items are restored even if
+                they exceed it.
+            **kwargs (Any): Further options forwarded to `ThreadSafeDeque`.
+
+        Raises:
+            ValueError: If a policy is unknown, or the overflow policy would
+                drop or spill logged items.
+        """
+        if kwargs.get("overflow", "block") not in ("block", "raise_immediately", "drop_newest"):
+            raise ValueError(
+                "Durable deques support only the block, raise_immediately "
+                "and drop_newest overflow policies."
+            )
+
+        log = WriteAheadLog(path, fsync, fsync_interval)
+        storage = _LoggedStorage(log, serializer)
+        super().__init__(maxsize, storage=lambda size: storage, **kwargs)
+
+        self._log = log
+        self._compact_threshold = compact_threshold
+        self._snapshot_size = 0
+        self._finalizer = weakref.finalize(self, log.close)
+
+        items, in_flight, valid = _replay(log.read())
+        log.truncate(valid)
+        loads = serializer.loads
+        restored = [(item_id, loads(data)) for item_id, data in in_flight.items()]
+        restored += [(item_id, loads(data)) for item_id, data in items]
+        with self._mutex:
+            storage.restore(restored)
+            storage.next_id = max((item_id for item_id, _ in restored), default=0) + 1
+            if restored:
+                self._items_added(len(restored), False)
+        self.compact()
+
+    def _commit(self) -> None:
+        """Commits the caller's log records and compacts an oversized log."""
+        self._log.commit()
+        if self._log.size > max(self._compact_threshold, 2 * self._snapshot_size):
+            self.compact()
+
+    def _base_put(
+        self, item: T, timeout: Optional[float], left: bool, deadline: Optional[float] = None
+    ) -> None:
+        super()._base_put(item, timeout, left, deadline)
+        self._commit()
+
+    def _base_get(
+        self, timeout: Optional[float], left: bool, deadline: Optional[float] = None
+    ) -> T:
+        item = super()._base_get(timeout, left, deadline)
+        self._commit()
+        return item
+
+    def _put_batch(self, batch: Sequence[T], timer: tmr.AnyTimer, left: bool) -> None:
+        try:
+            super()._put_batch(batch, timer, left)
+        finally:
+            self._commit()
+
+    def _base_get_many(
+        self, max_items: int, timeout: Optional[float], left: bool, deadline: Optional[float] = None
+    ) -> List[T]:
+        items = super()._base_get_many(max_items, timeout, left, deadline)
+        self._commit()
+        return items
+
+    def _base_get_chunk(
+        self, max_items: int, timer: tmr.AnyTimer, linger: float, left: bool
+    ) -> List[T]:
+        items = super()._base_get_chunk(max_items, timer, linger, left)
+        self._commit()
+        return items
+
+    def _base_get_with_ack(
+        self, lease: float, timeout: Optional[float], left: bool, deadline: Optional[float] = None
+    ) -> Tuple[T, int]:
+        raise TypeError("Leases are not logged; use get and task_done.")
+
+    def put_at(self, item: T, deadline: float) -> None:
+        raise TypeError("Scheduled items are not logged; put them when they are due.")
+
+    def consumer(self, prefetch: int = 32, left: bool = False) -> Consumer[T]:
+        raise TypeError("Returned items are not logged; use get_many and task_done.")
+
+    def clear(self) -> None:
+        super().clear()
+        self._commit()
+
+    def task_done(self, count: int = 1) -> None:
+        """
+        Decrements the internal task counter and logs the oldest `count` items
+        got by the calling thread as done.
+
+        Args:
+            count (int): Number of completed tasks. Defaults to 1.
+
+        Raises:
+            ValueError: If count is less than 1.
+            NoActiveTaskError: If called more times than there were tasks.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+
+        with self._mutex:
+            self._remove_tasks(count)
+            self._deque.complete(count)  # type: ignore[attr-defined]
+        self._commit()
+
+    def in_flight_count(self) -> int:
+        """
+        Returns the number of items that were got but not marked done yet.
+
+        Returns:
+            int: Number of in-flight items.
+        """
+        with self._mutex:
+            return len(self._deque.in_flight)  # type: ignore[attr-defined]
+
+    def flush(self) -> None:
+        """Writes and fsyncs all logged operations regardless of the fsync policy."""
+        self._log.flush()
+
+    def compact(self) -> None:
+        """Replaces the log with a snapshot of the queued and in-flight items."""
+        with self._mutex:
+            self._log.rewrite(self._deque.snapshot())  # type: ignore[attr-defined]
+            self._snapshot_size = self._log.size
+
+    def shutdown(self, immediate: bool = False) -> None:
+        """
+        Shuts the deque down. See `ThreadSafeDeque.shutdown`.
+
+        With `immediate=True` the log is flushed and closed before the queue is
+        emptied, so the discarded items, like unfinished in-flight ones, stay
+        in the log and are restored by the next open. Later `task_done` calls
+        are not logged.
+
+        Args:
+            immediate (bool): If True, also discards all queued items and
+                closes the log.
+        """
+        with self._mutex:
+            if immediate:
+                self._finalizer()
+            self._shutdown_locked(immediate)
+
+    def __enter__(self) -> "DurableThreadSafeDeque[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown(immediate=True)
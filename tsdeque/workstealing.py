@@ -0,0 +1,273 @@
+import itertools
+import os
+import random
+from concurrent.futures import Future
+from threading import Condition, Lock, Thread, local
+from typing import Any, Callable, List, Optional, Tuple
+
+import tsdeque.timer as tmr
+from tsdeque.core import ThreadSafeDeque
+
+
+class _WorkItem:
+    """A submitted callable together with the future receiving its result."""
+
+    __slots__ = ("future", "fn", "args", "kwargs")
+
+    def __init__(self, future: Future, fn: Callable, args: tuple, kwargs: dict) -> None:
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        """Runs the callable and stores its outcome in the future."""
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except BaseException as exc:
+            self.future.set_exception(exc)
+        else:
+            self.future.set_result(result)
+
+
+class _Worker:
+    """Per-worker state. Submission counters are written by the owner thread only."""
+
+    __slots__ = ("index", "deque", "rng", "thread", "started", "finished")
+
+    def __init__(self, index: int, seed: Optional[int]) -> None:
+        self.index = index
+        self.deque: ThreadSafeDeque[_WorkItem] = ThreadSafeDeque()
+        self.rng = random.Random(None if seed is None else seed + index)
+        self.thread: Optional[Thread] = None
+        self.started = 0
+        self.finished = 0
+
+
+class WorkStealingPool:
+    """
+    A thread pool with one `ThreadSafeDeque` per worker.
+
+    Tasks submitted from inside a worker go to the right end of that worker's
+    own deque and are popped back from the right end, so recently spawned
+    subtasks run LIFO on the thread that created them. Idle workers steal the
+    oldest task from the left end of a randomly chosen victim. Tasks submitted
+    from outside the pool are distributed round-robin.
+
+    `join` waits for all submitted tasks, including the ones they spawn, using
+    the task counters of the per-worker deques.
+    """
+
+    def __init__(self, workers: Optional[int] = None, seed: Optional[int] = None):
+        """
+        Initializes the pool and starts its worker threads.
+
+        Args:
+            workers (Optional[int]): Number of worker threads. Defaults to the number of CPUs.
+            seed (Optional[int]): Seed for victim selection, for reproducible runs.
+
+        Raises:
+            ValueError: If workers is less than 1.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("Number of workers must be at least 1.")
+
+        self._workers: List[_Worker] = [_Worker(i, seed) for i in range(workers)]
+        self._local = local()
+        self._round_robin = itertools.count()
+
+        # Submissions made from outside the pool.
+        self._external_mutex = Lock()
+        self._external_started = 0
+        self._external_finished = 0
+
+        # Workers that found no work anywhere sleep here.
+        self._idle = Condition(Lock())
+        self._idle_workers = 0
+        self._shutdown = False
+
+        for worker in self._workers:
+            worker.thread = Thread(
+                target=self._run_worker,
+                args=(worker,),
+                name=f"WorkStealingPool-{worker.index}",
+                daemon=True,
+            )
+            worker.thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedules `fn(*args, **kwargs)` for execution.
+
+        Args:
+            fn (Callable[..., Any]): The callable to run.
+            *args (Any): Positional arguments for the callable.
+            **kwargs (Any): Keyword arguments for the callable.
+
+        Returns:
+            Future: A future resolved with the callable's result.
+
+        Raises:
+            RuntimeError: If the pool has been shut down.
+        """
+        if self._shutdown:
+            raise RuntimeError("Cannot submit tasks after shutdown.")
+
+        item = _WorkItem(Future(), fn, args, kwargs)
+        worker: Optional[_Worker] = getattr(self._local, "worker", None)
+
+        if worker is not None:
+            worker.started += 1
+            worker.deque.put(item)
+            worker.finished += 1
+        else:
+            with self._external_mutex:
+                self._external_started += 1
+            target = self._workers[next(self._round_robin) % len(self._workers)]
+            target.deque.put(item)
+            with self._external_mutex:
+                self._external_finished += 1
+
+        if self._idle_workers:
+            with self._idle:
+                self._idle.notify()
+        return item.future
+
+    def _steal(self, worker: _Worker) -> Optional[Tuple[_Worker, _WorkItem]]:
+        """
+        Pops the newest local task or steals the oldest task of another worker.
+
+        Args:
+            worker (_Worker): The worker looking for work.
+
+        Returns:
+            Optional[Tuple[_Worker, _WorkItem]]: The worker owning the deque the
+                task came from, and the task; or None if every deque was empty.
+        """
+        try:
+            return worker, worker.deque.get(timeout=0)
+        except TimeoutError:
+            pass
+
+        count = len(self._workers)
+        start = worker.rng.randrange(count)
+        for offset in range(count):
+            victim = self._workers[(start + offset) % count]
+            if victim is worker:
+                continue
+            try:
+                return victim, victim.deque.getleft(timeout=0)
+            except TimeoutError:
+                continue
+        return None
+
+    def _next_task(self, worker: _Worker) -> Optional[Tuple[_Worker, _WorkItem]]:
+        """
+        Returns the next task for a worker, sleeping while there is none.
+
+        Args:
+            worker (_Worker): The worker looking for work.
+
+        Returns:
+            Optional[Tuple[_Worker, _WorkItem]]: The next task, or None once the
+                pool is shut down and no work is left.
+        """
+        task = self._steal(worker)
+        if task is not None:
+            return task
+
+        with self._idle:
+            self._idle_workers += 1
+            try:
+                while True:
+                    # Rescan after registering as idle: a submitter either stored
+                    # its task before this scan or will see `_idle_workers`.
+                    task = self._steal(worker)
+                    if task is not None or self._shutdown:
+                        return task
+                    self._idle.wait()
+            finally:
+                self._idle_workers -= 1
+
+    def _run_worker(self, worker: _Worker) -> None:
+        """
+        Worker thread body.
+
+        Args:
+            worker (_Worker): State of the worker run by this thread.
+        """
+        self._local.worker = worker
+        while True:
+            task = self._next_task(worker)
+            if task is None:
+                return
+            origin, item = task
+            try:
+                item.run()
+            finally:
+                origin.deque.task_done()
+
+    def _submissions(self) -> Tuple[int, int]:
+        """
+        Returns the total number of started and finished submissions.
+
+        Returns:
+            Tuple[int, int]: Started and finished submission counts.
+        """
+        started = self._external_started + sum(w.started for w in self._workers)
+        finished = self._external_finished + sum(w.finished for w in self._workers)
+        return started, finished
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Blocks until every submitted task, including tasks submitted by other
+        tasks, has finished. Returns silently when the timeout elapses.
+
+        A pass over the per-worker task counters is accepted only if no
+        submission was in flight when it started and none started during it,
+        so no counter can have grown after it was observed as zero.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait. If None, waits indefinitely.
+        """
+        timer = tmr.get_timer(timeout)
+        while True:
+            started, finished = self._submissions()
+            quiet = started == finished
+
+            for worker in self._workers:
+                wait_time = timer.get_spend()
+                worker.deque.join(wait_time)
+                if worker.deque.tasks_count() != 0:
+                    if wait_time is not None and timer.get_spend() <= 0:  # type: ignore[operator]
+                        return
+                    quiet = False
+
+            if quiet and self._submissions()[0] == started:
+                return
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops accepting tasks. Workers exit once no queued work is left.
+
+        Args:
+            wait (bool): If True, blocks until every worker thread has exited.
+        """
+        with self._idle:
+            self._shutdown = True
+            self._idle.notify_all()
+
+        if wait:
+            for worker in self._workers:
+                if worker.thread is not None:
+                    worker.thread.join()
+
+    def __enter__(self) -> "WorkStealingPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown(wait=True)